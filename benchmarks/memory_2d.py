@@ -0,0 +1,290 @@
+"""
+Peak memory benchmark for the 2D plottables on large inputs.
+
+Each workload runs in a fresh process, which builds its input data and then creates and saves a figure with
+GraphingLib. The peak resident set size (RSS) of the process is reported, along with the size of the input data and
+the memory used on top of it, so that regressions such as an unwanted float64 copy of float32 data show up as a jump
+in the overhead column.
+
+Usage::
+
+    python benchmarks/memory_2d.py
+    python benchmarks/memory_2d.py --scale 0.5 --json results.json
+    python benchmarks/memory_2d.py --compare results.json
+
+The peak RSS is read from ``/proc`` on Linux, where it is reset once the input data is built, and with the
+``resource`` module on other Unix-like systems.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+from typing import Callable
+
+import numpy as np
+
+# The results of --compare are flagged when the overhead grows by more than this fraction.
+_REGRESSION_THRESHOLD = 0.1
+
+
+def _reset_peak_rss() -> int:
+    """
+    Resets the peak resident set size (RSS) of the current process where the system allows it, and gives the
+    current peak RSS in bytes.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:
+        pass
+    return _peak_rss()
+
+
+def _peak_rss() -> int:
+    """
+    Gives the peak resident set size of the current process, in bytes.
+    """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, and macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _save(element, directory: str) -> None:
+    import graphinglib as gl
+
+    figure = gl.Figure(figure_style="plain")
+    figure.add_elements(element)
+    figure.save(os.path.join(directory, "figure.png"))
+
+
+def _figure_only() -> tuple[Callable[[str], None], int]:
+    """
+    Gives a workload saving a tiny heatmap, which shows the fixed memory cost of creating and saving a figure.
+    """
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        _save(gl.Heatmap(np.zeros((16, 16), dtype=np.float32)), directory)
+
+    return run, 0
+
+
+def _heatmap(size: int, dtype: type) -> tuple[Callable[[str], None], int]:
+    image = np.random.default_rng(0).random((size, size), dtype=dtype)
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        _save(
+            gl.Heatmap(
+                image, x_axis_range=(0, 1), y_axis_range=(0, 1), downsampling="mean"
+            ),
+            directory,
+        )
+
+    return run, image.nbytes
+
+
+def _heatmap_from_function(size: int) -> tuple[Callable[[str], None], int]:
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        heatmap = gl.Heatmap.from_function(
+            lambda x, y: np.sin(10 * x) * np.cos(10 * y),
+            (0, 1),
+            (0, 1),
+            number_of_points=(size, size),
+            dtype=np.float32,
+        )
+        heatmap.downsampling = "mean"
+        _save(heatmap, directory)
+
+    # The image is generated by the workload itself, so its memory is part of the overhead.
+    return run, 0
+
+
+def _heatmap_memmap(size: int) -> tuple[Callable[[str], None], int]:
+    path = os.path.join(tempfile.mkdtemp(), "image.npy")
+    image = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float32, shape=(size, size)
+    )
+    rng = np.random.default_rng(0)
+    for row in range(0, size, 1024):
+        image[row : row + 1024] = rng.random(
+            (len(image[row : row + 1024]), size), dtype=np.float32
+        )
+    image.flush()
+    del image
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        try:
+            _save(
+                gl.Heatmap.from_memmap(path, x_axis_range=(0, 1), y_axis_range=(0, 1)),
+                directory,
+            )
+        finally:
+            shutil.rmtree(os.path.dirname(path))
+
+    # The image is on disk, so no input data is held in memory.
+    return run, 0
+
+
+def _contour(size: int) -> tuple[Callable[[str], None], int]:
+    x = np.linspace(0, 1, size, dtype=np.float32)
+    z = np.sin(10 * x)[None, :] * np.cos(10 * x)[:, None]
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        mesh = np.broadcast_to(x, z.shape)
+        _save(gl.Contour(z, mesh, mesh.T, levels=10), directory)
+
+    return run, z.nbytes
+
+
+def _vector_field(size: int) -> tuple[Callable[[str], None], int]:
+    x = np.linspace(0, 1, size, dtype=np.float32)
+    u = np.cos(10 * x)[:, None] * np.ones(size, dtype=np.float32)
+    v = np.sin(10 * x)[None, :] * np.ones((size, 1), dtype=np.float32)
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        _save(gl.VectorField(x, x, u, v, arrow_density=4), directory)
+
+    return run, u.nbytes + v.nbytes
+
+
+def _stream(size: int) -> tuple[Callable[[str], None], int]:
+    x = np.linspace(0, 1, size, dtype=np.float32)
+    u = np.cos(10 * x)[:, None] * np.ones(size, dtype=np.float32)
+    v = np.sin(10 * x)[None, :] * np.ones((size, 1), dtype=np.float32)
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        _save(gl.Stream(x, x, u, v, density=2), directory)
+
+    return run, u.nbytes + v.nbytes
+
+
+def _gridder(number_of_points: int) -> tuple[Callable[[str], None], int]:
+    rng = np.random.default_rng(0)
+    points = rng.random((number_of_points, 2), dtype=np.float32)
+    values = rng.random(number_of_points, dtype=np.float32)
+
+    def run(directory: str) -> None:
+        import graphinglib as gl
+
+        heatmap = gl.Heatmap.from_points(
+            points,
+            values,
+            x_axis_range=(0, 1),
+            y_axis_range=(0, 1),
+            grid_interpolation="mean",
+            number_of_points=(1000, 1000),
+        )
+        _save(heatmap, directory)
+
+    return run, points.nbytes + values.nbytes
+
+
+def _workloads(
+    scale: float,
+) -> dict[str, Callable[[], tuple[Callable[[str], None], int]]]:
+    """
+    Gives the workloads by name. Each one is a function building the input data in the benchmark's process and
+    returning the function that plots it, along with the size of the input data in bytes.
+    """
+    image_size = int(8192 * scale)
+    grid_size = int(2048 * scale)
+    return {
+        "figure_only": _figure_only,
+        "heatmap_float32": lambda: _heatmap(image_size, np.float32),
+        "heatmap_float64": lambda: _heatmap(image_size, np.float64),
+        "heatmap_from_function_float32": lambda: _heatmap_from_function(image_size),
+        "heatmap_memmap_float32": lambda: _heatmap_memmap(image_size),
+        "contour_float32": lambda: _contour(grid_size),
+        "vector_field_float32": lambda: _vector_field(2 * grid_size),
+        "stream_float32": lambda: _stream(grid_size),
+        "gridder_mean_float32": lambda: _gridder(int(20_000_000 * scale**2)),
+    }
+
+
+def _measure(name: str, scale: float, results: multiprocessing.Queue) -> None:
+    import graphinglib  # noqa: F401 (imported before the baseline so that it isn't counted as overhead)
+    import matplotlib
+
+    matplotlib.use("Agg")
+    run, data_bytes = _workloads(scale)[name]()
+    baseline = _reset_peak_rss()
+    with tempfile.TemporaryDirectory() as directory:
+        run(directory)
+    peak = _peak_rss()
+    results.put({"peak": peak, "data": data_bytes, "overhead": peak - baseline})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Scale factor of the size of the inputs.",
+    )
+    parser.add_argument("--only", nargs="*", help="Names of the workloads to run.")
+    parser.add_argument("--json", help="File in which to write the results.")
+    parser.add_argument(
+        "--compare",
+        help="Results of a previous run, written with --json, to compare with.",
+    )
+    arguments = parser.parse_args()
+
+    previous = {}
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            previous = json.load(file)["results"]
+
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    print(f"{'workload':<32}{'peak RSS':>12}{'data':>12}{'overhead':>12}")
+    for name in arguments.only or _workloads(arguments.scale):
+        queue = context.Queue()
+        process = context.Process(target=_measure, args=(name, arguments.scale, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        results[name] = result
+        line = f"{name:<32}" + "".join(
+            f"{result[key] / 2**20:>10.0f}MB" for key in ("peak", "data", "overhead")
+        )
+        if name in previous:
+            change = result["overhead"] / max(previous[name]["overhead"], 1) - 1
+            flag = "  REGRESSION" if change > _REGRESSION_THRESHOLD else ""
+            line += f"{change:>+10.0%}{flag}"
+        print(line)
+
+    if arguments.json:
+        with open(arguments.json, "w") as file:
+            json.dump({"scale": arguments.scale, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
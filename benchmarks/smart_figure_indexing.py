@@ -0,0 +1,69 @@
+"""
+Indexing time benchmark for SmartFigures with large grids of subplots.
+
+Each cell of a square grid is filled one at a time with ``figure[row, col] = element``, which checks the new subplot
+against the ones already in the grid, and each cell is then read back with ``figure[row, col]``. The time taken to
+fill the whole grid and to read it back is reported, along with the time per cell.
+
+Usage::
+
+    python benchmarks/smart_figure_indexing.py
+    python benchmarks/smart_figure_indexing.py --sides 10 50 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+
+def _measure(side: int, repeat: int) -> tuple[float, float]:
+    import graphinglib as gl
+
+    element = gl.Curve([0, 1], [0, 1])
+    timings = []
+    for _ in range(repeat):
+        figure = gl.SmartFigure(side, side)
+        start = time.perf_counter()
+        for row in range(side):
+            for col in range(side):
+                figure[row, col] = element
+        filled = time.perf_counter()
+        for row in range(side):
+            for col in range(side):
+                figure[row, col]
+        end = time.perf_counter()
+        timings.append((filled - start, end - filled))
+    return min(timings, key=sum)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sides",
+        type=int,
+        nargs="*",
+        default=[10, 25, 50, 100],
+        help="Numbers of rows and columns of the square grids.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times each grid is filled, of which the fastest is kept.",
+    )
+    arguments = parser.parse_args()
+
+    print(f"{'side':>8}{'fill':>12}{'per cell':>12}{'read':>12}{'per cell':>12}")
+    for side in arguments.sides:
+        fill, read = _measure(side, arguments.repeat)
+        cells = side**2
+        print(
+            f"{side:>8}{fill:>11.3f}s{fill / cells * 1e6:>10.1f}us"
+            f"{read:>11.3f}s{read / cells * 1e6:>10.1f}us",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
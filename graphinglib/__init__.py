@@ -22,7 +22,14 @@ as Matplotlib. For further reference on those conventions, see the
 
 from ._version import __version__
 from .data_plotting_1d import Curve, Histogram, Plottable1D, Scatter
-from .data_plotting_2d import Contour, Heatmap, Plottable2D, Stream, VectorField
+from .data_plotting_2d import (
+    Contour,
+    Heatmap,
+    Plottable2D,
+    ScatteredGridder,
+    Stream,
+    VectorField,
+)
 from .figure import Figure
 from .file_manager import (
     get_color,
@@ -32,6 +39,7 @@ from .file_manager import (
     set_default_style,
 )
 from .fits import (
+    ConfidenceBand,
     FitFromExponential,
     FitFromFOTF,
     FitFromFunction,
@@ -69,6 +77,7 @@ from .inherit import INHERIT, Inherit, Styled, is_inherit
 
 # MultiFigure is deprecated but intentionally re-exported for backward compatibility.
 from .multifigure import MultiFigure  # ty: ignore[deprecated]
+from .profiling import Profile, profile
 from .shapes import Arrow, Circle, Ellipse, Line, Polygon, Rectangle
 from .smart_figure import SmartFigure, SmartFigureWCS, SmartTwinAxis
 from .tools import MathematicalObject
@@ -82,6 +91,7 @@ __all__ = [
     "Contour",
     "Heatmap",
     "Plottable2D",
+    "ScatteredGridder",
     "Stream",
     "VectorField",
     "Figure",
@@ -90,6 +100,7 @@ __all__ = [
     "get_default_style",
     "get_styles",
     "set_default_style",
+    "ConfidenceBand",
     "FitFromExponential",
     "FitFromFOTF",
     "FitFromFunction",
@@ -126,6 +137,8 @@ __all__ = [
     "Styled",
     "is_inherit",
     "MultiFigure",
+    "Profile",
+    "profile",
     "Arrow",
     "Circle",
     "Ellipse",
@@ -2,10 +2,20 @@ from __future__ import annotations
 
 from .inherit import INHERIT, Inherit, Styled, is_inherit, resolve_or, strip_inherit
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from types import NoneType
-from typing import Any, Callable, Optional, Protocol, cast, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Optional,
+    Protocol,
+    cast,
+    runtime_checkable,
+)
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -18,6 +28,7 @@ from scipy.interpolate import interp1d
 
 from .exceptions import (
     IncompatibleArgumentsError,
+    InvalidOperationError,
     InvalidParameterError,
     InvalidParameterTypeError,
 )
@@ -31,6 +42,11 @@ except ImportError:
 
 _SNAPPING_INTERPOLATION_METHODS = frozenset({"nearest", "previous", "next"})
 
+# Values are binned in blocks small enough for the temporary arrays to stay in cache, and arrays
+# larger than the parallel threshold are split in one contiguous part per CPU.
+_HISTOGRAM_BLOCK_SIZE = 1 << 16
+_PARALLEL_HISTOGRAM_THRESHOLD = 1 << 22
+
 
 @runtime_checkable
 class Fit(Protocol):
@@ -584,6 +600,10 @@ class Curve(Plottable1D, MathematicalObject):
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_1d.Curve`.
+
+        The copy shares the NumPy arrays of the Curve as read-only views instead of duplicating them. Its data can't be
+        modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves the
+        Curve unchanged.
         """
         return deepcopy(self)
 
@@ -2365,6 +2385,10 @@ class Scatter(Plottable1D, MathematicalObject):
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_1d.Scatter` object.
+
+        The copy shares the NumPy arrays of the Scatter as read-only views instead of duplicating them. Its data can't
+        be modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves
+        the Scatter unchanged.
         """
         return deepcopy(self)
 
@@ -3150,7 +3174,9 @@ class Scatter(Plottable1D, MathematicalObject):
 
             sm = plt.cm.ScalarMappable(cmap=color_map, norm=norm)
             sm.set_array([])
-            plt.colorbar(sm, ax=axes, **self._color_bar_params)
+            fig = axes.get_figure()
+            assert fig is not None
+            fig.colorbar(sm, ax=axes, **self._color_bar_params)
 
         if (
             resolve_or(self._show_color_bar, False)
@@ -3180,7 +3206,117 @@ class Scatter(Plottable1D, MathematicalObject):
 
             sm = plt.cm.ScalarMappable(cmap=color_map, norm=norm)
             sm.set_array([])
-            plt.colorbar(sm, ax=axes, **self._color_bar_params)
+            fig = axes.get_figure()
+            assert fig is not None
+            fig.colorbar(sm, ax=axes, **self._color_bar_params)
+
+
+def _uniform_bin_counts(
+    data: ArrayLike, bin_edges: np.ndarray, clip: bool = True
+) -> np.ndarray:
+    """
+    Counts the values falling in each of a set of equal-width bins.
+
+    Bin indices are computed arithmetically instead of searching the edges, then corrected for
+    rounding so the counts match :func:`numpy.histogram` exactly. Large arrays are counted in
+    parallel, NumPy releasing the GIL in the arithmetic. `clip` can be turned off when all values
+    are known to lie within the edges.
+    """
+    data = np.asarray(data).ravel()
+    number_of_bins = len(bin_edges) - 1
+    first_edge, last_edge = bin_edges[0], bin_edges[-1]
+    norm = number_of_bins / (last_edge - first_edge)
+
+    def count(part: np.ndarray) -> np.ndarray:
+        counts = np.zeros(number_of_bins, dtype=np.intp)
+        for start in range(0, part.size, _HISTOGRAM_BLOCK_SIZE):
+            block = part[start : start + _HISTOGRAM_BLOCK_SIZE]
+            if clip:
+                block = block[(block >= first_edge) & (block <= last_edge)]
+            block = block.astype(bin_edges.dtype, copy=False)
+            indices = ((block - first_edge) * norm).astype(np.intp)
+            indices[indices == number_of_bins] -= 1
+            indices[block < bin_edges[indices]] -= 1
+            increment = (block >= bin_edges[indices + 1]) & (
+                indices != number_of_bins - 1
+            )
+            indices[increment] += 1
+            counts += np.bincount(indices, minlength=number_of_bins)
+        return counts
+
+    workers = os.cpu_count() or 1
+    if workers == 1 or data.size < _PARALLEL_HISTOGRAM_THRESHOLD:
+        return count(data)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(
+            executor.map(count, np.array_split(data, workers)),
+            np.zeros(number_of_bins, dtype=np.intp),
+        )
+
+
+def _histogram_counts(
+    data: np.ndarray, bins: int | ArrayLike | str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the raw bin counts and bin edges of the data, like :func:`numpy.histogram`.
+
+    An integer number of bins always gives equal-width bins, which go through the fast
+    :func:`_uniform_bin_counts` kernel.
+    """
+    if isinstance(bins, (int, np.integer)):
+        bin_edges = np.histogram_bin_edges(data, bins=bins)
+        # The edges span the data, so no value needs to be clipped.
+        return _uniform_bin_counts(data, bin_edges, clip=False), bin_edges
+    return np.histogram(data, bins=bins)
+
+
+@dataclass(slots=True)
+class _HistogramAccumulator:
+    """
+    Running bin counts and moments of a histogram whose data is received in chunks.
+
+    The mean and the sum of squared deviations (``m2``) are merged chunk by chunk with the
+    parallel form of Welford's algorithm, so neither the counts nor the moments ever need the
+    full dataset to be held in memory.
+    """
+
+    bin_edges: np.ndarray
+    counts: np.ndarray
+    uniform: bool = False
+    number_of_values: int = 0
+    mean: float = np.nan
+    m2: float = 0.0
+
+    @classmethod
+    def from_bin_edges(cls, bin_edges: np.ndarray, uniform: bool = False) -> Self:
+        return cls(bin_edges, np.zeros(len(bin_edges) - 1, dtype=np.int64), uniform)
+
+    def add(self, chunk: ArrayLike) -> None:
+        chunk = np.asarray(chunk).ravel()
+        if chunk.size == 0:
+            return
+        if self.uniform:
+            self.counts += _uniform_bin_counts(chunk, self.bin_edges)
+        else:
+            self.counts += np.histogram(chunk, bins=self.bin_edges)[0]
+
+        chunk_size = chunk.size
+        chunk_mean = float(np.mean(chunk, dtype=np.float64))
+        chunk_m2 = float(np.sum((chunk - chunk_mean) ** 2, dtype=np.float64))
+        if self.number_of_values == 0:
+            self.number_of_values, self.mean, self.m2 = chunk_size, chunk_mean, chunk_m2
+            return
+        total = self.number_of_values + chunk_size
+        delta = chunk_mean - self.mean
+        self.mean += delta * chunk_size / total
+        self.m2 += chunk_m2 + delta**2 * self.number_of_values * chunk_size / total
+        self.number_of_values = total
+
+    @property
+    def standard_deviation(self) -> float:
+        if self.number_of_values == 0:
+            return np.nan
+        return float(np.sqrt(self.m2 / self.number_of_values))
 
 
 @dataclass
@@ -3237,7 +3373,7 @@ class Histogram(Plottable1D):
     def __init__(
         self,
         data: ArrayLike,
-        bins: int,
+        bins: int | ArrayLike,
         label: Optional[str] = None,
         face_color: str | Inherit = INHERIT,
         edge_color: str | Inherit = INHERIT,
@@ -3306,9 +3442,8 @@ class Histogram(Plottable1D):
         self._normalize = normalize
         self._orientation = orientation
         self._show_params = show_params
-        self._histogram_cache: Optional[tuple[bool, tuple[np.ndarray, np.ndarray]]] = (
-            None
-        )
+        self._histogram_cache: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._accumulator: Optional[_HistogramAccumulator] = None
         self.data = np.asarray(data)
 
         self._show_pdf = False
@@ -3401,23 +3536,160 @@ class Histogram(Plottable1D):
             show_params,
         )
 
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[ArrayLike],
+        bins: int | ArrayLike,
+        bin_range: Optional[tuple[float, float]] = None,
+        label: Optional[str] = None,
+        face_color: str | Inherit = INHERIT,
+        edge_color: str | Inherit = INHERIT,
+        hist_type: str | Inherit = INHERIT,
+        alpha: float | Inherit = INHERIT,
+        line_width: float | Inherit = INHERIT,
+        normalize: bool | Inherit = INHERIT,
+        orientation: str | Inherit = INHERIT,
+        show_params: bool | Inherit = INHERIT,
+    ) -> Self:
+        """
+        Builds a histogram from data received in chunks, without ever holding the full dataset in memory.
+
+        Only the bin counts and the running mean and variance of the data are kept, so the chunks can be
+        read one at a time from memory-mapped or out-of-core arrays. More data can later be added with
+        :py:meth:`~graphinglib.data_plotting_1d.Histogram.update`.
+
+        Parameters
+        ----------
+        chunks : Iterable[ArrayLike]
+            Iterable of arrays of values to be plotted. Multidimensional chunks are flattened.
+        bins : int | ArrayLike
+            If `bins` is an integer, it defines the number of equal_width bins to be used in the histogram.
+            If `bins` is an array, it defines the bin edges to be used in the histogram, including the left edge of the
+            first bin and the right edge of the last bin.
+        bin_range : tuple[float, float], optional
+            Lower and upper edges of the histogram, given as ``(minimum, maximum)``. Since the data is not known
+            in advance, this is required when `bins` is an integer. Values outside of this range are ignored.
+        label : str, optional
+            Label to be displayed in the legend.
+        face_color : str
+            Face color of the histogram.
+            Default depends on the ``figure_style`` configuration.
+        edge_color : str
+            Edge color of the histogram.
+            Default depends on the ``figure_style`` configuration.
+        hist_type : str
+            Type of the histogram.
+            Values are ``"bar"``, ``"barstacked"``, ``"step"``, and ``"stepfilled"``.
+            Default depends on the ``figure_style`` configuration.
+        alpha : float
+            Opacity of the histogram.
+            Range is ``0`` (transparent) to ``1`` (opaque).
+            Default depends on the ``figure_style`` configuration.
+        line_width : float
+            Width of the histogram edge.
+            Typical range is ``0.5`` to ``3`` points.
+            Default depends on the ``figure_style`` configuration.
+        normalize : bool
+            Whether or not to normalize the histogram.
+            Default depends on the ``figure_style`` configuration.
+        orientation: str
+            Whether to plot the histogram on x-axis or on y-axis.
+            Values are ``"vertical"`` and ``"horizontal"``.
+            Default depends on the ``figure_style`` configuration.
+        show_params : bool
+            Whether or not to show the mean and standard deviation of the data.
+            Default depends on the ``figure_style`` configuration.
+
+        Notes
+        -----
+        The mean and standard deviation are computed over all values received, including those which fall
+        outside of the bins.
+
+        Color parameters accept Matplotlib color formats: named colors (``"blue"``), short color strings
+        (``"b"``), hex strings (``"#0000ff"``), grayscale strings (``"0.5"``), and RGB/RGBA tuples with
+        values between ``0`` and ``1`` (``(0, 0, 1)`` or ``(0, 0, 1, 0.5)``).
+
+        Returns
+        -------
+        A :class:`~graphinglib.data_plotting_1d.Histogram` object created from the chunks of data.
+        """
+        if np.ndim(bins) == 0 and bin_range is None:
+            raise InvalidParameterError(
+                "A bin_range must be given when bins is an integer, since the range of the data "
+                "can't be known before all chunks have been read."
+            )
+        bin_edges = np.histogram_bin_edges(np.empty(0), bins=bins, range=bin_range)
+        histogram = cls(
+            np.empty(0),
+            bin_edges,
+            label,
+            face_color,
+            edge_color,
+            hist_type,
+            alpha,
+            line_width,
+            normalize,
+            orientation,
+            show_params,
+        )
+        histogram._accumulator = _HistogramAccumulator.from_bin_edges(
+            bin_edges, uniform=isinstance(bins, (int, np.integer))
+        )
+        for chunk in chunks:
+            histogram.update(chunk)
+        return histogram
+
+    def update(self, chunk: ArrayLike) -> None:
+        """
+        Adds values to the histogram.
+
+        For a histogram created with :py:meth:`~graphinglib.data_plotting_1d.Histogram.from_chunks`, only the bin
+        counts and the running mean and standard deviation are updated. Otherwise, the values are appended to the
+        histogram's data.
+
+        Parameters
+        ----------
+        chunk : ArrayLike
+            Array of values to be added. Multidimensional arrays are flattened.
+        """
+        if self._accumulator is None:
+            self.data = np.concatenate((self._data, np.asarray(chunk).ravel()))
+            return
+        self._accumulator.add(chunk)
+        self._mean = self._accumulator.mean
+        self._standard_deviation = self._accumulator.standard_deviation
+        self._histogram_cache = None
+
     @property
     def data(self) -> np.ndarray:
+        if self._accumulator is not None:
+            raise InvalidOperationError(
+                "The data of a histogram created from chunks is not kept in memory."
+            )
         return self._data
 
     @data.setter
     def data(self, data: ArrayLike) -> None:
         self._data = np.array(data)
-        self._mean = np.mean(self._data)
-        self._standard_deviation = np.std(self._data)
+        if self._data.size:
+            self._mean = np.mean(self._data)
+            self._standard_deviation = np.std(self._data)
+        else:
+            self._mean = self._standard_deviation = np.nan
+        self._accumulator = None
         self._histogram_cache = None
 
     @property
-    def bins(self) -> int:
+    def bins(self) -> int | ArrayLike:
         return self._bins
 
     @bins.setter
-    def bins(self, bins: int) -> None:
+    def bins(self, bins: int | ArrayLike) -> None:
+        if self._accumulator is not None:
+            raise InvalidOperationError(
+                "The bins of a histogram created from chunks can't be changed, since its data is not kept in memory."
+            )
         self._bins = bins
         self._histogram_cache = None
 
@@ -3476,7 +3748,6 @@ class Histogram(Plottable1D):
     @normalize.setter
     def normalize(self, normalize: bool) -> None:
         self._normalize = normalize
-        self._histogram_cache = None
 
     @property
     def orientation(self) -> Styled[str]:
@@ -3511,17 +3782,22 @@ class Histogram(Plottable1D):
         return False if is_inherit(self._normalize) else bool(self._normalize)
 
     def _compute_histogram(self) -> tuple[np.ndarray, np.ndarray]:
-        # The cache remembers which `density` value it was computed with, and is
-        # recomputed if that value has changed since. This is needed because some
-        # code (e.g. figure style resolution) changes `_normalize` without going
-        # through the `normalize` setter, so the setter alone can't clear the cache.
-        density = self._resolved_normalize
-        if self._histogram_cache is None or self._histogram_cache[0] != density:
-            self._histogram_cache = (
-                density,
-                np.histogram(self._data, bins=self._bins, density=density),
-            )
-        return self._histogram_cache[1]
+        # Only the raw counts are cached, and the density is derived from them on
+        # every call. Some code (e.g. figure style resolution) changes `_normalize`
+        # without going through the `normalize` setter, and this way flipping it
+        # never costs another pass over the data.
+        if self._histogram_cache is None:
+            if self._accumulator is not None:
+                self._histogram_cache = (
+                    self._accumulator.counts.copy(),
+                    self._accumulator.bin_edges.copy(),
+                )
+            else:
+                self._histogram_cache = _histogram_counts(self._data, self._bins)
+        counts, bin_edges = self._histogram_cache
+        if self._resolved_normalize:
+            return counts / counts.sum() / np.diff(bin_edges), bin_edges
+        return counts, bin_edges
 
     @property
     def bin_heights(self) -> np.ndarray:
@@ -3565,6 +3841,10 @@ class Histogram(Plottable1D):
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_1d.Histogram` object.
+
+        The copy shares the NumPy arrays of the Histogram as read-only views instead of duplicating them. Its data can't
+        be modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves
+        the Histogram unchanged.
         """
         return deepcopy(self)
 
@@ -3723,9 +4003,15 @@ class Histogram(Plottable1D):
             "orientation": self._orientation,
         }
         params = strip_inherit(params)
+        # Each bin is drawn from a single value weighted by its count, which lets
+        # matplotlib render the cached counts without another pass over the data.
+        self._compute_histogram()
+        assert self._histogram_cache is not None
+        counts, bin_edges = self._histogram_cache
         axes.hist(
-            self._data,
-            bins=self._bins,
+            bin_edges[:-1],
+            bins=bin_edges.tolist(),
+            weights=counts,
             label=self.label,  # uses the get_label() method
             zorder=z_order - 1,
             **params,
@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Callable, Optional, Protocol, runtime_checkable
+from typing import Any, Callable, Optional, Protocol, TypeVar, cast, runtime_checkable
 
+import contourpy
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import LineCollection, QuadMesh
 from matplotlib.colors import Colormap, Normalize
-from matplotlib.image import imread
-from numpy.typing import ArrayLike
-from scipy.interpolate import griddata
-
-from .exceptions import InvalidParameterError, PlottingError
+from matplotlib.contour import ContourSet
+from matplotlib.image import AxesImage, imread
+from matplotlib.patches import FancyArrowPatch
+from matplotlib.ticker import MaxNLocator
+from numpy.typing import ArrayLike, DTypeLike
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.sparse import csr_matrix
+from scipy.spatial import Delaunay, KDTree
+
+from .exceptions import (
+    IncompatibleArgumentsError,
+    InvalidOperationError,
+    InvalidParameterError,
+    PlottingError,
+    UnsupportedFeatureError,
+)
 from .graph_elements import Plottable
 from .inherit import INHERIT, Inherit, Styled, is_inherit, resolve_or, strip_inherit
 from .tools import _require_optional_dependency
@@ -36,6 +54,8 @@ def _require_pypdfium2(feature: str = "this feature") -> None:
 
 HAS_PYPDFIUM2 = _PYPDFIUM2_AVAILABLE
 
+T = TypeVar("T")
+
 
 @runtime_checkable
 class Plottable2D(Plottable, Protocol):
@@ -46,6 +66,888 @@ class Plottable2D(Plottable, Protocol):
     pass
 
 
+# Levels are halved until both sides fit within this size, which is enough for any
+# realistic panel at print resolution.
+_PYRAMID_MINIMUM_SIZE = 512
+# Approximate memory, in bytes, of each band of rows read while building a pyramid level.
+_PYRAMID_BAND_BYTES = 1 << 26
+
+
+_DOWNSAMPLING_METHODS = {"mean": np.add, "max": np.maximum, "min": np.minimum}
+_DECIMATION_METHODS = ("mean", "stride")
+# Maximum number of grid points passed at once to the functions given to from_function().
+_FUNCTION_TILE_SIZE = 1 << 18
+
+_BINNED_STATISTICS = ("mean", "count", "max")
+_GRID_INTERPOLATION_METHODS = (
+    "nearest",
+    "linear",
+    "cubic",
+    "inverse_distance",
+) + _BINNED_STATISTICS
+# Number of points binned at once by ScatteredGridder, which bounds the size of the temporaries.
+_BINNING_BLOCK_SIZE = 1 << 20
+# Number of chunks of the grid given to each thread computing contours in parallel.
+_CONTOUR_CHUNKS_PER_WORKER = 4
+# Maximum and minimum lengths of stream lines, in axes units, as in Matplotlib's streamplot.
+_STREAMLINE_MAX_LENGTH = 4.0
+_STREAMLINE_MIN_LENGTH = 0.1
+# Number of seeds whose stream lines are integrated together, in the order in which they are tried.
+_STREAMLINE_BATCH_SIZE = 256
+
+
+def _axes_pixel_size(axes: plt.Axes) -> tuple[int, int]:
+    """
+    Gives the width and height, in pixels, of the axes at the figure's DPI, or at the default DPI used to save
+    figures if that is higher.
+    """
+    bbox = axes.get_window_extent()
+    figure = axes.get_figure()
+    save_dpi = plt.rcParams["savefig.dpi"]
+    scale = 1.0
+    if figure is not None and not isinstance(save_dpi, str):
+        scale = max(1.0, float(save_dpi) / figure.dpi)
+    return (
+        max(1, int(np.ceil(bbox.width * scale))),
+        max(1, int(np.ceil(bbox.height * scale))),
+    )
+
+
+def _copied(data: T, copy: bool) -> T:
+    """
+    Gives a copy of an array argument if ``copy`` is set, and the argument itself otherwise.
+    """
+    if not copy or data is None or isinstance(data, str):
+        return data
+    return cast(T, np.array(data, copy=True))
+
+
+def _block_reduce(
+    image: np.ndarray, factors: tuple[int, int], method: str
+) -> np.ndarray:
+    """
+    Reduces each block of ``factors[0]`` rows by ``factors[1]`` columns of an image to its mean, maximum or
+    minimum. The last blocks of each axis are smaller when the image isn't divisible by the factors.
+    """
+    ufunc = _DOWNSAMPLING_METHODS[method]
+    if method == "mean":
+        image = np.asarray(image, dtype=np.result_type(image.dtype, np.float32))
+    reduced = image
+    for axis, factor in enumerate(factors):
+        if factor > 1:
+            starts = np.arange(0, image.shape[axis], factor)
+            reduced = ufunc.reduceat(reduced, starts, axis=axis)
+            if method == "mean":
+                sizes = np.diff(np.append(starts, image.shape[axis])).astype(
+                    image.dtype
+                )
+                shape = [1] * reduced.ndim
+                shape[axis] = len(sizes)
+                reduced = reduced / sizes.reshape(shape)
+    return reduced
+
+
+def _evaluate_tile(
+    func: Callable, x: np.ndarray, y: np.ndarray, number_of_outputs: int
+) -> tuple[np.ndarray, ...]:
+    """
+    Evaluates a function of x and y on the grid formed by two coordinate vectors.
+
+    The function first receives broadcastable views (a row of x and a column of y), so that no coordinate grid is
+    built. Functions which can't broadcast their arguments, and so raise a ValueError or a TypeError or return
+    values whose shape doesn't broadcast to the grid, are evaluated again on materialized grids. If that evaluation
+    fails as well, the error raised by the first one is propagated.
+    """
+    shape = (len(y), len(x))
+
+    def fit_grid(outputs: Any) -> Optional[tuple[np.ndarray, ...]]:
+        outputs = (outputs,) if number_of_outputs == 1 else tuple(outputs)
+        for output in outputs:
+            output_shape = np.shape(output)
+            if len(output_shape) > 2 or any(
+                size not in (1, grid_size)
+                for size, grid_size in zip(output_shape[::-1], shape[::-1])
+            ):
+                return None
+        return tuple(np.broadcast_to(output, shape) for output in outputs)
+
+    try:
+        broadcast_outputs = fit_grid(func(x[None, :], y[:, None]))
+    except (ValueError, TypeError) as error:
+        broadcast_error: Optional[Exception] = error
+    else:
+        if broadcast_outputs is not None:
+            return broadcast_outputs
+        broadcast_error = None
+    try:
+        grid_outputs = fit_grid(func(*np.meshgrid(x, y)))
+    except Exception:
+        if broadcast_error is not None:
+            raise broadcast_error
+        raise
+    if grid_outputs is None:
+        if broadcast_error is not None:
+            raise broadcast_error
+        raise IncompatibleArgumentsError(
+            f"The function must return values of the shape of its arguments {shape}."
+        )
+    return grid_outputs
+
+
+def _evaluate_on_grid(
+    func: Callable,
+    x: np.ndarray,
+    y: np.ndarray,
+    number_of_outputs: int = 1,
+    workers: int = 1,
+    dtype: Optional[DTypeLike] = None,
+) -> tuple[np.ndarray, ...]:
+    """
+    Evaluates a function of x and y on the grid formed by two coordinate vectors, tile by tile.
+
+    Each tile holds at most ``_FUNCTION_TILE_SIZE`` points and its values are written in preallocated output arrays
+    of shape ``(len(y), len(x))``, so the memory used by the function's temporaries stays bounded. The outputs have
+    the given data type, or the one returned by the function for the first tile. With more than one worker, the
+    tiles are evaluated on a process pool if the function can be pickled, and on a thread pool otherwise.
+    """
+    if workers == -1:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise InvalidParameterError(
+            f"workers must be a positive integer or -1, but got {workers}."
+        )
+    tile_columns = min(len(x), _FUNCTION_TILE_SIZE)
+    tile_rows = max(1, _FUNCTION_TILE_SIZE // max(1, tile_columns))
+    tiles = [
+        (slice(row, row + tile_rows), slice(column, column + tile_columns))
+        for row in range(0, len(y), tile_rows)
+        for column in range(0, len(x), tile_columns)
+    ]
+
+    # The first tile is evaluated on its own to find the data type of the outputs if it isn't given.
+    first_rows, first_columns = tiles[0]
+    first_outputs = _evaluate_tile(
+        func, x[first_columns], y[first_rows], number_of_outputs
+    )
+    outputs: tuple[np.ndarray, ...] = tuple(
+        np.empty(
+            (len(y), len(x)),
+            dtype=np.dtype(np.result_type(output) if dtype is None else dtype),
+        )
+        for output in first_outputs
+    )
+    for output, tile_output in zip(outputs, first_outputs):
+        output[first_rows, first_columns] = tile_output
+
+    def store(tile: tuple[slice, slice], tile_outputs: tuple[np.ndarray, ...]) -> None:
+        for output, tile_output in zip(outputs, tile_outputs):
+            output[tile] = tile_output
+
+    remaining_tiles = tiles[1:]
+    if workers == 1 or not remaining_tiles:
+        for rows, columns in remaining_tiles:
+            store(
+                (rows, columns),
+                _evaluate_tile(func, x[columns], y[rows], number_of_outputs),
+            )
+        return outputs
+    try:
+        pickle.dumps(func)
+        executor_type = ProcessPoolExecutor
+    except (pickle.PicklingError, AttributeError, TypeError):
+        executor_type = ThreadPoolExecutor
+    with executor_type(max_workers=workers) as executor:
+        # Tiles are submitted in batches so that only a few evaluated tiles wait to be stored at once.
+        for start in range(0, len(remaining_tiles), 2 * workers):
+            batch = remaining_tiles[start : start + 2 * workers]
+            results = executor.map(
+                _evaluate_tile,
+                [func] * len(batch),
+                [x[columns] for _, columns in batch],
+                [y[rows] for rows, _ in batch],
+                [number_of_outputs] * len(batch),
+            )
+            for tile, tile_outputs in zip(batch, results):
+                store(tile, tile_outputs)
+    return outputs
+
+
+def _halve_image(image: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """
+    Averages the blocks of 2x2 pixels of an image, repeating the last row or column of odd-sized
+    images so they can be halved too.
+    """
+    image = np.asarray(image, dtype=dtype)
+    number_of_rows, number_of_columns = image.shape[:2]
+    if number_of_rows % 2 or number_of_columns % 2:
+        padding = [(0, number_of_rows % 2), (0, number_of_columns % 2)]
+        image = np.pad(image, padding + [(0, 0)] * (image.ndim - 2), mode="edge")
+    return image.reshape(
+        image.shape[0] // 2, 2, image.shape[1] // 2, 2, *image.shape[2:]
+    ).mean(axis=(1, 3))
+
+
+def _spiral_cells(number_of_columns: int, number_of_rows: int) -> np.ndarray:
+    """
+    Gives the (x, y) indices of every cell of a grid, following a spiral which starts at the
+    bottom left corner and goes inwards. This is the order in which Matplotlib seeds stream lines.
+    """
+    cells = np.empty((number_of_columns * number_of_rows, 2), dtype=int)
+    x_first, y_first, x_last, y_last = 0, 1, number_of_columns - 1, number_of_rows - 1
+    x, y = 0, 0
+    direction = "right"
+    for i in range(len(cells)):
+        cells[i] = x, y
+        if direction == "right":
+            x += 1
+            if x >= x_last:
+                x_last -= 1
+                direction = "up"
+        elif direction == "up":
+            y += 1
+            if y >= y_last:
+                y_last -= 1
+                direction = "left"
+        elif direction == "left":
+            x -= 1
+            if x <= x_first:
+                x_first += 1
+                direction = "down"
+        else:
+            y -= 1
+            if y <= y_first:
+                y_first += 1
+                direction = "right"
+    return cells
+
+
+def _interpolate_bilinear(field: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Interpolates the last two axes of an array at points given as (x, y) fractional indices, which must be
+    within the array.
+    """
+    x, y = points[:, 0], points[:, 1]
+    x0 = np.minimum(x.astype(int), field.shape[-1] - 2)
+    y0 = np.minimum(y.astype(int), field.shape[-2] - 2)
+    x_weight, y_weight = x - x0, y - y0
+    bottom = field[..., y0, x0] * (1 - x_weight) + field[..., y0, x0 + 1] * x_weight
+    top = (
+        field[..., y0 + 1, x0] * (1 - x_weight) + field[..., y0 + 1, x0 + 1] * x_weight
+    )
+    return bottom * (1 - y_weight) + top * y_weight
+
+
+def _trace_streamlines(
+    vectors: np.ndarray,
+    seeds: np.ndarray,
+    step: float,
+    number_of_steps: int,
+    occupied: np.ndarray,
+    grid_to_mask: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Integrates the stream lines starting at all the seeds at once with Heun's method, taking steps of a
+    constant length along the lines. Coordinates are fractional indices of the grid, and a line stops when
+    it leaves the grid, reaches a point where the speed is zero or undefined, or enters an occupied cell.
+
+    Unlike the adaptive RK12 integrator of Matplotlib's streamplot, no error is estimated: every step has the
+    largest length streamplot allows, which streamplot shortens where its error estimate exceeds its tolerance.
+    The lines can therefore drift slightly from those of streamplot where the field curves sharply within a
+    step.
+
+    Parameters
+    ----------
+    vectors : np.ndarray
+        Array of shape (3, rows, columns) with the components of the vectors in grid cells per unit of time,
+        followed by their norm in units of the step length per unit of time.
+    seeds : np.ndarray
+        Starting points of the lines, as an array of shape (number of seeds, 2).
+    step : float
+        Length of each step.
+    number_of_steps : int
+        Maximum number of steps taken along each line.
+    occupied : np.ndarray
+        Occupancy mask of the stream lines, whose cells are larger than those of the grid.
+    grid_to_mask : np.ndarray
+        Scale from the grid's indices to the mask's indices along x and y.
+
+    Returns
+    -------
+    The points of the lines as an array of shape (number of seeds, number_of_steps + 1, 2), and the number
+    of points of each line. The points past the end of a line are undefined.
+    """
+    upper = np.array([vectors.shape[2] - 1, vectors.shape[1] - 1])
+
+    def direction(points: np.ndarray) -> np.ndarray:
+        inside = np.all((points >= 0) & (points <= upper), axis=1)
+        u, v, speed = _interpolate_bilinear(
+            vectors, np.clip(np.nan_to_num(points), 0, upper)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            time_per_length = np.where(inside, 1 / speed, np.nan)
+        return np.stack([u * time_per_length, v * time_per_length], axis=1)
+
+    points = np.empty((len(seeds), number_of_steps + 1, 2))
+    points[:, 0] = seeds
+    counts = np.ones(len(seeds), dtype=int)
+    active = np.arange(len(seeds))
+    current = np.asarray(seeds, dtype=float)
+    for i in range(1, number_of_steps + 1):
+        first_slope = direction(current)
+        second_slope = direction(current + step * first_slope)
+        current = current + 0.5 * step * (first_slope + second_slope)
+        # Comparisons with NaN are false, so stopped lines are also dropped here.
+        moving = np.all((current >= 0) & (current <= upper), axis=1)
+        cells = np.floor(current[moving] * grid_to_mask + 0.5).astype(int)
+        moving[moving] = ~occupied[cells[:, 1], cells[:, 0]]
+        active, current = active[moving], current[moving]
+        if not active.size:
+            break
+        points[active, i] = current
+        counts[active] += 1
+    return points, counts
+
+
+def _claim_stream_cells(
+    mask: np.ndarray, points: np.ndarray, grid_to_mask: np.ndarray
+) -> np.ndarray:
+    """
+    Marks the cells of the occupancy mask crossed by a stream line, which stops before entering a cell that
+    is already occupied or that it has left before. Gives the flat indices of the marked cells, one for each
+    point of the line that was kept.
+    """
+    x, y = np.floor(points * grid_to_mask + 0.5).astype(int).T
+    cells = y * mask.shape[1] + x
+    _, first_visit, inverse = np.unique(cells, return_index=True, return_inverse=True)
+    entered = np.r_[False, cells[1:] != cells[:-1]]
+    blocked = entered & (
+        mask.flat[cells] | (first_visit[inverse] < np.arange(cells.size))
+    )
+    cells = cells[: np.argmax(blocked)] if blocked.any() else cells
+    mask.flat[cells] = True
+    return cells
+
+
+@dataclass(slots=True)
+class _HeatmapPyramid:
+    """
+    Multi-resolution mipmap of an image too large to be held in memory.
+
+    Level ``k`` averages blocks of ``2**k`` by ``2**k`` pixels of the full-resolution image (level
+    ``0``), and every level is a memory-mapped ``.npy`` file, so that only the level of detail and the
+    region needed by a view are ever read. The levels are stored in a directory next to the source
+    file and reused as long as the source file is unchanged.
+    """
+
+    levels: list[np.ndarray]
+    value_range: tuple[float, float]
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        # The levels are read-only views of files, so copies can share them.
+        return self
+
+    @classmethod
+    def open(cls, image: np.ndarray, source_path: str, directory: str) -> Self:
+        source_stat = os.stat(source_path)
+        metadata = {
+            "source_size": source_stat.st_size,
+            "source_modification_time": source_stat.st_mtime_ns,
+            "shape": list(image.shape),
+            "dtype": str(image.dtype),
+        }
+        metadata_path = os.path.join(directory, "pyramid.json")
+        try:
+            with open(metadata_path) as file:
+                stored_metadata = json.load(file)
+        except (OSError, ValueError):
+            stored_metadata = None
+        if stored_metadata is not None and all(
+            stored_metadata.get(key) == value for key, value in metadata.items()
+        ):
+            levels = [image] + [
+                np.load(os.path.join(directory, f"level_{level}.npy"), mmap_mode="r")
+                for level in range(1, stored_metadata["number_of_levels"])
+            ]
+            return cls(levels, tuple(stored_metadata["value_range"]))
+
+        os.makedirs(directory, exist_ok=True)
+        levels = [image]
+        minimum, maximum = np.inf, -np.inf
+        level_dtype = np.result_type(image.dtype, np.float32)
+        while max(levels[-1].shape[:2]) > _PYRAMID_MINIMUM_SIZE:
+            previous = levels[-1]
+            level_path = os.path.join(directory, f"level_{len(levels)}.npy")
+            level = np.lib.format.open_memmap(
+                level_path,
+                mode="w+",
+                dtype=level_dtype,
+                shape=(
+                    (previous.shape[0] + 1) // 2,
+                    (previous.shape[1] + 1) // 2,
+                    *previous.shape[2:],
+                ),
+            )
+            row_bytes = max(1, previous[0].nbytes)
+            band_height = max(2, _PYRAMID_BAND_BYTES // row_bytes // 2 * 2)
+            for start in range(0, previous.shape[0], band_height):
+                band = previous[start : start + band_height]
+                if len(levels) == 1 and np.issubdtype(band.dtype, np.number):
+                    finite_band = band[np.isfinite(band)]
+                    if finite_band.size:
+                        minimum = min(minimum, float(finite_band.min()))
+                        maximum = max(maximum, float(finite_band.max()))
+                level[start // 2 : (start + len(band) + 1) // 2] = _halve_image(
+                    band, level_dtype
+                )
+            level.flush()
+            levels.append(np.load(level_path, mmap_mode="r"))
+        if len(levels) == 1:
+            finite_image = np.asarray(image)[np.isfinite(image)]
+            if finite_image.size:
+                minimum, maximum = float(finite_image.min()), float(finite_image.max())
+        if not np.isfinite(minimum):
+            minimum, maximum = 0.0, 1.0
+
+        metadata["number_of_levels"] = len(levels)
+        metadata["value_range"] = [minimum, maximum]
+        with open(metadata_path, "w") as file:
+            json.dump(metadata, file)
+        return cls(levels, (minimum, maximum))
+
+    def select(
+        self,
+        extent: tuple[float, float, float, float],
+        origin: str,
+        x_view: tuple[float, float],
+        y_view: tuple[float, float],
+        pixel_size: tuple[int, int],
+    ) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+        """
+        Gives the coarsest level's pixels which still cover each display pixel of the view, cropped to
+        the view, along with the extent of the cropped region.
+        """
+        number_of_rows, number_of_columns = self.levels[0].shape[:2]
+        left, right, bottom, top = extent
+        column_fractions = (np.asarray(x_view) - left) / (right - left)
+        if origin == "lower":
+            row_fractions = (np.asarray(y_view) - bottom) / (top - bottom)
+        else:
+            row_fractions = (top - np.asarray(y_view)) / (top - bottom)
+        column_fractions = np.clip(np.sort(column_fractions), 0, 1)
+        row_fractions = np.clip(np.sort(row_fractions), 0, 1)
+        first_column = int(np.floor(column_fractions[0] * number_of_columns))
+        last_column = int(np.ceil(column_fractions[1] * number_of_columns))
+        first_row = int(np.floor(row_fractions[0] * number_of_rows))
+        last_row = int(np.ceil(row_fractions[1] * number_of_rows))
+        last_column = max(last_column, first_column + 1)
+        last_row = max(last_row, first_row + 1)
+
+        # Each level halves the resolution, so the deepest level still giving at least one
+        # pixel per display pixel along both axes is found from the base-2 logarithm.
+        visible_columns, visible_rows = last_column - first_column, last_row - first_row
+        depth = min(
+            np.log2(visible_columns / pixel_size[0]),
+            np.log2(visible_rows / pixel_size[1]),
+        )
+        level_index = int(np.clip(np.floor(depth), 0, len(self.levels) - 1))
+        factor = 2**level_index
+        first_column, first_row = first_column // factor, first_row // factor
+        last_column, last_row = -(-last_column // factor), -(-last_row // factor)
+        cropped = np.asarray(
+            self.levels[level_index][first_row:last_row, first_column:last_column]
+        )
+
+        def to_fraction(index: int, size: int) -> float:
+            return min(index * factor, size) / size
+
+        x_start = left + (right - left) * to_fraction(first_column, number_of_columns)
+        x_end = left + (right - left) * to_fraction(last_column, number_of_columns)
+        row_start = to_fraction(first_row, number_of_rows)
+        row_end = to_fraction(last_row, number_of_rows)
+        if origin == "lower":
+            y_start = bottom + (top - bottom) * row_start
+            y_end = bottom + (top - bottom) * row_end
+            return cropped, (x_start, x_end, y_start, y_end)
+        y_start = top - (top - bottom) * row_start
+        y_end = top - (top - bottom) * row_end
+        return cropped, (x_start, x_end, y_end, y_start)
+
+
+class _DownsampledImageUpdater(Artist):
+    """
+    Invisible artist, drawn just before the image of a Heatmap, which block-reduces the values displayed by the
+    image to the resolution of its axes.
+
+    The axes only get their final size from the figure's layout, which is computed when the figure is drawn, so the
+    values are reduced then rather than when the Heatmap is plotted. They are only reduced again when the size of the
+    axes or the source values change.
+    """
+
+    def __init__(self, heatmap: Heatmap, image: AxesImage) -> None:
+        super().__init__()
+        self.heatmap = heatmap
+        self.image = image
+        self.source = heatmap.image
+        self._displayed: Optional[tuple[np.ndarray, tuple[int, int]]] = None
+        self.set_in_layout(False)
+        # The image has the same z-order but is added to the axes first, so it would be drawn first.
+        self.set_zorder(image.get_zorder() - 0.5)
+
+    def update_image(self) -> None:
+        """
+        Displays the source values reduced to the current resolution of the axes.
+        """
+        axes = self.axes
+        assert isinstance(axes, plt.Axes)
+        factors = self.heatmap._downsampling_factors(_axes_pixel_size(axes))
+        if (
+            self._displayed is None
+            or self._displayed[0] is not self.source
+            or self._displayed[1] != factors
+        ):
+            self._display(factors)
+
+    def show_source(self, source: np.ndarray) -> None:
+        """
+        Replaces the source values, displaying them at the resolution of the values they replace, or when the
+        figure is first drawn.
+        """
+        self.source = source
+        if self._displayed is not None:
+            self._display(self._displayed[1])
+
+    def _display(self, factors: tuple[int, int]) -> None:
+        if self.source is self.heatmap.image:
+            data = self.heatmap._downsampled_image(factors)
+        elif factors != (1, 1):
+            data = self.heatmap._reduce(self.source, factors)
+        else:
+            data = self.source
+        self.image.set_data(data)
+        self._displayed = (self.source, factors)
+
+    def draw(self, renderer: Any) -> None:
+        self.update_image()
+        self.stale = False
+
+
+class ScatteredGridder:
+    """
+    Interpolates values known at fixed, unevenly distributed points on a regular grid.
+
+    Everything that only depends on the positions of the points and of the grid is computed once, when the
+    gridder is created: the nearest points of each grid point, the Delaunay triangulation of the points and the
+    barycentric weights of each grid point in its triangle, or the grid cell of each point. Gridding a new set of
+    values at the same points, for example each frame of a time series, is then a single indexing operation,
+    sparse matrix-vector product or :func:`numpy.bincount` call instead of a full
+    :func:`scipy.interpolate.griddata` call.
+
+    Parameters
+    ----------
+    points : ArrayLike
+        The list or array of points at which values are known, of shape ``(number of points, 2)``.
+    x_axis_range, y_axis_range : tuple[float, float]
+        The range of x and y values of the grid as tuples containing the start and end of the range.
+    number_of_points : tuple[int, int]
+        Number of points of the grid in the x and y coordinates.
+        Defaults to ``(50, 50)``.
+    grid_interpolation : str
+        Interpolation method used between the points.
+        Values are ``"nearest"``, ``"linear"``, ``"cubic"``, ``"inverse_distance"``, ``"mean"``, ``"count"`` and
+        ``"max"``. The ``"cubic"`` method only reuses the triangulation, since its weights depend on the values.
+        The ``"inverse_distance"`` method averages the values of the ``number_of_neighbors`` nearest points,
+        weighted by the inverse of their distance to the power ``power``. The ``"mean"``, ``"count"`` and
+        ``"max"`` methods do not interpolate but bin the points in the grid cells centered on the grid points,
+        which is the fastest way to display very large numbers of points.
+        Defaults to ``"nearest"``.
+    fill_value : float
+        Value given to the grid points outside of the convex hull of the points, farther than ``max_distance``
+        from any point, or whose cell contains no point.
+        Defaults to ``np.nan``.
+    max_distance : float, optional
+        For the ``"nearest"`` and ``"inverse_distance"`` methods, largest distance at which a point contributes
+        to a grid point. Grid points without any point within this distance are given ``fill_value``.
+        Defaults to ``None`` (no limit).
+    number_of_neighbors : int
+        Number of nearest points averaged by the ``"inverse_distance"`` method.
+        Defaults to ``8``.
+    power : float
+        Power of the distance used by the ``"inverse_distance"`` method.
+        Defaults to ``2``.
+    workers : int
+        Number of threads used to search for the nearest points. Use ``-1`` to use all available CPUs.
+        Defaults to ``1``.
+    """
+
+    def __init__(
+        self,
+        points: ArrayLike,
+        x_axis_range: tuple[float, float],
+        y_axis_range: tuple[float, float],
+        number_of_points: tuple[int, int] = (50, 50),
+        grid_interpolation: str = "nearest",
+        fill_value: float = np.nan,
+        max_distance: Optional[float] = None,
+        number_of_neighbors: int = 8,
+        power: float = 2,
+        workers: int = 1,
+    ) -> None:
+        if grid_interpolation not in _GRID_INTERPOLATION_METHODS:
+            raise InvalidParameterError(
+                "grid_interpolation must be one of "
+                f"{', '.join(repr(method) for method in _GRID_INTERPOLATION_METHODS)}, "
+                f"but got {grid_interpolation!r}."
+            )
+        if workers == 0 or workers < -1:
+            raise InvalidParameterError(
+                f"workers must be a positive integer or -1, but got {workers}."
+            )
+        if number_of_neighbors < 1:
+            raise InvalidParameterError(
+                "number_of_neighbors must be a positive integer, but got "
+                f"{number_of_neighbors}."
+            )
+        if max_distance is not None and max_distance <= 0:
+            raise InvalidParameterError(
+                f"max_distance must be positive, but got {max_distance}."
+            )
+        points = np.asarray(points)
+        # Floating-point coordinates are kept as given, so that float32 points aren't copied to float64.
+        self._points = (
+            points if np.issubdtype(points.dtype, np.floating) else points.astype(float)
+        )
+        if self._points.ndim != 2 or self._points.shape[1] != 2:
+            raise InvalidParameterError(
+                "points must be an array of shape (number of points, 2), but got an "
+                f"array of shape {self._points.shape}."
+            )
+        self._x_axis_range = x_axis_range
+        self._y_axis_range = y_axis_range
+        self._number_of_points = number_of_points
+        self._grid_interpolation = grid_interpolation
+        self._fill_value = fill_value
+        self._max_distance = max_distance
+        self._number_of_neighbors = number_of_neighbors
+        self._power = power
+        self._workers = workers
+
+        if grid_interpolation in _BINNED_STATISTICS:
+            self._cell_indices = self._bin_points()
+            self._cell_counts = np.bincount(
+                self._cell_indices, minlength=self._grid_size + 1
+            )[:-1]
+            self._outside = self._cell_counts == 0
+            return
+        x = np.linspace(x_axis_range[0], x_axis_range[1], number_of_points[0])
+        y = np.linspace(y_axis_range[0], y_axis_range[1], number_of_points[1])
+        grid_points = np.column_stack([np.tile(x, len(y)), np.repeat(y, len(x))])
+        try:
+            if grid_interpolation == "nearest":
+                distances, self._nearest_indices = self._query(grid_points, 1)
+                self._outside = np.isinf(distances)
+                self._nearest_indices[self._outside] = 0
+            elif grid_interpolation == "inverse_distance":
+                self._weights, self._outside = self._inverse_distance_weights(
+                    grid_points
+                )
+            else:
+                self._triangulation = Delaunay(self._points)
+                if grid_interpolation == "linear":
+                    self._weights, self._outside = self._barycentric_weights(
+                        grid_points
+                    )
+                else:
+                    self._grid_points = grid_points
+        except Exception as exc:
+            raise PlottingError(
+                f"Could not interpolate the data onto a grid ({exc}). Check that enough "
+                "points were provided."
+            ) from exc
+
+    @property
+    def _grid_size(self) -> int:
+        return self._number_of_points[0] * self._number_of_points[1]
+
+    def _query(
+        self, grid_points: np.ndarray, number_of_neighbors: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gives the distances to and indices of the nearest points of each grid point. Missing neighbors, farther
+        than ``max_distance``, have an infinite distance.
+        """
+        return KDTree(self._points).query(
+            grid_points,
+            k=number_of_neighbors,
+            distance_upper_bound=(
+                np.inf if self._max_distance is None else self._max_distance
+            ),
+            workers=self._workers,
+        )
+
+    def _inverse_distance_weights(
+        self, grid_points: np.ndarray
+    ) -> tuple[csr_matrix, np.ndarray]:
+        """
+        Gives the sparse matrix of the normalized inverse distance weights of the nearest points of each grid
+        point, and the mask of the grid points without any point within ``max_distance``.
+        """
+        number_of_neighbors = min(self._number_of_neighbors, len(self._points))
+        distances, indices = self._query(grid_points, number_of_neighbors)
+        distances = distances.reshape(len(grid_points), number_of_neighbors)
+        indices = indices.reshape(len(grid_points), number_of_neighbors)
+        with np.errstate(divide="ignore"):
+            weights = distances ** (-float(self._power))
+        # A grid point on top of a point takes its value, and missing neighbors have a zero weight
+        exact = distances[:, 0] == 0
+        weights[exact] = 0
+        weights[exact, 0] = 1
+        weights[np.isinf(distances)] = 0
+        outside = np.isinf(distances[:, 0])
+        weights[~outside] /= weights[~outside].sum(axis=1, keepdims=True)
+        found = weights > 0
+        matrix = csr_matrix(
+            (weights[found], (np.nonzero(found)[0], indices[found])),
+            shape=(len(grid_points), len(self._points)),
+        )
+        return matrix, outside
+
+    def _bin_points(self) -> np.ndarray:
+        """
+        Gives the flat index of the grid cell containing each point. Points outside of the grid are given the
+        index one past the last cell so that they can be dropped from the results of :func:`numpy.bincount`.
+        """
+        # 32-bit indices halve the memory of the binning for all but huge grids.
+        index_dtype = np.int32 if self._grid_size < np.iinfo(np.int32).max else np.intp
+        cell_indices = np.empty(len(self._points), dtype=index_dtype)
+        number_of_x, number_of_y = self._number_of_points
+        x_start, x_end = self._x_axis_range
+        y_start, y_end = self._y_axis_range
+        x_step = (x_end - x_start) / max(number_of_x - 1, 1)
+        y_step = (y_end - y_start) / max(number_of_y - 1, 1)
+        for start in range(0, len(self._points), _BINNING_BLOCK_SIZE):
+            block = self._points[start : start + _BINNING_BLOCK_SIZE]
+            x_indices = np.rint((block[:, 0] - x_start) / x_step)
+            y_indices = np.rint((block[:, 1] - y_start) / y_step)
+            inside = (
+                (x_indices >= 0)
+                & (x_indices < number_of_x)
+                & (y_indices >= 0)
+                & (y_indices < number_of_y)
+            )
+            flat_indices = y_indices * number_of_x + x_indices
+            flat_indices[~inside] = self._grid_size
+            cell_indices[start : start + len(block)] = flat_indices
+        return cell_indices
+
+    def _barycentric_weights(
+        self, grid_points: np.ndarray
+    ) -> tuple[csr_matrix, np.ndarray]:
+        """
+        Gives the sparse matrix of the weights of the corners of the triangle containing each grid point, and
+        the mask of the grid points outside of the triangulation.
+        """
+        simplices = self._triangulation.find_simplex(grid_points)
+        outside = simplices == -1
+        inside = np.flatnonzero(~outside)
+        transforms = self._triangulation.transform[simplices[inside]]
+        partial_weights = np.einsum(
+            "ijk,ik->ij", transforms[:, :2], grid_points[inside] - transforms[:, 2]
+        )
+        weights = np.column_stack([partial_weights, 1 - partial_weights.sum(axis=1)])
+        matrix = csr_matrix(
+            (
+                weights.ravel(),
+                (
+                    np.repeat(inside, 3),
+                    self._triangulation.simplices[simplices[inside]].ravel(),
+                ),
+            ),
+            shape=(len(grid_points), len(self._points)),
+        )
+        return matrix, outside
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points
+
+    @property
+    def x_axis_range(self) -> tuple[float, float]:
+        return self._x_axis_range
+
+    @property
+    def y_axis_range(self) -> tuple[float, float]:
+        return self._y_axis_range
+
+    @property
+    def number_of_points(self) -> tuple[int, int]:
+        return self._number_of_points
+
+    @property
+    def grid_interpolation(self) -> str:
+        return self._grid_interpolation
+
+    @property
+    def fill_value(self) -> float:
+        return self._fill_value
+
+    @property
+    def max_distance(self) -> Optional[float]:
+        return self._max_distance
+
+    def grid(self, values: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        Interpolates values known at the gridder's points on its grid.
+
+        Parameters
+        ----------
+        values : ArrayLike, optional
+            The list or array of values at the gridder's points. Not needed for the ``"count"`` method.
+
+        Returns
+        -------
+        The array of interpolated values, of shape ``(number_of_points[1], number_of_points[0])``.
+        """
+        shape = (self._number_of_points[1], self._number_of_points[0])
+        if self._grid_interpolation == "count":
+            return self._cell_counts.reshape(shape)
+        if values is None:
+            raise InvalidParameterError(
+                f"values must be given for the {self._grid_interpolation!r} method."
+            )
+        values = np.asarray(values)
+        if values.shape != (len(self._points),):
+            raise IncompatibleArgumentsError(
+                f"values must have one value per point ({len(self._points)}), but got an "
+                f"array of shape {values.shape}."
+            )
+        # Interpolated values keep the precision of the given values, so float32 data gives a float32 grid.
+        dtype = np.result_type(values.dtype, np.float32)
+        if self._grid_interpolation == "cubic":
+            interpolator = CloughTocher2DInterpolator(
+                self._triangulation, values, fill_value=self._fill_value
+            )
+            return (
+                interpolator(self._grid_points).astype(dtype, copy=False).reshape(shape)
+            )
+        if self._grid_interpolation == "nearest":
+            grid = values[self._nearest_indices]
+        elif self._grid_interpolation in ("linear", "inverse_distance"):
+            grid = (self._weights @ values).astype(dtype, copy=False)
+        elif self._grid_interpolation == "mean":
+            grid = np.bincount(
+                self._cell_indices, weights=values, minlength=self._grid_size + 1
+            )[:-1].astype(dtype, copy=False)
+            grid[~self._outside] /= self._cell_counts[~self._outside]
+        else:
+            grid = np.full(self._grid_size + 1, -np.inf, dtype=dtype)
+            np.maximum.at(grid, self._cell_indices, values)
+            grid = grid[:-1]
+        if self._outside.any():
+            grid = grid.astype(np.result_type(grid, self._fill_value))
+            grid[self._outside] = self._fill_value
+        return grid.reshape(shape)
+
+
 @dataclass
 class Heatmap(Plottable2D):
     """
@@ -101,6 +1003,18 @@ class Heatmap(Plottable2D):
             `Interpolations for imshow <https://matplotlib.org/stable/gallery/images_contours_and_fields/interpolation_methods.html>`_.
     norm : str or Normalize, optional
         Normalization of the colormap. Default is ``None``.
+    downsampling : str, optional
+        How blocks of pixels are combined when the image has at least twice as many pixels as the axes can display
+        along one of its dimensions. The image is then reduced to the resolution of the axes, once the figure's layout
+        sets their size, before being drawn, which saves time and memory for large images. If ``None``, the full image
+        is always plotted. This value is ignored when ``x_mesh`` and ``y_mesh`` are provided.
+        Values are ``"mean"``, ``"max"``, ``"min"``, and ``None``.
+        Defaults to ``None``.
+    copy : bool
+        Whether to store copies of the image and meshes. By default, arrays are kept as given, without being copied or
+        converted to another data type, so that large arrays and memory-mapped arrays are shared with the
+        :class:`~graphinglib.data_plotting_2d.Heatmap` rather than duplicated.
+        Defaults to ``False``.
     """
 
     def __init__(
@@ -118,6 +1032,8 @@ class Heatmap(Plottable2D):
         origin_position: str | Inherit = INHERIT,
         interpolation: str = "none",
         norm: Optional[str | Normalize] = None,
+        downsampling: Optional[str] = None,
+        copy: bool = False,
     ) -> None:
         """
         The class implements heatmaps.
@@ -172,13 +1088,26 @@ class Heatmap(Plottable2D):
                 `Interpolations for imshow <https://matplotlib.org/stable/gallery/images_contours_and_fields/interpolation_methods.html>`_.
         norm : str or Normalize, optional
             Normalization of the colormap. Default is ``None``.
+        downsampling : str, optional
+            How blocks of pixels are combined when the image has at least twice as many pixels as the axes can
+            display along one of its dimensions. The image is then reduced to the resolution of the axes, once the
+            figure's layout sets their size, before being drawn, which saves time and memory for large images. If
+            ``None``, the full image is always plotted. This value is ignored when ``x_mesh`` and ``y_mesh`` are
+            provided.
+            Values are ``"mean"``, ``"max"``, ``"min"``, and ``None``.
+            Defaults to ``None``.
+        copy : bool
+            Whether to store copies of the image and meshes. By default, arrays are kept as given, without being copied
+            or converted to another data type, so that large arrays and memory-mapped arrays are shared with the
+            :class:`~graphinglib.data_plotting_2d.Heatmap` rather than duplicated.
+            Defaults to ``False``.
         """
         self.show_color_bar = show_color_bar
-        self.image = image
+        self.image = _copied(image, copy)
         self.x_axis_range = x_axis_range
         self.y_axis_range = y_axis_range
-        self.x_mesh = x_mesh
-        self.y_mesh = y_mesh
+        self.x_mesh = _copied(x_mesh, copy)
+        self.y_mesh = _copied(y_mesh, copy)
         self.color_map = color_map
         self.color_map_range = color_map_range
         self.alpha = alpha
@@ -186,8 +1115,10 @@ class Heatmap(Plottable2D):
         self.origin_position = origin_position
         self.interpolation = interpolation
         self._norm = norm
+        self.downsampling = downsampling
 
         self._color_bar_params: dict = {}
+        self.handle = None
 
     @classmethod
     def from_function(
@@ -204,10 +1135,16 @@ class Heatmap(Plottable2D):
         interpolation: str = "none",
         number_of_points: tuple[int, int] = (50, 50),
         norm: Optional[str | Normalize] = None,
+        workers: int = 1,
+        dtype: DTypeLike = np.float64,
     ) -> Self:
         """
         Creates a heatmap from a function.
 
+        The function is evaluated tile by tile on the grid, and receives a row of x values and a column of y values
+        which NumPy broadcasts together, so that no full coordinate grid has to be held in memory. Functions which
+        don't support broadcasting are given both coordinates as 2D arrays for each tile instead.
+
         Parameters
         ----------
         func : Callable[[ArrayLike, ArrayLike], ArrayLike]
@@ -252,15 +1189,26 @@ class Heatmap(Plottable2D):
             Defaults to ``(50, 50)``.
         norm : str or Normalize, optional
             Normalization of the colormap. Default is ``None``.
+        workers : int
+            Number of workers evaluating the function in parallel, one tile of the grid at a time. Use ``-1`` to use
+            all CPUs. The function is run in separate processes if it can be pickled, and in threads otherwise.
+            Defaults to ``1``.
+        dtype : DTypeLike
+            Data type of the coordinates given to the function and of the values it returns. Use ``np.float32`` to
+            halve the memory used by large grids.
+            Defaults to ``np.float64``.
 
         Returns
         -------
         A :class:`~graphinglib.data_plotting_2d.Heatmap` object created from a function.
         """
-        x = np.linspace(x_axis_range[0], x_axis_range[1], number_of_points[0])
-        y = np.linspace(y_axis_range[0], y_axis_range[1], number_of_points[1])
-        x_grid, y_grid = np.meshgrid(x, y)
-        z = func(x_grid, y_grid)
+        x = np.linspace(
+            x_axis_range[0], x_axis_range[1], number_of_points[0], dtype=dtype
+        )
+        y = np.linspace(
+            y_axis_range[0], y_axis_range[1], number_of_points[1], dtype=dtype
+        )
+        (z,) = _evaluate_on_grid(func, x, y, workers=workers, dtype=dtype)
         return cls(
             image=z,
             x_axis_range=x_axis_range,
@@ -278,10 +1226,10 @@ class Heatmap(Plottable2D):
     @classmethod
     def from_points(
         cls,
-        points: ArrayLike,
-        values: ArrayLike,
-        x_axis_range: tuple[float, float],
-        y_axis_range: tuple[float, float],
+        points: ArrayLike | ScatteredGridder,
+        values: Optional[ArrayLike] = None,
+        x_axis_range: Optional[tuple[float, float]] = None,
+        y_axis_range: Optional[tuple[float, float]] = None,
         grid_interpolation: str = "nearest",
         fill_value: float = np.nan,
         color_map: str | Colormap | Inherit = INHERIT,
@@ -293,21 +1241,34 @@ class Heatmap(Plottable2D):
         interpolation: str = "none",
         number_of_points: tuple[int, int] = (50, 50),
         norm: Optional[str | Normalize] = None,
+        max_distance: Optional[float] = None,
+        workers: int = 1,
     ) -> Self:
         """
         Creates a heatmap by interpolating unevenly distributed data points on a grid.
 
         Parameters
         ----------
-        points : ArrayLike
-            The list or array of points at which values are known.
-        values : ArrayLike
-            The list or array of values at given points.
+        points : ArrayLike or ScatteredGridder
+            The list or array of points at which values are known. A
+            :class:`~graphinglib.data_plotting_2d.ScatteredGridder` can be given instead to reuse the
+            triangulation of points shared by many sets of values, in which case its grid and interpolation
+            settings are used and ``x_axis_range``, ``y_axis_range``, ``grid_interpolation``, ``fill_value``,
+            ``number_of_points``, ``max_distance`` and ``workers`` are ignored.
+        values : ArrayLike, optional
+            The list or array of values at given points. Not needed for the ``"count"`` method.
         x_axis_range, y_axis_range : tuple[float, float], optional
             The range of x and y values used for the axes as tuples containing the start and end of the range.
+            Required unless ``points`` is a :class:`~graphinglib.data_plotting_2d.ScatteredGridder`.
         grid_interpolation : str
             Interpolation method to be used when interpolating the uneavenly distributed data on a grid.
-            Values are ``"nearest"``, ``"linear"``, and ``"cubic"``.
+            Values are ``"nearest"``, ``"linear"``, ``"cubic"``, ``"inverse_distance"``, ``"mean"``, ``"count"``
+            and ``"max"``. The last three bin the points in the grid cells instead of interpolating them, which is
+            much faster for very large numbers of points.
+        fill_value : float
+            Value given to the grid points outside of the convex hull of the points, farther than
+            ``max_distance`` from any point, or whose cell contains no point.
+            Defaults to ``np.nan``.
         color_map : str, Colormap
             The color map to use for the :class:`~graphinglib.data_plotting_2d.Heatmap`. Can either be specified as a
             string (named colormap from Matplotlib) or a Colormap object.
@@ -346,31 +1307,41 @@ class Heatmap(Plottable2D):
             Defaults to ``(50, 50)``.
         norm : str or Normalize, optional
             Normalization of the colormap. Default is ``None``.
+        max_distance : float, optional
+            For the ``"nearest"`` and ``"inverse_distance"`` methods, largest distance at which a point
+            contributes to a grid point. Grid points without any point within this distance are given
+            ``fill_value``.
+            Defaults to ``None`` (no limit).
+        workers : int
+            Number of threads used to search for the nearest points. Use ``-1`` to use all available CPUs.
+            Defaults to ``1``.
 
         Returns
         -------
         A :class:`~graphinglib.data_plotting_2d.Heatmap` object created from data points.
         """
-        x = np.linspace(x_axis_range[0], x_axis_range[1], number_of_points[0])
-        y = np.linspace(y_axis_range[0], y_axis_range[1], number_of_points[1])
-        x_grid, y_grid = np.meshgrid(x, y)
-        try:
-            grid = griddata(
+        if isinstance(points, ScatteredGridder):
+            gridder = points
+        else:
+            if x_axis_range is None or y_axis_range is None:
+                raise InvalidParameterError(
+                    "x_axis_range and y_axis_range must be given unless points is a "
+                    "ScatteredGridder."
+                )
+            gridder = ScatteredGridder(
                 points,
-                values,
-                (x_grid, y_grid),
-                method=grid_interpolation,
+                x_axis_range,
+                y_axis_range,
+                number_of_points=number_of_points,
+                grid_interpolation=grid_interpolation,
                 fill_value=fill_value,
+                max_distance=max_distance,
+                workers=workers,
             )
-        except Exception as exc:
-            raise PlottingError(
-                f"Could not interpolate the data onto a grid ({exc}). Check that points "
-                "and values are compatible and that enough points were provided."
-            ) from exc
         return cls(
-            image=grid,
-            x_axis_range=x_axis_range,
-            y_axis_range=y_axis_range,
+            image=gridder.grid(values),
+            x_axis_range=gridder.x_axis_range,
+            y_axis_range=gridder.y_axis_range,
             color_map=color_map,
             color_map_range=color_map_range,
             show_color_bar=show_color_bar,
@@ -489,12 +1460,131 @@ class Heatmap(Plottable2D):
             norm=norm,
         )
 
+    @classmethod
+    def from_memmap(
+        cls,
+        path: str,
+        shape: Optional[tuple[int, ...]] = None,
+        dtype: DTypeLike = np.float32,
+        offset: int = 0,
+        pyramid_directory: Optional[str] = None,
+        x_axis_range: Optional[tuple[float, float]] = None,
+        y_axis_range: Optional[tuple[float, float]] = None,
+        color_map: str | Colormap | Inherit = INHERIT,
+        color_map_range: Optional[tuple[float, float]] = None,
+        show_color_bar: bool = True,
+        alpha: float = 1.0,
+        aspect_ratio: str | float | Inherit = INHERIT,
+        origin_position: str | Inherit = INHERIT,
+        interpolation: str = "none",
+        norm: Optional[str | Normalize] = None,
+    ) -> Self:
+        """
+        Creates a heatmap from an image file which is memory-mapped instead of being read in memory.
+
+        A multi-resolution pyramid of the image, in which each level halves the resolution of the previous
+        one, is built next to the file the first time it is opened and reused afterwards. When plotting, only
+        the level of detail and the region needed to fill the axes at the figure's DPI are read, and they are
+        read again whenever the axes limits change. This allows images much larger than the available memory
+        to be displayed.
+
+        Parameters
+        ----------
+        path : str
+            Path to the image file. ``.npy`` files are opened with their own shape and data type; any other file
+            is read as raw pixel values, in row-major order.
+        shape : tuple[int, ...], optional
+            Shape of the image in a raw file, as ``(rows, columns)`` or ``(rows, columns, channels)``. Required for
+            raw files and ignored for ``.npy`` files.
+        dtype : DTypeLike
+            Data type of the values in a raw file. Ignored for ``.npy`` files.
+            Defaults to ``np.float32``.
+        offset : int
+            Number of bytes to skip at the start of a raw file, for example to skip a header. Ignored for ``.npy``
+            files.
+            Defaults to ``0``.
+        pyramid_directory : str, optional
+            Directory in which the levels of the pyramid are stored. It is rebuilt if the image file has changed
+            since it was created.
+            Defaults to the image's path followed by ``".pyramid"``.
+        x_axis_range, y_axis_range : tuple[float, float], optional
+            The range of x and y values used for the axes as tuples containing the start and end of the range.
+        color_map : str, Colormap
+            The color map to use for the :class:`~graphinglib.data_plotting_2d.Heatmap`. Can either be specified as a
+            string (named colormap from Matplotlib) or a Colormap object.
+            Examples include ``"viridis"``, ``"plasma"``, and ``"coolwarm"``.
+            Default depends on the ``figure_style`` configuration.
+        color_map_range: tuple[float, float], optional
+            The data range covered by the color map, given as ``(minimum, maximum)``.
+            Defaults to the minimum and maximum finite values of the full-resolution image.
+        show_color_bar : bool
+            Whether or not to display the color bar next to the plot.
+            Defaults to ``True``.
+        alpha : float
+            Opacity value of the :class:`~graphinglib.data_plotting_2d.Heatmap`.
+            Range is ``0`` (transparent) to ``1`` (opaque).
+            Defaults to 1.0.
+        aspect_ratio : str or float
+            Aspect ratio of the axes.
+            Values include ``"auto"``, ``"equal"``, or a positive float.
+            Default depends on the ``figure_style`` configuration.
+        origin_position : str
+            Position of the origin of the axes (upper left or lower left corner).
+            Values are ``"upper"`` and ``"lower"``.
+            Default depends on the ``figure_style`` configuration.
+        interpolation : str
+            Interpolation method to be applied to the image.
+            Values include ``"none"``, ``"nearest"``, ``"bilinear"``, ``"bicubic"``, ``"spline16"``,
+            ``"spline36"``, ``"hanning"``, ``"hamming"``, ``"hermite"``, ``"kaiser"``, ``"quadric"``,
+            ``"catrom"``, ``"gaussian"``, ``"bessel"``, ``"mitchell"``, ``"sinc"``, and ``"lanczos"``.
+            Defaults to ``"none"``.
+
+            .. seealso::
+                For other interpolation methods, refer to
+                `Interpolations for imshow <https://matplotlib.org/stable/gallery/images_contours_and_fields/interpolation_methods.html>`_.
+
+        norm : str or Normalize, optional
+            Normalization of the colormap. Default is ``None``.
+
+        Returns
+        -------
+        A :class:`~graphinglib.data_plotting_2d.Heatmap` object created from a memory-mapped image file.
+        """
+        if path.endswith(".npy"):
+            image = np.load(path, mmap_mode="r")
+        elif shape is None:
+            raise InvalidParameterError(
+                "The shape of the image must be given to memory-map a raw file."
+            )
+        else:
+            image = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        heatmap = cls(
+            image=image,
+            x_axis_range=x_axis_range,
+            y_axis_range=y_axis_range,
+            color_map=color_map,
+            color_map_range=color_map_range,
+            show_color_bar=show_color_bar,
+            alpha=alpha,
+            aspect_ratio=aspect_ratio,
+            origin_position=origin_position,
+            interpolation=interpolation,
+            norm=norm,
+        )
+        if pyramid_directory is None:
+            pyramid_directory = f"{path}.pyramid"
+        heatmap._pyramid = _HeatmapPyramid.open(image, path, pyramid_directory)
+        return heatmap
+
     @property
     def image(self) -> np.ndarray:
         return self._image
 
     @image.setter
     def image(self, image: ArrayLike | str) -> None:
+        self._pyramid: Optional[_HeatmapPyramid] = None
+        self._downsampling_cache: Optional[tuple[tuple, np.ndarray]] = None
+        self._value_range_cache: Optional[tuple[float, float]] = None
         if isinstance(image, str):
             try:
                 self._image = imread(image)
@@ -609,6 +1699,19 @@ class Heatmap(Plottable2D):
     def interpolation(self, interpolation: str) -> None:
         self._interpolation = interpolation
 
+    @property
+    def downsampling(self) -> Optional[str]:
+        return self._downsampling
+
+    @downsampling.setter
+    def downsampling(self, downsampling: Optional[str]) -> None:
+        if downsampling is not None and downsampling not in _DOWNSAMPLING_METHODS:
+            raise InvalidParameterError(
+                f"downsampling must be one of {list(_DOWNSAMPLING_METHODS)} or None, "
+                f"but got {downsampling!r}."
+            )
+        self._downsampling = downsampling
+
     @property
     def color_bar_params(self) -> dict:
         return self._color_bar_params
@@ -636,9 +1739,118 @@ class Heatmap(Plottable2D):
             float(y_range[1]),
         )
 
+    def _full_extent(self) -> tuple[float, float, float, float]:
+        """
+        Gives the extent of the whole image, in the pixel-index coordinates used by ``imshow`` for the axes whose
+        range isn't set.
+        """
+        if self._xy_range is not None:
+            return self._xy_range
+        number_of_rows, number_of_columns = self._image.shape[:2]
+        rows_extent = (number_of_rows - 0.5, -0.5)
+        if resolve_or(self._origin_position, "upper") != "upper":
+            rows_extent = rows_extent[::-1]
+        return (-0.5, number_of_columns - 0.5, *rows_extent)
+
+    def _downsampling_factors(self, pixel_size: tuple[int, int]) -> tuple[int, int]:
+        """
+        Gives the numbers of rows and columns of the image combined into each pixel displayed by axes of the given
+        size in pixels.
+        """
+        if self._downsampling is None:
+            return (1, 1)
+        number_of_rows, number_of_columns = self._image.shape[:2]
+        return (
+            max(1, number_of_rows // pixel_size[1]),
+            max(1, number_of_columns // pixel_size[0]),
+        )
+
+    def _downsampled_image(self, factors: tuple[int, int]) -> np.ndarray:
+        """
+        Gives the image block-reduced by the given factors, or the image itself if they are both ``1``. The last
+        reduced image is cached.
+        """
+        if factors == (1, 1):
+            return self._image
+        key = (self._image.shape, factors, self._downsampling)
+        if self._downsampling_cache is None or self._downsampling_cache[0] != key:
+            self._downsampling_cache = (key, self._reduce(self._image, factors))
+        return self._downsampling_cache[1]
+
+    def _value_range(self) -> Optional[tuple[float, float]]:
+        """
+        Gives the range of the finite values of the full-resolution image, or ``None`` if it has none. The range is
+        cached until the image is replaced.
+
+        ``fmin`` and ``fmax`` skip NaNs without building a mask of the image. Only if an extreme is infinite are the
+        finite values searched, one row at a time.
+        """
+        if self._value_range_cache is None:
+            minimum = np.fmin.reduce(self._image, axis=None)
+            maximum = np.fmax.reduce(self._image, axis=None)
+            if not (np.isfinite(minimum) and np.isfinite(maximum)):
+                minimum, maximum = np.inf, -np.inf
+                for row in self._image:
+                    finite_row = row[np.isfinite(row)]
+                    if finite_row.size:
+                        minimum = min(minimum, finite_row.min())
+                        maximum = max(maximum, finite_row.max())
+                if minimum > maximum:
+                    return None
+            self._value_range_cache = (float(minimum), float(maximum))
+        return self._value_range_cache
+
+    def _reduce(self, image: np.ndarray, factors: tuple[int, int]) -> np.ndarray:
+        """
+        Block-reduces an image by the given factors with the Heatmap's downsampling method.
+        """
+        assert self._downsampling is not None
+        reduced = _block_reduce(image, factors, self._downsampling)
+        if image.ndim == 3 and np.issubdtype(image.dtype, np.integer):
+            # Integer RGB(A) values are only understood by imshow with their own data type.
+            reduced = np.rint(reduced).astype(image.dtype)
+        return reduced
+
+    def _show_frame(self, image: ArrayLike) -> None:
+        """
+        Replaces the values displayed by the plotted Heatmap with those of a new frame of the same shape, keeping
+        its artist, extent and color scale. The artist isn't redrawn.
+        """
+        if self.handle is None:
+            raise InvalidOperationError(
+                "The Heatmap must be plotted before its displayed frame can be changed."
+            )
+        if self._pyramid is not None:
+            raise UnsupportedFeatureError(
+                "Memory-mapped Heatmaps created with from_memmap() cannot be animated."
+            )
+        image = np.asarray(image)
+        if image.shape != self._image.shape:
+            raise IncompatibleArgumentsError(
+                f"Each frame must have the shape of the Heatmap's image {self._image.shape}, "
+                f"but got a frame of shape {image.shape}."
+            )
+        if isinstance(self.handle, QuadMesh):
+            self.handle.set_array(image)
+            return
+        axes = self.handle.axes
+        assert axes is not None
+        for artist in axes.artists:
+            if (
+                isinstance(artist, _DownsampledImageUpdater)
+                and artist.image is self.handle
+            ):
+                artist.show_source(image)
+                return
+        self.handle.set_data(image)
+
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_2d.Heatmap`.
+
+        The copy shares the NumPy arrays of the Heatmap as read-only views instead of duplicating them. Its data can't
+        be modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves
+        the Heatmap unchanged.
         """
         return deepcopy(self)
 
@@ -671,6 +1883,80 @@ class Heatmap(Plottable2D):
         if position is not None:
             self._color_bar_params["location"] = position
 
+    def _plot_pyramid(self, axes: plt.Axes, z_order: int, params: dict) -> AxesImage:
+        """
+        Plots a memory-mapped image from the level of its pyramid which matches the resolution of the axes,
+        and updates the displayed level and region whenever the axes limits change.
+        """
+        pyramid = self._pyramid
+        assert pyramid is not None
+        origin = resolve_or(self._origin_position, "upper")
+        full_extent = self._full_extent()
+        params["extent"] = full_extent
+        # The color scale must not change with the level displayed, so it defaults to the
+        # range of the full-resolution image rather than to that of the pixels shown.
+        if (
+            self._image.ndim == 2
+            and not self._color_map_range
+            and not isinstance(self._norm, Normalize)
+        ):
+            params["vmin"], params["vmax"] = pyramid.value_range
+        params = strip_inherit(params)
+        image = axes.imshow(
+            pyramid.levels[-1],
+            zorder=z_order,
+            **params,
+        )
+
+        def show_view(axes: plt.Axes) -> None:
+            data, extent = pyramid.select(
+                full_extent,
+                origin,
+                axes.get_xlim(),
+                axes.get_ylim(),
+                _axes_pixel_size(axes),
+            )
+            image.set_data(data)
+            # set_extent() would rescale the axes to the cropped region, so autoscaling is
+            # paused and the image keeps the sticky edges of the full extent.
+            autoscale = axes.get_autoscalex_on(), axes.get_autoscaley_on()
+            axes.set_autoscale_on(False)
+            image.set_extent(extent)
+            axes.set_autoscalex_on(autoscale[0])
+            axes.set_autoscaley_on(autoscale[1])
+            image.sticky_edges.x[:] = sorted(full_extent[:2])
+            image.sticky_edges.y[:] = sorted(full_extent[2:])
+
+        show_view(axes)
+        axes.callbacks.connect("xlim_changed", show_view)
+        axes.callbacks.connect("ylim_changed", show_view)
+        return image
+
+    def _plot_downsampled(
+        self, axes: plt.Axes, z_order: int, params: dict
+    ) -> AxesImage:
+        """
+        Plots an image whose values are block-reduced to the resolution of the axes each time the figure is drawn,
+        after its layout is computed.
+        """
+        params["extent"] = self._full_extent()
+        placeholder = np.zeros((1, 1) + self._image.shape[2:], dtype=self._image.dtype)
+        if self._image.ndim == 2:
+            placeholder = np.full((1, 1), np.nan)
+            # Reducing the image changes its extreme values, so the color scale defaults
+            # to the range of the full-resolution image rather than to that of the reduced one.
+            value_range = self._value_range()
+            if value_range is not None and not self._color_map_range:
+                placeholder[0, 0] = value_range[0]
+                if isinstance(self._norm, Normalize):
+                    self._norm.autoscale_None(np.asarray(value_range))
+                else:
+                    params["vmin"], params["vmax"] = value_range
+        params = strip_inherit(params)
+        image = axes.imshow(placeholder, zorder=z_order, **params)
+        axes.add_artist(_DownsampledImageUpdater(self, image))
+        return image
+
     def _plot_element(self, axes: plt.Axes, z_order: int, **kwargs) -> None:
         """
         Plots the element in the specified
@@ -687,7 +1973,7 @@ class Heatmap(Plottable2D):
         use_pcolormesh = self._x_mesh is not None and self._y_mesh is not None
         if use_pcolormesh:
             params = strip_inherit(params)
-            image = axes.pcolormesh(
+            self.handle = axes.pcolormesh(
                 self._x_mesh,
                 self._y_mesh,
                 self._image,
@@ -704,16 +1990,21 @@ class Heatmap(Plottable2D):
                 }
             )
 
-            params = strip_inherit(params)
-            image = axes.imshow(
-                self._image,
-                zorder=z_order,
-                **params,
-            )
+            if self._pyramid is not None:
+                self.handle = self._plot_pyramid(axes, z_order, params)
+            elif self._downsampling is not None:
+                self.handle = self._plot_downsampled(axes, z_order, params)
+            else:
+                params = strip_inherit(params)
+                self.handle = axes.imshow(
+                    self._image,
+                    zorder=z_order,
+                    **params,
+                )
         if resolve_or(self._show_color_bar, True):
             fig = axes.get_figure()
             assert fig is not None
-            fig.colorbar(image, ax=axes, **self._color_bar_params)
+            fig.colorbar(self.handle, ax=axes, **self._color_bar_params)
 
 
 @dataclass
@@ -743,6 +2034,22 @@ class VectorField(Plottable2D):
     color : str
         Color of the vector arrows.
         Default depends on the ``figure_style`` configuration.
+    arrow_density : float, optional
+        Maximum number of arrows per inch of the axes along each direction. Dense fields given on a grid are decimated
+        when plotted so that the arrows remain readable and fast to draw, and the decimated field is reused while the
+        size of the axes doesn't change. If ``None``, every vector is plotted.
+        Defaults to ``None``.
+    decimation : str
+        How dense fields given on a grid are decimated when ``arrow_density`` is set. ``"mean"`` replaces each block of
+        vectors by their mean, at the mean of their positions, while ``"stride"`` keeps the vector at the center of each
+        block. Fields which aren't given on a grid are always strided.
+        Values are ``"mean"`` and ``"stride"``.
+        Defaults to ``"mean"``.
+    copy : bool
+        Whether to store copies of the data. By default, arrays are kept as given, without being copied or converted to
+        another data type, so that large arrays and memory-mapped arrays are shared with the
+        :class:`~graphinglib.data_plotting_2d.VectorField` rather than duplicated.
+        Defaults to ``False``.
 
     Notes
     -----
@@ -762,6 +2069,9 @@ class VectorField(Plottable2D):
         scale: Optional[float] = None,
         make_angles_axes_independent: bool = False,
         color: str | Inherit = INHERIT,
+        arrow_density: Optional[float] = None,
+        decimation: str = "mean",
+        copy: bool = False,
     ) -> None:
         """
         This class implements vector fields.
@@ -793,6 +2103,22 @@ class VectorField(Plottable2D):
         color : str
             Color of the vector arrows.
             Default depends on the ``figure_style`` configuration.
+        arrow_density : float, optional
+            Maximum number of arrows per inch of the axes along each direction. Dense fields given on a grid are
+            decimated when plotted so that the arrows remain readable and fast to draw, and the decimated field is
+            reused while the size of the axes doesn't change. If ``None``, every vector is plotted.
+            Defaults to ``None``.
+        decimation : str
+            How dense fields given on a grid are decimated when ``arrow_density`` is set. ``"mean"`` replaces each block
+            of vectors by their mean, at the mean of their positions, while ``"stride"`` keeps the vector at the center
+            of each block. Fields which aren't given on a grid are always strided.
+            Values are ``"mean"`` and ``"stride"``.
+            Defaults to ``"mean"``.
+        copy : bool
+            Whether to store copies of the data. By default, arrays are kept as given, without being copied or converted
+            to another data type, so that large arrays and memory-mapped arrays are shared with the
+            :class:`~graphinglib.data_plotting_2d.VectorField` rather than duplicated.
+            Defaults to ``False``.
 
         Notes
         -----
@@ -800,16 +2126,20 @@ class VectorField(Plottable2D):
         (``"b"``), hex strings (``"#0000ff"``), grayscale strings (``"0.5"``), and RGB/RGBA tuples with
         values between ``0`` and ``1`` (``(0, 0, 1)`` or ``(0, 0, 1, 0.5)``).
         """
-        self._x_data = np.asarray(x_data)
-        self._y_data = np.asarray(y_data)
-        self._u_data = np.asarray(u_data)
-        self._v_data = np.asarray(v_data)
+        # Positions and components of the last decimated field, with the factors and method giving them
+        self._decimation_cache: Optional[tuple[tuple, tuple]] = None
+        self.x_data = _copied(x_data, copy)
+        self.y_data = _copied(y_data, copy)
+        self.u_data = _copied(u_data, copy)
+        self.v_data = _copied(v_data, copy)
         self._arrow_width = arrow_width
         self._arrow_head_size = arrow_head_size
         self._scale = scale
         self._make_angles_axes_independent = make_angles_axes_independent
 
         self._color = color
+        self.arrow_density = arrow_density
+        self.decimation = decimation
 
     @classmethod
     def from_function(
@@ -824,10 +2154,18 @@ class VectorField(Plottable2D):
         scale: Optional[float] = None,
         make_angles_axes_independent: bool = False,
         color: str | Inherit = INHERIT,
+        workers: int = 1,
+        arrow_density: Optional[float] = None,
+        decimation: str = "mean",
+        dtype: DTypeLike = np.float64,
     ) -> Self:
         """
         Creates a :class:`~graphinglib.data_plotting_2d.VectorField` from a function.
 
+        The function is evaluated tile by tile on the grid, and receives a row of x values and a column of y values
+        which NumPy broadcasts together, so that no full coordinate grid has to be held in memory. Functions which
+        don't support broadcasting are given both coordinates as 2D arrays for each tile instead.
+
         Parameters
         ----------
         func : Callable[[ArrayLike, ArrayLike], tuple[ArrayLike, ArrayLike]]
@@ -857,6 +2195,23 @@ class VectorField(Plottable2D):
         color : str
             Color of the vector arrows.
             Default depends on the ``figure_style`` configuration.
+        workers : int
+            Number of workers evaluating the function in parallel, one tile of the grid at a time. Use ``-1`` to use
+            all CPUs. The function is run in separate processes if it can be pickled, and in threads otherwise.
+            Defaults to ``1``.
+        arrow_density : float, optional
+            Maximum number of arrows per inch of the axes along each direction. The field is decimated when plotted
+            if it has more arrows. If ``None``, every vector is plotted.
+            Defaults to ``None``.
+        decimation : str
+            How the field is decimated when ``arrow_density`` is set. ``"mean"`` replaces each block of vectors by
+            their mean, while ``"stride"`` keeps the vector at the center of each block.
+            Values are ``"mean"`` and ``"stride"``.
+            Defaults to ``"mean"``.
+        dtype : DTypeLike
+            Data type of the coordinates given to the function and of the values it returns. Use ``np.float32`` to
+            halve the memory used by large grids.
+            Defaults to ``np.float64``.
 
         Notes
         -----
@@ -868,10 +2223,18 @@ class VectorField(Plottable2D):
         -------
         A :class:`~graphinglib.data_plotting_2d.VectorField` object from a function.
         """
-        x = np.linspace(x_axis_range[0], x_axis_range[-1], number_of_arrows_x)
-        y = np.linspace(y_axis_range[0], y_axis_range[-1], number_of_arrows_y)
-        x_grid, y_grid = np.meshgrid(x, y)
-        u, v = func(x_grid, y_grid)
+        x = np.linspace(
+            x_axis_range[0], x_axis_range[-1], number_of_arrows_x, dtype=dtype
+        )
+        y = np.linspace(
+            y_axis_range[0], y_axis_range[-1], number_of_arrows_y, dtype=dtype
+        )
+        u, v = _evaluate_on_grid(
+            func, x, y, number_of_outputs=2, workers=workers, dtype=dtype
+        )
+        # Read-only broadcast views give the coordinate grids without allocating them.
+        x_grid = np.broadcast_to(x, u.shape)
+        y_grid = np.broadcast_to(y[:, None], u.shape)
         return cls(
             x_grid,
             y_grid,
@@ -882,6 +2245,8 @@ class VectorField(Plottable2D):
             scale,
             make_angles_axes_independent,
             color,
+            arrow_density,
+            decimation,
         )
 
     @property
@@ -891,6 +2256,7 @@ class VectorField(Plottable2D):
     @x_data.setter
     def x_data(self, x_data: ArrayLike) -> None:
         self._x_data = np.asarray(x_data)
+        self._reset_decimation_cache()
 
     @property
     def y_data(self) -> ArrayLike:
@@ -899,6 +2265,7 @@ class VectorField(Plottable2D):
     @y_data.setter
     def y_data(self, y_data: ArrayLike) -> None:
         self._y_data = np.asarray(y_data)
+        self._reset_decimation_cache()
 
     @property
     def u_data(self) -> ArrayLike:
@@ -907,6 +2274,7 @@ class VectorField(Plottable2D):
     @u_data.setter
     def u_data(self, u_data: ArrayLike) -> None:
         self._u_data = np.asarray(u_data)
+        self._reset_decimation_cache()
 
     @property
     def v_data(self) -> ArrayLike:
@@ -915,6 +2283,7 @@ class VectorField(Plottable2D):
     @v_data.setter
     def v_data(self, v_data: ArrayLike) -> None:
         self._v_data = np.asarray(v_data)
+        self._reset_decimation_cache()
 
     @property
     def arrow_width(self) -> Styled[float]:
@@ -956,12 +2325,97 @@ class VectorField(Plottable2D):
     def color(self, color: str) -> None:
         self._color = color
 
+    @property
+    def arrow_density(self) -> Optional[float]:
+        return self._arrow_density
+
+    @arrow_density.setter
+    def arrow_density(self, arrow_density: Optional[float]) -> None:
+        if arrow_density is not None and arrow_density <= 0:
+            raise InvalidParameterError(
+                f"arrow_density must be positive or None, but got {arrow_density}."
+            )
+        self._arrow_density = arrow_density
+        self._reset_decimation_cache()
+
+    @property
+    def decimation(self) -> str:
+        return self._decimation
+
+    @decimation.setter
+    def decimation(self, decimation: str) -> None:
+        if decimation not in _DECIMATION_METHODS:
+            raise InvalidParameterError(
+                f"decimation must be one of {list(_DECIMATION_METHODS)}, but got {decimation!r}."
+            )
+        self._decimation = decimation
+        self._reset_decimation_cache()
+
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_2d.VectorField`.
+
+        The copy shares the NumPy arrays of the VectorField as read-only views instead of duplicating them. Its data
+        can't be modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which
+        leaves the VectorField unchanged.
         """
         return deepcopy(self)
 
+    def _reset_decimation_cache(self) -> None:
+        """
+        Discards the decimated field, which no longer matches the data or decimation parameters.
+        """
+        self._decimation_cache = None
+
+    def _decimated_data(
+        self, axes_size: tuple[float, float]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gives the positions and components of the arrows reduced to at most ``arrow_density`` arrows per inch of
+        axes of the given width and height in inches. The last decimated field is cached.
+        """
+        data = (self._x_data, self._y_data, self._u_data, self._v_data)
+        if self._arrow_density is None:
+            return data
+        number_of_arrows_x = max(1, round(self._arrow_density * axes_size[0]))
+        number_of_arrows_y = max(1, round(self._arrow_density * axes_size[1]))
+        shape = self._u_data.shape
+        if self._u_data.ndim == 2:
+            if self._x_data.ndim == 1 and self._y_data.ndim == 1:
+                # Coordinate vectors give the columns and rows of the grid, as for quiver().
+                data = (
+                    np.broadcast_to(self._x_data, shape),
+                    np.broadcast_to(self._y_data[:, None], shape),
+                    self._u_data,
+                    self._v_data,
+                )
+            x_data = np.broadcast_to(data[0], shape)
+            # The rows of the grid run along y, unless it was built with "ij" indexing.
+            if np.ptp(x_data[0]) >= np.ptp(x_data[:, 0]):
+                targets = (number_of_arrows_y, number_of_arrows_x)
+            else:
+                targets = (number_of_arrows_x, number_of_arrows_y)
+        else:
+            shape = (self._u_data.size,)
+            targets = (number_of_arrows_x * number_of_arrows_y,)
+        factors = tuple(
+            max(1, -(-size // target)) for size, target in zip(shape, targets)
+        )
+        if all(factor == 1 for factor in factors):
+            return data
+        key = (factors, self._decimation)
+        if self._decimation_cache is None or self._decimation_cache[0] != key:
+            arrays = [np.broadcast_to(array, shape) for array in data]
+            if len(factors) == 2 and self._decimation == "mean":
+                x_data, y_data, u_data, v_data = (
+                    _block_reduce(array, factors, "mean") for array in arrays
+                )
+            else:
+                centers = tuple(slice(factor // 2, None, factor) for factor in factors)
+                x_data, y_data, u_data, v_data = (array[centers] for array in arrays)
+            self._decimation_cache = (key, (x_data, y_data, u_data, v_data))
+        return self._decimation_cache[1]
+
     def _plot_element(self, axes: plt.Axes, z_order: int, **kwargs) -> None:
         """
         Plots the element in the specified
@@ -984,11 +2438,17 @@ class VectorField(Plottable2D):
             "scale_units": "xy",
         }
         params = strip_inherit(params)
+        figure = axes.get_figure()
+        assert figure is not None
+        bbox = axes.get_window_extent()
+        x_data, y_data, u_data, v_data = self._decimated_data(
+            (bbox.width / figure.dpi, bbox.height / figure.dpi)
+        )
         axes.quiver(
-            self._x_data,
-            self._y_data,
-            self._u_data,
-            self._v_data,
+            x_data,
+            y_data,
+            u_data,
+            v_data,
             zorder=z_order,
             **params,
         )
@@ -1033,6 +2493,11 @@ class Contour(Plottable2D):
         for each contour level.
         Typical range is ``0.5`` to ``3`` points.
         Default depends on the ``figure_style`` configuration.
+    copy : bool
+        Whether to store copies of the data and meshes. By default, arrays are kept as given, without being copied or
+        converted to another data type, so that large arrays and memory-mapped arrays are shared with the
+        :class:`~graphinglib.data_plotting_2d.Contour` rather than duplicated.
+        Defaults to ``False``.
     """
 
     _z_data: np.ndarray
@@ -1057,6 +2522,7 @@ class Contour(Plottable2D):
         filled: bool | Inherit = INHERIT,
         alpha: float | Inherit = INHERIT,
         line_widths: float | ArrayLike | Inherit = INHERIT,
+        copy: bool = False,
     ) -> None:
         """
         This class implements contour plots.
@@ -1095,10 +2561,15 @@ class Contour(Plottable2D):
             width for each contour level.
             Typical range is ``0.5`` to ``3`` points.
             Default depends on the ``figure_style`` configuration.
+        copy : bool
+            Whether to store copies of the data and meshes. By default, arrays are kept as given, without being copied
+            or converted to another data type, so that large arrays and memory-mapped arrays are shared with the
+            :class:`~graphinglib.data_plotting_2d.Contour` rather than duplicated.
+            Defaults to ``False``.
         """
-        self.z_data = z_data
-        self.x_mesh = x_mesh
-        self.y_mesh = y_mesh
+        self.z_data = _copied(z_data, copy)
+        self.x_mesh = _copied(x_mesh, copy)
+        self.y_mesh = _copied(y_mesh, copy)
         self._levels = levels
         self._color_map = color_map
         self._color_map_range = color_map_range
@@ -1123,10 +2594,16 @@ class Contour(Plottable2D):
         alpha: float | Inherit = INHERIT,
         line_widths: float | ArrayLike | Inherit = INHERIT,
         number_of_points: tuple[int, int] = (500, 500),
+        workers: int = 1,
+        dtype: DTypeLike = np.float64,
     ) -> Self:
         """
         Creates a Contour object from a function.
 
+        The function is evaluated tile by tile on the grid, and receives a row of x values and a column of y values
+        which NumPy broadcasts together, so that no full coordinate grid has to be held in memory. Functions which
+        don't support broadcasting are given both coordinates as 2D arrays for each tile instead.
+
         Parameters
         ----------
         func : Callable[[ArrayLike, ArrayLike], ArrayLike]
@@ -1163,15 +2640,29 @@ class Contour(Plottable2D):
         number_of_points : tuple[int, int]
             Number of points in the x and y coordinates.
             Defaults to ``(50, 50)``.
+        workers : int
+            Number of workers evaluating the function in parallel, one tile of the grid at a time. Use ``-1`` to use
+            all CPUs. The function is run in separate processes if it can be pickled, and in threads otherwise.
+            Defaults to ``1``.
+        dtype : DTypeLike
+            Data type of the coordinates given to the function and of the values it returns. Use ``np.float32`` to
+            halve the memory used by large grids.
+            Defaults to ``np.float64``.
 
         Returns
         -------
         A :class:`~graphinglib.data_plotting_2d.Contour` object from a function.
         """
-        x = np.linspace(x_axis_range[0], x_axis_range[1], number_of_points[0])
-        y = np.linspace(y_axis_range[0], y_axis_range[1], number_of_points[1])
-        x_mesh, y_mesh = np.meshgrid(x, y)
-        z_data = func(x_mesh, y_mesh)
+        x = np.linspace(
+            x_axis_range[0], x_axis_range[1], number_of_points[0], dtype=dtype
+        )
+        y = np.linspace(
+            y_axis_range[0], y_axis_range[1], number_of_points[1], dtype=dtype
+        )
+        (z_data,) = _evaluate_on_grid(func, x, y, workers=workers, dtype=dtype)
+        # Read-only broadcast views give the coordinate grids without allocating them.
+        x_mesh = np.broadcast_to(x, z_data.shape)
+        y_mesh = np.broadcast_to(y[:, None], z_data.shape)
         return cls(
             z_data,
             x_mesh,
@@ -1192,6 +2683,7 @@ class Contour(Plottable2D):
     @x_mesh.setter
     def x_mesh(self, x_mesh: ArrayLike | None) -> None:
         self._x_mesh = None if x_mesh is None else np.asarray(x_mesh)
+        self._contour_cache = None
 
     @property
     def y_mesh(self) -> np.ndarray | None:
@@ -1200,6 +2692,7 @@ class Contour(Plottable2D):
     @y_mesh.setter
     def y_mesh(self, y_mesh: ArrayLike | None) -> None:
         self._y_mesh = None if y_mesh is None else np.asarray(y_mesh)
+        self._contour_cache = None
 
     @property
     def z_data(self) -> np.ndarray:
@@ -1208,6 +2701,8 @@ class Contour(Plottable2D):
     @z_data.setter
     def z_data(self, z_data: ArrayLike) -> None:
         self._z_data = np.asarray(z_data)
+        self._contour_cache: Optional[tuple[tuple, tuple]] = None
+        self._z_range_cache: Optional[tuple[float, float]] = None
 
     @property
     def levels(self) -> Styled[int | ArrayLike]:
@@ -1272,9 +2767,173 @@ class Contour(Plottable2D):
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_2d.Contour`.
+
+        The copy shares the NumPy arrays of the Contour as read-only views instead of duplicating them. Its data can't
+        be modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves
+        the Contour unchanged.
         """
         return deepcopy(self)
 
+    def _z_range(self) -> tuple[float, float]:
+        """
+        Gives the range of the finite values of the data. The range is cached until the data is replaced.
+        """
+        if self._z_range_cache is None:
+            z_data = np.ma.masked_invalid(self._z_data, copy=False)
+            self._z_range_cache = (float(z_data.min()), float(z_data.max()))
+        return self._z_range_cache
+
+    def _resolved_levels(self, filled: bool) -> np.ndarray:
+        """
+        Gives the values of the contour levels, chosen from the range of the data like matplotlib does when
+        ``levels`` is a number of levels.
+        """
+        levels = resolve_or(self._levels, 10)
+        if isinstance(levels, (int, np.integer)):
+            z_min, z_max = self._z_range()
+            values = np.asarray(
+                MaxNLocator(levels + 1, min_n_ticks=1).tick_values(z_min, z_max)
+            )
+            # Excess levels given by the locator are trimmed.
+            under = np.flatnonzero(values < z_min)
+            over = np.flatnonzero(values > z_max)
+            start = under[-1] if len(under) else 0
+            stop = over[0] + 1 if len(over) else len(values)
+            if stop - start >= 3:
+                values = values[start:stop]
+        else:
+            values = np.asarray(levels, dtype=np.float64)
+        if filled and len(values) < 2:
+            raise InvalidParameterError(
+                f"Filled contours require at least 2 levels, but got {len(values)}."
+            )
+        if len(values) > 1 and np.min(np.diff(values)) <= 0:
+            raise InvalidParameterError(
+                f"Contour levels must be increasing, but got {values.tolist()}."
+            )
+        return values
+
+    def _contour_geometry(
+        self, filled: bool, workers: int = 1
+    ) -> tuple[np.ndarray, list[list[np.ndarray]], list[list[np.ndarray]]]:
+        """
+        Gives the contour levels and the vertices and path codes of the contour lines at each level, or of the
+        polygons between each pair of levels if the contour is filled. The last geometry computed is cached for
+        the current data, along with every option given to the contour generator.
+        """
+        if workers == -1:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise InvalidParameterError(
+                f"workers must be a positive integer or -1, but got {workers}."
+            )
+        if workers > 1:
+            # Each thread traces the contours of its own chunks of the grid.
+            name = "threaded"
+            corner_mask = None
+            total_chunk_count = _CONTOUR_CHUNKS_PER_WORKER * workers
+        else:
+            name = plt.rcParams["contour.algorithm"]
+            corner_mask = (
+                None if name == "mpl2005" else plt.rcParams["contour.corner_mask"]
+            )
+            total_chunk_count = None
+        levels = self._resolved_levels(filled)
+        key = (tuple(levels), filled, name, corner_mask, workers, total_chunk_count)
+        if self._contour_cache is not None and self._contour_cache[0] == key:
+            return self._contour_cache[1]
+
+        if self._x_mesh is None or self._y_mesh is None:
+            x_mesh = np.arange(self._z_data.shape[1])
+            y_mesh = np.arange(self._z_data.shape[0])
+        else:
+            x_mesh, y_mesh = self._x_mesh, self._y_mesh
+        try:
+            generator = contourpy.contour_generator(
+                x_mesh,
+                y_mesh,
+                np.ma.masked_invalid(self._z_data, copy=False),
+                name=name,
+                corner_mask=corner_mask,
+                line_type=contourpy.LineType.SeparateCode,
+                fill_type=contourpy.FillType.OuterCode,
+                total_chunk_count=total_chunk_count,
+                thread_count=workers if name == "threaded" else 0,
+            )
+            # With these line and fill types, each level gives a list of vertex arrays and a list of code arrays.
+            geometry: list[tuple[list[np.ndarray], list[np.ndarray]]]
+            if filled:
+                lowers = levels[:-1].copy()
+                # The lowest interval includes the minimum of the data.
+                if lowers[0] == self._z_range()[0]:
+                    lowers[0] -= 1
+                geometry = [
+                    cast(Any, generator.filled(lower, upper))
+                    for lower, upper in zip(lowers, levels[1:])
+                ]
+            else:
+                geometry = [cast(Any, generator.lines(level)) for level in levels]
+        except Exception as exc:
+            raise PlottingError(f"Could not compute the contours ({exc}).") from exc
+        all_vertices = [vertices for vertices, _ in geometry]
+        all_codes = [codes for _, codes in geometry]
+        self._contour_cache = (key, (levels, all_vertices, all_codes))
+        return self._contour_cache[1]
+
+    def get_contour_lines(self, workers: int = 1) -> dict[float, list[np.ndarray]]:
+        """
+        Computes the contour lines at each level of the :class:`~graphinglib.data_plotting_2d.Contour`.
+
+        The contours are computed once for the current data and levels, and are reused when the Contour is plotted
+        with ``filled=False``.
+
+        Parameters
+        ----------
+        workers : int
+            Number of threads computing the contours, each on its own chunks of the grid. Use ``-1`` to use all
+            CPUs. Lines crossing the boundaries between chunks are split into several lines.
+            Defaults to ``1``.
+
+        Returns
+        -------
+        A dictionary which associates each level to the list of its lines, each given as an array of shape
+        ``(number of vertices, 2)`` of x and y coordinates. Closed lines end with their first vertex.
+        """
+        levels, all_vertices, _ = self._contour_geometry(False, workers)
+        return dict(zip(levels.tolist(), all_vertices))
+
+    def get_filled_contours(
+        self, workers: int = 1
+    ) -> dict[tuple[float, float], list[tuple[np.ndarray, np.ndarray]]]:
+        """
+        Computes the filled contours between each pair of consecutive levels of the
+        :class:`~graphinglib.data_plotting_2d.Contour`.
+
+        The contours are computed once for the current data and levels, and are reused when the Contour is plotted
+        with ``filled=True``.
+
+        Parameters
+        ----------
+        workers : int
+            Number of threads computing the contours, each on its own chunks of the grid. Use ``-1`` to use all
+            CPUs. Polygons crossing the boundaries between chunks are split into several polygons.
+            Defaults to ``1``.
+
+        Returns
+        -------
+        A dictionary which associates each ``(lower level, upper level)`` interval to the list of its polygons.
+        Each polygon is given as an array of shape ``(number of vertices, 2)`` of x and y coordinates and an array of
+        the corresponding :class:`matplotlib.path.Path` codes, in which each hole of the polygon starts with a
+        ``MOVETO`` code.
+        """
+        levels, all_vertices, all_codes = self._contour_geometry(True, workers)
+        return {
+            (lower, upper): list(zip(vertices, codes))
+            for lower, upper, vertices, codes in zip(
+                levels[:-1].tolist(), levels[1:].tolist(), all_vertices, all_codes
+            )
+        }
+
     def set_color_bar_params(
         self,
         label: Optional[str] = None,
@@ -1309,17 +2968,9 @@ class Contour(Plottable2D):
         Plots the element in the specified
         `Axes <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.html>`_.
         """
-        if self._x_mesh is None or self._y_mesh is None:
-            x_mesh, y_mesh = np.meshgrid(
-                np.arange(self._z_data.shape[1]),
-                np.arange(self._z_data.shape[0]),
-            )
-        else:
-            x_mesh = self._x_mesh
-            y_mesh = self._y_mesh
         filled = resolve_or(self._filled, True)
+        levels, all_vertices, all_codes = self._contour_geometry(filled)
         params = {
-            "levels": self._levels,
             "cmap": self._color_map,
             "alpha": self._alpha,
             "linewidths": self._line_widths if not filled else None,
@@ -1329,19 +2980,36 @@ class Contour(Plottable2D):
             params["vmax"] = max(self._color_map_range)
 
         params = strip_inherit(params)
-        if filled:
-            cont = axes.contourf(
-                x_mesh,
-                y_mesh,
-                self._z_data,
+        if any(len(vertices) for vertices in all_vertices):
+            # The cached geometry is drawn as is instead of being computed again by matplotlib.
+            cont = ContourSet(
+                axes,
+                levels,
+                all_vertices,
+                all_codes,
+                filled=filled,
                 zorder=z_order,
                 **params,
             )
+            # The data limits span the whole grid, as for contours computed by matplotlib.
+            if self._x_mesh is None or self._y_mesh is None:
+                x_bounds = (0, self._z_data.shape[1] - 1)
+                y_bounds = (0, self._z_data.shape[0] - 1)
+            else:
+                x_bounds = (np.min(self._x_mesh), np.max(self._x_mesh))
+                y_bounds = (np.min(self._y_mesh), np.max(self._y_mesh))
+            axes.update_datalim(list(zip(x_bounds, y_bounds)))
+            axes.autoscale_view(tight=True)
         else:
-            cont = axes.contour(
-                x_mesh,
-                y_mesh,
+            contour_function = axes.contourf if filled else axes.contour
+            if self._x_mesh is None or self._y_mesh is None:
+                meshes = ()
+            else:
+                meshes = (self._x_mesh, self._y_mesh)
+            cont = contour_function(
+                *meshes,
                 self._z_data,
+                levels=levels,
                 zorder=z_order,
                 **params,
             )
@@ -1379,6 +3047,11 @@ class Stream(Plottable2D):
     arrow_size : float
         Arrow size multiplier. Default depends on the ``figure_style`` configuration.
         Typical range is ``0.5`` to ``3``.
+    copy : bool
+        Whether to store copies of the data. By default, arrays are kept as given, without being copied or converted to
+        another data type, so that large arrays and memory-mapped arrays are shared with the
+        :class:`~graphinglib.data_plotting_2d.Stream` rather than duplicated.
+        Defaults to ``False``.
 
     Notes
     -----
@@ -1386,6 +3059,10 @@ class Stream(Plottable2D):
     (``"b"``), hex strings (``"#0000ff"``), grayscale strings (``"0.5"``), and RGB/RGBA tuples with
     values between ``0`` and ``1`` (``(0, 0, 1)`` or ``(0, 0, 1, 0.5)``). They may also be arrays of
     intensity values, which are mapped through ``color_map``.
+
+    The stream lines are seeded and spaced like those of Matplotlib's ``streamplot``, but are integrated with
+    steps of a constant length instead of steps adapted to an error estimate. They can differ slightly from
+    those of ``streamplot`` where the field curves sharply over the length of a step.
     """
 
     def __init__(
@@ -1399,6 +3076,7 @@ class Stream(Plottable2D):
         color: str | ArrayLike | Inherit = INHERIT,
         color_map: str | Colormap | Inherit = INHERIT,
         arrow_size: float | Inherit = INHERIT,
+        copy: bool = False,
     ) -> None:
         """
         This class implements stream plots.
@@ -1426,6 +3104,11 @@ class Stream(Plottable2D):
         arrow_size : float
             Arrow size multiplier. Default depends on the ``figure_style`` configuration.
             Typical range is ``0.5`` to ``3``.
+        copy : bool
+            Whether to store copies of the data. By default, arrays are kept as given, without being copied or converted
+            to another data type, so that large arrays and memory-mapped arrays are shared with the
+            :class:`~graphinglib.data_plotting_2d.Stream` rather than duplicated.
+            Defaults to ``False``.
 
         Notes
         -----
@@ -1434,15 +3117,17 @@ class Stream(Plottable2D):
         values between ``0`` and ``1`` (``(0, 0, 1)`` or ``(0, 0, 1, 0.5)``). They may also be arrays of
         intensity values, which are mapped through ``color_map``.
         """
-        self._x_data = np.asarray(x_data)
-        self._y_data = np.asarray(y_data)
-        self._u_data = np.asarray(u_data)
-        self._v_data = np.asarray(v_data)
+        self.x_data = _copied(x_data, copy)
+        self.y_data = _copied(y_data, copy)
+        self.u_data = _copied(u_data, copy)
+        self.v_data = _copied(v_data, copy)
         self._density = density
         self._line_width = line_width
         self._color = color
         self._color_map = color_map
         self._arrow_size = arrow_size
+        self._streamline_cache: Optional[tuple[tuple, list[np.ndarray]]] = None
+        self.handle = None
 
     @classmethod
     def from_function(
@@ -1457,10 +3142,16 @@ class Stream(Plottable2D):
         color: str | Inherit = INHERIT,
         color_map: str | Colormap | Inherit = INHERIT,
         arrow_size: float | Inherit = INHERIT,
+        workers: int = 1,
+        dtype: DTypeLike = np.float64,
     ) -> Self:
         """
         Creates a :class:`~graphinglib.data_plotting_2d.Stream` from a function.
 
+        The function is evaluated tile by tile on the grid, and receives a row of x values and a column of y values
+        which NumPy broadcasts together, so that no full coordinate grid has to be held in memory. Functions which
+        don't support broadcasting are given both coordinates as 2D arrays for each tile instead.
+
         Parameters
         ----------
         func : Callable[[ArrayLike, ArrayLike], [ArrayLike, ArrayLike]]
@@ -1485,6 +3176,14 @@ class Stream(Plottable2D):
         arrow_size : float
             Arrow size multiplier. Default depends on the ``figure_style`` configuration.
             Typical range is ``0.5`` to ``3``.
+        workers : int
+            Number of workers evaluating the function in parallel, one tile of the grid at a time. Use ``-1`` to use
+            all CPUs. The function is run in separate processes if it can be pickled, and in threads otherwise.
+            Defaults to ``1``.
+        dtype : DTypeLike
+            Data type of the coordinates given to the function and of the values it returns. Use ``np.float32`` to
+            halve the memory used by large grids.
+            Defaults to ``np.float64``.
 
         Notes
         -----
@@ -1497,45 +3196,279 @@ class Stream(Plottable2D):
         -------
         A :class:`~graphinglib.data_plotting_2d.Stream` object from a function.
         """
-        x = np.linspace(x_axis_range[0], x_axis_range[1], number_of_points_x)
-        y = np.linspace(y_axis_range[0], y_axis_range[1], number_of_points_y)
-        x_grid, y_grid = np.meshgrid(x, y)
-        u, v = func(x_grid, y_grid)
+        x = np.linspace(
+            x_axis_range[0], x_axis_range[1], number_of_points_x, dtype=dtype
+        )
+        y = np.linspace(
+            y_axis_range[0], y_axis_range[1], number_of_points_y, dtype=dtype
+        )
+        u, v = _evaluate_on_grid(
+            func, x, y, number_of_outputs=2, workers=workers, dtype=dtype
+        )
         return cls(x, y, u, v, density, line_width, color, color_map, arrow_size)
 
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.data_plotting_2d.Stream`.
+
+        The copy shares the NumPy arrays of the Stream as read-only views instead of duplicating them. Its data can't be
+        modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves the
+        Stream unchanged.
         """
         return deepcopy(self)
 
+    @property
+    def x_data(self) -> ArrayLike:
+        return self._x_data
+
+    @x_data.setter
+    def x_data(self, x_data: ArrayLike) -> None:
+        self._x_data = np.asarray(x_data)
+        self._streamline_cache: Optional[tuple[tuple, list[np.ndarray]]] = None
+
+    @property
+    def y_data(self) -> ArrayLike:
+        return self._y_data
+
+    @y_data.setter
+    def y_data(self, y_data: ArrayLike) -> None:
+        self._y_data = np.asarray(y_data)
+        self._streamline_cache: Optional[tuple[tuple, list[np.ndarray]]] = None
+
+    @property
+    def u_data(self) -> ArrayLike:
+        return self._u_data
+
+    @u_data.setter
+    def u_data(self, u_data: ArrayLike) -> None:
+        self._u_data = np.asarray(u_data)
+        self._streamline_cache: Optional[tuple[tuple, list[np.ndarray]]] = None
+
+    @property
+    def v_data(self) -> ArrayLike:
+        return self._v_data
+
+    @v_data.setter
+    def v_data(self, v_data: ArrayLike) -> None:
+        self._v_data = np.asarray(v_data)
+        self._streamline_cache: Optional[tuple[tuple, list[np.ndarray]]] = None
+
+    @property
+    def density(self) -> float | tuple[float, float]:
+        return self._density
+
+    @density.setter
+    def density(self, density: float | tuple[float, float]) -> None:
+        self._density = density
+
+    def get_streamlines(self) -> list[np.ndarray]:
+        """
+        Gives the stream lines of the :class:`~graphinglib.data_plotting_2d.Stream`.
+
+        The stream lines are integrated the first time they are needed and kept until the data or the density
+        changes, so that they are reused by every figure in which the Stream is plotted.
+
+        Returns
+        -------
+        A list containing the points of each stream line as an array of shape (N, 2), with the x coordinates
+        in the first column and the y coordinates in the second.
+        """
+        x, y = self._grid_vectors()
+        origin = np.array([x[0], y[0]])
+        spacing = np.array(
+            [(x[-1] - x[0]) / (x.size - 1), (y[-1] - y[0]) / (y.size - 1)]
+        )
+        return [origin + line * spacing for line in self._grid_streamlines()]
+
+    def _grid_vectors(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gives the x and y coordinates of the grid as 1D arrays, checking that they are evenly spaced and that
+        they match the shape of the vectors.
+        """
+        x, y = self._x_data, self._y_data
+        if x.ndim == 2:
+            if not np.allclose(x, x[0]):
+                raise InvalidParameterError(
+                    "The rows of x_data must be equal when it is given as a mesh grid."
+                )
+            x = x[0]
+        if y.ndim == 2:
+            if not np.allclose(y, y[:, :1]):
+                raise InvalidParameterError(
+                    "The columns of y_data must be equal when it is given as a mesh grid."
+                )
+            y = y[:, 0]
+        for name, values in (("x_data", x), ("y_data", y)):
+            if values.ndim != 1 or values.size < 2:
+                raise InvalidParameterError(
+                    f"{name} must contain at least 2 values, but got shape {values.shape}."
+                )
+            # Positions are compared with an even spacing to a fraction of a cell, which tolerates float32 rounding.
+            step = (values[-1] - values[0]) / (values.size - 1)
+            evenly_spaced = np.linspace(values[0], values[-1], values.size)
+            if not step > 0 or not np.allclose(
+                values, evenly_spaced, rtol=0, atol=1e-3 * step
+            ):
+                raise InvalidParameterError(
+                    f"{name} must be evenly spaced and increasing."
+                )
+        if self._u_data.shape != (y.size, x.size) or self._v_data.shape != (
+            y.size,
+            x.size,
+        ):
+            raise IncompatibleArgumentsError(
+                f"u_data and v_data must have shape (len(y), len(x)) = {(y.size, x.size)}, but got "
+                f"{self._u_data.shape} and {self._v_data.shape}."
+            )
+        return x, y
+
+    def _grid_streamlines(self) -> list[np.ndarray]:
+        """
+        Gives the stream lines as arrays of fractional (x, y) indices of the grid, integrating them if the data
+        or the density changed since they were last computed.
+
+        Seeds are tried in the same order as in Matplotlib's streamplot, and lines are stopped when they enter
+        a cell of the occupancy mask already crossed by a line. The lines are integrated in batches of seeds,
+        skipping the seeds whose cell is already occupied when the batch is formed.
+        """
+        x, y = self._grid_vectors()
+        key = tuple(float(d) for d in np.broadcast_to(self._density, 2))
+        if self._streamline_cache is not None and self._streamline_cache[0] == key:
+            return self._streamline_cache[1]
+
+        number_of_rows, number_of_columns = self._u_data.shape
+        # Vectors are expressed in grid cells per unit of time, and their norm in axes units per unit of time.
+        dtype = np.result_type(self._u_data.dtype, self._v_data.dtype, np.float32)
+        u = np.divide(self._u_data, (x[-1] - x[0]) / (x.size - 1), dtype=dtype)
+        v = np.divide(self._v_data, (y[-1] - y[0]) / (y.size - 1), dtype=dtype)
+        vectors = np.stack(
+            [u, v, np.hypot(u / (number_of_columns - 1), v / (number_of_rows - 1))]
+        )
+        mask_columns, mask_rows = (30 * np.array(key)).astype(int)
+        mask = np.zeros((mask_rows, mask_columns), dtype=bool)
+        grid_to_mask = np.array(
+            [
+                (mask_columns - 1) / (number_of_columns - 1),
+                (mask_rows - 1) / (number_of_rows - 1),
+            ]
+        )
+        step = 1 / max(mask_columns, mask_rows)
+        number_of_steps = int(np.ceil(_STREAMLINE_MAX_LENGTH / 2 / step))
+
+        cells = _spiral_cells(mask_columns, mask_rows)
+        flat_cells = cells[:, 1] * mask_columns + cells[:, 0]
+        streamlines = []
+        start = 0
+        while start < len(cells):
+            free = np.flatnonzero(~mask.flat[flat_cells[start:]])
+            batch = start + free[:_STREAMLINE_BATCH_SIZE]
+            if not batch.size:
+                break
+            start = batch[-1] + 1
+            seeds = cells[batch] / grid_to_mask
+            occupied = mask.copy()
+            backward, backward_counts = _trace_streamlines(
+                vectors * [[[-1]], [[-1]], [[1]]],
+                seeds,
+                step,
+                number_of_steps,
+                occupied,
+                grid_to_mask,
+            )
+            forward, forward_counts = _trace_streamlines(
+                vectors, seeds, step, number_of_steps, occupied, grid_to_mask
+            )
+            for i, cell in enumerate(flat_cells[batch]):
+                if mask.flat[cell]:
+                    continue
+                backward_cells = _claim_stream_cells(
+                    mask, backward[i, : backward_counts[i]], grid_to_mask
+                )
+                forward_cells = _claim_stream_cells(
+                    mask, forward[i, : forward_counts[i]], grid_to_mask
+                )
+                line = np.concatenate(
+                    [
+                        backward[i, : backward_cells.size][::-1],
+                        forward[i, 1 : forward_cells.size],
+                    ]
+                )
+                steps = np.diff(line, axis=0) / [
+                    number_of_columns - 1,
+                    number_of_rows - 1,
+                ]
+                if np.hypot(steps[:, 0], steps[:, 1]).sum() < _STREAMLINE_MIN_LENGTH:
+                    mask.flat[backward_cells] = False
+                    mask.flat[forward_cells] = False
+                else:
+                    streamlines.append(line)
+        self._streamline_cache = (key, streamlines)
+        return streamlines
+
     def _plot_element(self, axes: plt.Axes, z_order: int, **kwargs) -> None:
         """
         Plots the element in the specified Axes.
         """
-        params = {
-            "density": self._density,
-            "linewidth": self._line_width,
-            "cmap": self._color_map,
-            "arrowsize": self._arrow_size,
-        }
-        params = strip_inherit(params)
-        if is_inherit(self._color):
-            pass
+        x, y = self._grid_vectors()
+        grid_lines = self._grid_streamlines()
+        lines = self.get_streamlines()
+        line_width = resolve_or(self._line_width, plt.rcParams["lines.linewidth"])
+        arrow_size = resolve_or(self._arrow_size, 1)
+        color = resolve_or(self._color, None)
+        color_map = resolve_or(self._color_map, None)
+        if color is None:
+            # First color of the rcParams' property cycle
+            color = "C0"
+
+        # As in Matplotlib's streamplot, an arrow is drawn halfway along each line.
+        middles = []
+        for line in lines:
+            lengths = np.cumsum(np.hypot(*np.diff(line, axis=0).T))
+            middles.append(np.searchsorted(lengths, lengths[-1] / 2))
+
+        if isinstance(color, str) or np.ndim(color) != 2:
+            self.handle = LineCollection(
+                lines,
+                linewidths=line_width,
+                colors=color,
+                cmap=color_map,
+                zorder=z_order,
+            )
+            arrow_colors = [color] * len(lines)
         else:
-            params["color"] = self._color
-
-        try:
-            axes.streamplot(
-                x=self._x_data,
-                y=self._y_data,
-                u=self._u_data,
-                v=self._v_data,
+            color = np.asarray(color)
+            if color.shape != self._u_data.shape:
+                raise IncompatibleArgumentsError(
+                    f"An array of colors must have the shape of u_data {self._u_data.shape}, but got {color.shape}."
+                )
+            # Each segment takes the color interpolated at its first point.
+            segments = [np.stack([line[:-1], line[1:]], axis=1) for line in lines]
+            values = [_interpolate_bilinear(color, line[:-1]) for line in grid_lines]
+            self.handle = LineCollection(
+                list(np.concatenate(segments)) if segments else [],
+                linewidths=line_width,
+                array=np.concatenate(values) if values else np.empty(0),
+                cmap=color_map,
+                norm=Normalize(color.min(), color.max()),
                 zorder=z_order,
-                **params,
             )
-        except Exception as exc:
-            raise PlottingError(
-                f"Could not draw the Stream ({exc}). Check that x and y are evenly "
-                "spaced 1D arrays and that u and v have shape (len(y), len(x))."
-            ) from exc
+            arrow_colors = [
+                self.handle.to_rgba(line_values[middle])
+                for line_values, middle in zip(values, middles)
+            ]
+        self.handle.sticky_edges.x[:] = [x[0], x[-1]]
+        self.handle.sticky_edges.y[:] = [y[0], y[-1]]
+        axes.add_collection(self.handle)
+        for line, middle, arrow_color in zip(lines, middles, arrow_colors):
+            axes.add_patch(
+                FancyArrowPatch(
+                    line[middle],
+                    line[middle : middle + 2].mean(axis=0),
+                    arrowstyle="-|>",
+                    mutation_scale=10 * arrow_size,
+                    linewidth=line_width,
+                    color=arrow_color,
+                    zorder=z_order,
+                )
+            )
+        axes.autoscale_view()
@@ -1,4 +1,5 @@
-from os import listdir, mkdir, path, remove
+from copy import deepcopy
+from os import listdir, mkdir, path, remove, stat
 from typing import Literal, overload
 from warnings import warn
 
@@ -7,10 +8,29 @@ from matplotlib import pyplot as plt
 from platformdirs import user_config_dir
 
 from .exceptions import InvalidParameterError, StyleFileError
+from .profiling import _profiled
 
 # Force yaml to ignore aliases when dumping
 yaml.Dumper.ignore_aliases = lambda *args: True  # type: ignore
 
+# Parsed style files by location, along with the modification time and size of the file when it was parsed
+_parsed_style_files: dict[str, tuple[tuple[int, int], dict | None]] = {}
+
+
+def _parse_style_file(file_location: str) -> dict | None:
+    """
+    Parses a style file, or gives a copy of the result of its last parsing if the file is unchanged since. Parsing
+    the YAML of a style file takes most of the time spent in GraphingLib when a figure is drawn repeatedly.
+    """
+    file_stat = stat(file_location)
+    version = (file_stat.st_mtime_ns, file_stat.st_size)
+    parsed = _parsed_style_files.get(file_location)
+    if parsed is None or parsed[0] != version:
+        with open(file_location, "r") as file:
+            parsed = (version, yaml.safe_load(file))
+        _parsed_style_files[file_location] = parsed
+    return deepcopy(parsed[1])
+
 
 class FileLoader:
     """
@@ -31,14 +51,13 @@ class FileLoader:
             f"{self._config_dir}/custom_styles/{self._file_name}.yml"
         )
 
+    @_profiled("load style")
     def load(self) -> dict:
         try:
-            with open(self._file_location_customs, "r") as file:
-                info = yaml.safe_load(file)
+            info = _parse_style_file(self._file_location_customs)
         except FileNotFoundError:
             try:
-                with open(self._file_location_defaults, "r") as file:
-                    info = yaml.safe_load(file)
+                info = _parse_style_file(self._file_location_defaults)
             except FileNotFoundError:
                 raise FileNotFoundError(
                     f"Could not find the file {self._file_name}.yml."
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
+from dataclasses import dataclass
 from functools import partial
 from inspect import signature
+from math import comb
 from typing import Any, Callable, Optional, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy.typing import ArrayLike
-from scipy.optimize import curve_fit
-
-from .data_plotting_1d import Curve, Scatter
-from .exceptions import InvalidParameterError, PlottingError
-from .graph_elements import Point
-from .inherit import INHERIT, Inherit, Styled, strip_inherit
+from scipy.optimize import OptimizeWarning, curve_fit
+from scipy.stats import t as student_t
+
+from .data_plotting_1d import Curve, Scatter, _check_same_length
+from .exceptions import (
+    IncompatibleArgumentsError,
+    InvalidOperationError,
+    InvalidParameterError,
+    PlottingError,
+)
+from .graph_elements import Plottable, Point
+from .inherit import INHERIT, Inherit, Styled, is_inherit, strip_inherit
 
 try:
     from typing import Self
@@ -53,6 +65,158 @@ def _repair_positive_guess(
     return guesses
 
 
+def _bootstrap_fit_curves(
+    template: Callable[..., float | np.ndarray],
+    x_data: np.ndarray,
+    y_data: np.ndarray,
+    parameters: np.ndarray,
+    bounds: tuple[ArrayLike, ArrayLike],
+    max_iterations: int,
+    x_grid: np.ndarray,
+    residuals: Optional[np.ndarray],
+    seeds: list[np.random.SeedSequence],
+) -> np.ndarray:
+    """
+    Refits the data resampled with replacement once per seed and evaluates each refit on
+    ``x_grid``. Refits that don't converge give a row of NaNs.
+
+    This runs in worker processes, so it must stay a module-level function.
+    """
+    curves = np.full((len(seeds), len(x_grid)), np.nan)
+    for i, seed in enumerate(seeds):
+        rng = np.random.default_rng(seed)
+        sample = rng.integers(0, len(x_data), len(x_data))
+        try:
+            with warnings.catch_warnings():
+                # Resamples with many duplicated points often leave the covariance
+                # undetermined, which is irrelevant here.
+                warnings.simplefilter("ignore", OptimizeWarning)
+                resampled_parameters, _ = curve_fit(
+                    template,
+                    x_data[sample],
+                    y_data[sample],
+                    p0=parameters,
+                    bounds=bounds,
+                    maxfev=max_iterations,
+                )
+        except (RuntimeError, ValueError):
+            continue
+        curves[i] = template(x_grid, *resampled_parameters)
+        if residuals is not None:
+            curves[i] += rng.choice(residuals, len(x_grid))
+    return curves
+
+
+@dataclass(frozen=True, slots=True)
+class _FitStatistics:
+    """
+    Goodness-of-fit statistics of a fit, computed from a single evaluation of the fit
+    function on the fitted data.
+    """
+
+    residuals: np.ndarray
+    residual_sum_of_squares: float
+    r_squared: float
+    reduced_chi_squared: float
+    residual_standard_deviation: float
+
+
+@dataclass(frozen=True, slots=True)
+class _DataUpdate:
+    """
+    Samples appended to and dropped from the fitted data by :meth:`GeneralFit.refit`.
+    """
+
+    previous_x_data: np.ndarray
+    previous_y_data: np.ndarray
+    added_x_data: np.ndarray
+    added_y_data: np.ndarray
+    dropped_x_data: np.ndarray
+    dropped_y_data: np.ndarray
+
+
+@dataclass(slots=True)
+class _PolynomialNormalEquations:
+    """
+    Accumulated normal equations of a polynomial least squares fit, used to refit a
+    polynomial in a time proportional to the number of added or removed samples.
+
+    The powers are taken on ``(x - shift) / scale``, fixed when the equations are first built,
+    which keeps the equations well conditioned for large x values.
+    """
+
+    x_data: np.ndarray
+    y_data: np.ndarray
+    degree: int
+    shift: float
+    scale: float
+    lhs: np.ndarray
+    rhs: np.ndarray
+    y_squared_sum: float = 0.0
+    number_of_points: int = 0
+
+    @classmethod
+    def from_data(
+        cls, x_data: np.ndarray, y_data: np.ndarray, degree: int
+    ) -> _PolynomialNormalEquations:
+        shift = float(np.mean(x_data))
+        scale = float(np.max(np.abs(x_data - shift))) or 1.0
+        equations = cls(
+            x_data,
+            y_data,
+            degree,
+            shift,
+            scale,
+            lhs=np.zeros((degree + 1, degree + 1)),
+            rhs=np.zeros(degree + 1),
+        )
+        equations.add(x_data, y_data)
+        return equations
+
+    def add(self, x_data: np.ndarray, y_data: np.ndarray, sign: int = 1) -> None:
+        vandermonde = np.vander(
+            (np.asarray(x_data, dtype=float) - self.shift) / self.scale,
+            self.degree + 1,
+            increasing=True,
+        )
+        y_data = np.asarray(y_data, dtype=float)
+        self.lhs += sign * (vandermonde.T @ vandermonde)
+        self.rhs += sign * (vandermonde.T @ y_data)
+        self.y_squared_sum += sign * float(y_data @ y_data)
+        self.number_of_points += sign * len(y_data)
+
+    def remove(self, x_data: np.ndarray, y_data: np.ndarray) -> None:
+        self.add(x_data, y_data, sign=-1)
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Solves the equations for the coefficients of the polynomial in x (lowest order first)
+        and their covariance matrix, scaled the same way as ``np.polyfit(..., cov=True)``.
+        """
+        degrees_of_freedom = self.number_of_points - (self.degree + 1)
+        if degrees_of_freedom <= 0:
+            raise InvalidParameterError(
+                f"A polynomial fit of degree {self.degree} needs more than "
+                f"{self.degree + 1} data points, but got {self.number_of_points}."
+            )
+        inverse = np.linalg.pinv(self.lhs)
+        scaled_coeffs = inverse @ self.rhs
+        residual_sum_of_squares = max(
+            self.y_squared_sum - float(scaled_coeffs @ self.rhs), 0.0
+        )
+        scaled_cov_matrix = inverse * (residual_sum_of_squares / degrees_of_freedom)
+        # Maps coefficients of u = (x - shift) / scale onto coefficients of x.
+        transform = np.zeros((self.degree + 1, self.degree + 1))
+        for power in range(self.degree + 1):
+            for exponent in range(power + 1):
+                transform[exponent, power] = (
+                    comb(power, exponent)
+                    * (-self.shift) ** (power - exponent)
+                    / self.scale**power
+                )
+        return transform @ scaled_coeffs, transform @ scaled_cov_matrix @ transform.T
+
+
 class GeneralFit(Curve):
     """
     Dummy class for curve fits. Defines the interface for all curve fits.
@@ -89,6 +253,9 @@ class GeneralFit(Curve):
     values between ``0`` and ``1`` (``(0, 0, 1)`` or ``(0, 0, 1, 0.5)``).
     """
 
+    # Maximum number of evaluations of the fit function when fitting, set by the fits taking a max_iterations parameter
+    _max_iterations: int = 10000
+
     def __init__(
         self,
         curve_to_be_fit: Curve | Scatter,
@@ -139,6 +306,7 @@ class GeneralFit(Curve):
         self._alpha = alpha
 
         self._function: Callable[[float | np.ndarray], float | np.ndarray]
+        self._guesses: Optional[ArrayLike]
         self._parameters: np.ndarray
         self._cov_matrix: np.ndarray
         self._standard_deviation: np.ndarray
@@ -147,7 +315,7 @@ class GeneralFit(Curve):
 
     def _setup_attributes(self) -> None:
         self._res_curves_to_be_plotted = False
-        self._res_sigma_multiplier = None
+        self._res_sigma_multiplier: Optional[float] = None
         self._res_color = None
         self._res_line_width = None
         self._res_line_style = None
@@ -168,6 +336,8 @@ class GeneralFit(Curve):
         self._fill_between_other_curve: Optional[Self] = None
         self._fill_between_color: Optional[str] = None
 
+        self._statistics_cache: Optional[tuple[tuple, _FitStatistics]] = None
+
     @property
     def curve_to_be_fit(self) -> Curve | Scatter:
         return self._curve_to_be_fit
@@ -175,6 +345,7 @@ class GeneralFit(Curve):
     @curve_to_be_fit.setter
     def curve_to_be_fit(self, curve: Curve | Scatter) -> None:
         self._curve_to_be_fit = curve
+        self._statistics_cache = None
 
     @property
     def function(self) -> Callable[[float | np.ndarray], float | np.ndarray]:
@@ -198,6 +369,33 @@ class GeneralFit(Curve):
         """
         raise NotImplementedError()
 
+    def _calculate_parameters(self) -> None:
+        """
+        Calculates the parameters of the fit.
+        """
+        raise NotImplementedError()
+
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        """
+        Gives the function of x and of the fit parameters that is fitted to the data.
+        """
+        raise NotImplementedError()
+
+    def _fit_bounds(self) -> tuple[ArrayLike, ArrayLike]:
+        """
+        Gives the lower and upper bounds of the fit parameters.
+        """
+        return (-np.inf, np.inf)
+
+    def _sample_fit_curve(self) -> None:
+        """
+        Evaluates the fit function over the x range of the fitted data.
+        """
+        x_data = self._curve_to_be_fit._x_data
+        number_of_points = max(500, len(x_data))
+        self._x_data = np.linspace(np.min(x_data), np.max(x_data), number_of_points)
+        self._y_data = self._function(self._x_data)
+
     def _evaluate_scalar(self, x: float) -> float:
         value = self._function(x)
         return float(np.asarray(value).flat[0])
@@ -382,8 +580,8 @@ class GeneralFit(Curve):
         )
         if self._res_curves_to_be_plotted:
             y_fit = self._y_data
-            residuals = self.get_residuals()
-            std = np.std(residuals)
+            assert self._res_sigma_multiplier is not None
+            std = self._get_statistics().residual_standard_deviation
             y_fit_plus_std = y_fit + (self._res_sigma_multiplier * std)
             y_fit_minus_std = y_fit - (self._res_sigma_multiplier * std)
             params = {
@@ -463,6 +661,329 @@ class GeneralFit(Curve):
         self._res_line_width = line_width
         self._res_line_style = line_style
 
+    def refit(
+        self,
+        new_data: Curve | Scatter | tuple[ArrayLike, ArrayLike],
+        max_samples: Optional[int] = None,
+    ) -> None:
+        """
+        Fits the curve again, starting from the current parameters instead of the initial guesses.
+
+        This is meant for data that is updated over time, where the previous fit is a much better
+        starting point than the original guesses. A :class:`~graphinglib.fits.FitFromPolynomial`
+        only updates its least squares equations with the appended and dropped samples, while the
+        other fits run their optimization over all the kept samples. In both cases, the kept samples
+        are copied and the fit curve is evaluated again over their range, so each refit takes a time
+        proportional to the number of kept samples, which ``max_samples`` bounds.
+
+        Parameters
+        ----------
+        new_data : :class:`~graphinglib.data_plotting_1d.Curve`, :class:`~graphinglib.data_plotting_1d.Scatter` or tuple[ArrayLike, ArrayLike]
+            Either a new object to be fit, which replaces ``curve_to_be_fit``, or a
+            ``(x_data, y_data)`` pair of new samples, which are appended to the data of
+            ``curve_to_be_fit``.
+        max_samples : int, optional
+            Maximum number of samples kept in ``curve_to_be_fit`` when appending samples, the
+            oldest samples being dropped first. If ``None``, all samples are kept.
+            Default is ``None``.
+        """
+        if max_samples is not None and max_samples < 1:
+            raise InvalidParameterError(
+                f"max_samples must be a positive integer, but got {max_samples}."
+            )
+        old_equation = str(self)
+        if isinstance(new_data, (Curve, Scatter)):
+            self._curve_to_be_fit = new_data
+            update = None
+        else:
+            update = self._append_samples(new_data, max_samples)
+        self._warm_start_fit(update)
+        self._sample_fit_curve()
+        if self._label is not None:
+            self._label = self._label.replace(old_equation, str(self))
+
+    def _append_samples(
+        self, new_samples: tuple[ArrayLike, ArrayLike], max_samples: Optional[int]
+    ) -> _DataUpdate:
+        """
+        Appends samples to the fitted data, dropping the oldest ones beyond ``max_samples``.
+        """
+        curve = self._curve_to_be_fit
+        added_x_data, added_y_data = (np.asarray(data) for data in new_samples)
+        _check_same_length("x_data", added_x_data, "y_data", added_y_data)
+        for error in (curve._x_error, curve._y_error):
+            if error is not None and np.ndim(error) > 0:
+                raise IncompatibleArgumentsError(
+                    "Samples cannot be appended to a curve with per-point errors. "
+                    "Pass a new curve to refit instead."
+                )
+        x_data = np.concatenate((curve._x_data, added_x_data))
+        y_data = np.concatenate((curve._y_data, added_y_data))
+        number_dropped = 0 if max_samples is None else max(len(x_data) - max_samples, 0)
+        update = _DataUpdate(
+            previous_x_data=curve._x_data,
+            previous_y_data=curve._y_data,
+            added_x_data=added_x_data,
+            added_y_data=added_y_data,
+            dropped_x_data=x_data[:number_dropped],
+            dropped_y_data=y_data[:number_dropped],
+        )
+        curve.x_data = x_data[number_dropped:]
+        curve.y_data = y_data[number_dropped:]
+        return update
+
+    def _warm_start_fit(self, update: Optional[_DataUpdate]) -> None:
+        """
+        Fits the curve again using the current parameters as initial guesses.
+        """
+        initial_guesses = self._guesses
+        self._guesses = self._parameters
+        try:
+            self._calculate_parameters()
+        finally:
+            self._guesses = initial_guesses
+
+    def compute_confidence_band(
+        self,
+        method: str = "delta",
+        confidence_level: float = 0.95,
+        prediction: bool = False,
+        number_of_resamples: int = 1000,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        label: Optional[str] = None,
+        color: str | Inherit = INHERIT,
+        alpha: float | Inherit = INHERIT,
+    ) -> ConfidenceBand:
+        """
+        Computes a confidence or prediction band around the fit curve.
+
+        Parameters
+        ----------
+        method : str
+            Method used to compute the band.
+            ``"delta"`` propagates the covariance matrix of the fit parameters through the Jacobian of the fit
+            function, which is fast and exact for linear models. ``"bootstrap"`` refits the data resampled with
+            replacement ``number_of_resamples`` times and takes the percentiles of the refitted curves, which makes
+            no assumption on the shape of the parameters' distribution.
+            Default is ``"delta"``.
+        confidence_level : float
+            Probability that the band contains the true curve (or a new measurement if ``prediction`` is ``True``).
+            Range is ``0`` to ``1``.
+            Default is ``0.95``.
+        prediction : bool
+            Whether to compute a prediction band, which also includes the scatter of the data around the fit curve,
+            instead of a confidence band of the fit curve itself.
+            Default is ``False``.
+        number_of_resamples : int
+            Number of refits used by the ``"bootstrap"`` method.
+            Default is ``1000``.
+        workers : int
+            Number of processes the ``"bootstrap"`` refits are split across. ``-1`` uses all available CPUs. Fits of
+            functions that can't be pickled (such as lambdas) run in threads instead.
+            Default is ``1``.
+        seed : int, optional
+            Seed of the ``"bootstrap"`` resampling. The band only depends on the seed, not on the number of workers.
+        label : str, optional
+            Label to be displayed in the legend.
+        color : str
+            Color of the band.
+            Default is the color of the fit curve if it was set, otherwise depends on the ``figure_style``
+            configuration.
+        alpha : float
+            Opacity of the band.
+            Range is ``0`` (transparent) to ``1`` (opaque).
+            Default depends on the ``figure_style`` configuration.
+
+        Returns
+        -------
+        :class:`~graphinglib.fits.ConfidenceBand`
+            Band over the x range of the fit curve.
+        """
+        if not 0 < confidence_level < 1:
+            raise InvalidParameterError(
+                f"confidence_level must be between 0 and 1, but got {confidence_level}."
+            )
+        if method == "delta":
+            lower_data, upper_data = self._delta_method_band(
+                confidence_level, prediction
+            )
+        elif method == "bootstrap":
+            lower_data, upper_data = self._bootstrap_band(
+                confidence_level, prediction, number_of_resamples, workers, seed
+            )
+        else:
+            raise InvalidParameterError(
+                f"method must be 'delta' or 'bootstrap', but got '{method}'."
+            )
+        return ConfidenceBand(
+            self._x_data,
+            lower_data,
+            upper_data,
+            confidence_level,
+            label=label,
+            color=self._color if is_inherit(color) else color,
+            alpha=alpha,
+        )
+
+    def _delta_method_band(
+        self, confidence_level: float, prediction: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the band from the Jacobian of the fit function with respect to its parameters,
+        evaluated with central differences on every point of the fit curve at once.
+        """
+        template = self._fit_template()
+        parameters = np.asarray(self.parameters, dtype=float)
+        steps = np.cbrt(np.finfo(float).eps) * np.maximum(np.abs(parameters), 1.0)
+        jacobian = np.empty((len(self._x_data), len(parameters)))
+        for i, step in enumerate(steps):
+            shift = np.zeros_like(parameters)
+            shift[i] = step
+            jacobian[:, i] = (
+                template(self._x_data, *(parameters + shift))
+                - template(self._x_data, *(parameters - shift))
+            ) / (2 * step)
+        variance = np.einsum("ni,ij,nj->n", jacobian, self._cov_matrix, jacobian)
+
+        degrees_of_freedom = len(self._curve_to_be_fit._x_data) - len(parameters)
+        if degrees_of_freedom <= 0:
+            raise InvalidOperationError(
+                "A confidence band needs more data points than fit parameters."
+            )
+        if prediction:
+            statistics = self._get_statistics()
+            variance = (
+                variance + statistics.residual_sum_of_squares / degrees_of_freedom
+            )
+        half_width = student_t.ppf((1 + confidence_level) / 2, degrees_of_freedom)
+        half_width = half_width * np.sqrt(variance)
+        return self._y_data - half_width, self._y_data + half_width
+
+    def _bootstrap_band(
+        self,
+        confidence_level: float,
+        prediction: bool,
+        number_of_resamples: int,
+        workers: int,
+        seed: Optional[int],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the band from the percentiles of curves refitted to resampled data.
+        """
+        if number_of_resamples < 1:
+            raise InvalidParameterError(
+                f"number_of_resamples must be a positive integer, but got {number_of_resamples}."
+            )
+        if workers == -1:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise InvalidParameterError(
+                f"workers must be a positive integer or -1, but got {workers}."
+            )
+        template = self._fit_template()
+        fit_curves = partial(
+            _bootstrap_fit_curves,
+            template,
+            self._curve_to_be_fit._x_data,
+            self._curve_to_be_fit._y_data,
+            np.asarray(self.parameters, dtype=float),
+            self._fit_bounds(),
+            self._max_iterations,
+            self._x_data,
+            self._get_statistics().residuals if prediction else None,
+        )
+        # One seed per resample, so the band doesn't depend on how resamples are split.
+        seeds = np.random.SeedSequence(seed).spawn(number_of_resamples)
+        if workers == 1:
+            curves = fit_curves(seeds)
+        else:
+            chunks = [
+                list(chunk)
+                for chunk in np.array_split(np.array(seeds, dtype=object), workers * 4)
+                if len(chunk) > 0
+            ]
+            try:
+                pickle.dumps(template)
+                executor_type = ProcessPoolExecutor
+            except (pickle.PicklingError, AttributeError, TypeError):
+                executor_type = ThreadPoolExecutor
+            with executor_type(max_workers=workers) as executor:
+                curves = np.concatenate(list(executor.map(fit_curves, chunks)))
+
+        if np.all(np.isnan(curves[:, 0])):
+            raise PlottingError(
+                "None of the bootstrap refits converged. Try increasing max_iterations."
+            )
+        tail = 100 * (1 - confidence_level) / 2
+        lower_data, upper_data = np.nanpercentile(curves, [tail, 100 - tail], axis=0)
+        return lower_data, upper_data
+
+    def _statistics_key(self) -> tuple:
+        """
+        Gives the objects the cached statistics depend on. They are compared by identity, so
+        assigning new data to the fitted curve, refitting or replacing the fit function
+        invalidates the cache.
+        """
+        curve = self._curve_to_be_fit
+        return (
+            curve._x_data,
+            curve._y_data,
+            curve._y_error,
+            self.parameters,
+            self._function,
+        )
+
+    def _get_statistics(self) -> _FitStatistics:
+        """
+        Gives the goodness-of-fit statistics of the fit, evaluating the fit function on the
+        fitted data only if it changed since the last call.
+        """
+        key = self._statistics_key()
+        if self._statistics_cache is not None and all(
+            cached is current for cached, current in zip(self._statistics_cache[0], key)
+        ):
+            return self._statistics_cache[1]
+
+        x_data, y_data, y_error, parameters, function = key
+        residuals = np.asarray(function(x_data) - y_data)
+        residuals.flags.writeable = False
+        residual_sum_of_squares = float(np.sum(residuals**2))
+
+        total_variance = np.sum((y_data - np.mean(y_data)) ** 2)
+        if total_variance == 0:
+            # Scale the tolerance to the data's own magnitude, since comparing residuals
+            # to an absolute tolerance of 0 makes np.allclose's rtol term vanish. Only
+            # fall back to an absolute tolerance when the data is identically zero.
+            magnitude = np.max(np.abs(y_data))
+            scale = magnitude if magnitude > 0 else 1.0
+            is_exact_fit = np.allclose(residuals, 0, atol=1e-8 * scale)
+            r_squared = 1.0 if is_exact_fit else float("nan")
+        else:
+            r_squared = float(1 - residual_sum_of_squares / total_variance)
+
+        degrees_of_freedom = residuals.size - len(parameters)
+        if degrees_of_freedom <= 0:
+            reduced_chi_squared = float("nan")
+        else:
+            chi_squared = residual_sum_of_squares
+            if y_error is not None:
+                # Asymmetric (2, n) errors are weighted by their mean half-width.
+                sigma = y_error.mean(axis=0) if y_error.ndim == 2 else y_error
+                if np.all(sigma > 0):
+                    chi_squared = float(np.sum((residuals / sigma) ** 2))
+            reduced_chi_squared = chi_squared / degrees_of_freedom
+
+        statistics = _FitStatistics(
+            residuals=residuals,
+            residual_sum_of_squares=residual_sum_of_squares,
+            r_squared=r_squared,
+            reduced_chi_squared=reduced_chi_squared,
+            residual_standard_deviation=float(np.std(residuals)),
+        )
+        self._statistics_cache = (key, statistics)
+        return statistics
+
     def get_residuals(self) -> np.ndarray:
         """
         Calculates the residuals of the fit curve.
@@ -472,9 +993,7 @@ class GeneralFit(Curve):
         residuals : np.ndarray
             Array of residuals.
         """
-        y_data = self._function(self._curve_to_be_fit._x_data)
-        residuals = y_data - self._curve_to_be_fit._y_data
-        return residuals
+        return self._get_statistics().residuals.copy()
 
     def get_Rsquared(self) -> float:
         """
@@ -485,19 +1004,54 @@ class GeneralFit(Curve):
         Rsquared : float
             :math:`R^2` value
         """
-        y_data = self._curve_to_be_fit._y_data
-        total_variance = np.sum((y_data - np.mean(y_data)) ** 2)
-        if total_variance == 0:
-            # Scale the tolerance to the data's own magnitude, since comparing residuals
-            # to an absolute tolerance of 0 makes np.allclose's rtol term vanish. Only
-            # fall back to an absolute tolerance when the data is identically zero.
-            magnitude = np.max(np.abs(y_data))
-            scale = magnitude if magnitude > 0 else 1.0
-            is_exact_fit = np.allclose(self.get_residuals(), 0, atol=1e-8 * scale)
-            return 1.0 if is_exact_fit else float("nan")
-        return 1 - np.sum(self.get_residuals() ** 2) / total_variance
+        return self._get_statistics().r_squared
+
+    def get_residual_sum_of_squares(self) -> float:
+        """
+        Calculates the sum of the squared residuals of the fit curve.
+
+        Returns
+        -------
+        residual_sum_of_squares : float
+            Sum of the squared residuals.
+        """
+        return self._get_statistics().residual_sum_of_squares
+
+    def get_reduced_chi_squared(self) -> float:
+        """
+        Calculates the reduced :math:`\\chi^2` value of the fit curve.
+
+        If the fitted curve has a ``y_error``, the residuals are weighted by it. Otherwise, this
+        is the residual variance :math:`RSS / (N - p)`, where :math:`p` is the number of fit
+        parameters.
+
+        Returns
+        -------
+        reduced_chi_squared : float
+            Reduced :math:`\\chi^2` value, or ``nan`` if there are no more data points than fit
+            parameters.
+        """
+        return self._get_statistics().reduced_chi_squared
+
+    def get_residual_standard_deviation(self) -> float:
+        """
+        Calculates the standard deviation of the residuals of the fit curve.
+
+        Returns
+        -------
+        residual_standard_deviation : float
+            Standard deviation of the residuals.
+        """
+        return self._get_statistics().residual_standard_deviation
 
     def copy(self) -> Self:
+        """
+        Returns a deep copy of the fit.
+
+        The copy shares the NumPy arrays of the fit as read-only views instead of duplicating them. Its data can't be
+        modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves the
+        fit unchanged.
+        """
         return deepcopy(self)
 
 
@@ -610,15 +1164,9 @@ class FitFromPolynomial(GeneralFit):
             Polynomial function with the parameters of the fit.
         """
         self._curve_to_be_fit = curve_to_be_fit
-        inversed_coeffs, inversed_cov_matrix = np.polyfit(
-            self._curve_to_be_fit._x_data,
-            self._curve_to_be_fit._y_data,
-            degree,
-            cov=True,
-        )
-        self._coeffs = inversed_coeffs[::-1]
-        self._cov_matrix = np.flip(inversed_cov_matrix)
-        self._standard_deviation = np.sqrt(np.diag(self._cov_matrix))
+        self._degree = degree
+        self._normal_equations: Optional[_PolynomialNormalEquations] = None
+        self._calculate_parameters()
         self._function = self._polynomial_func_with_params()
         self._color = color
         self._line_width = line_width
@@ -629,17 +1177,7 @@ class FitFromPolynomial(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -676,6 +1214,50 @@ class FitFromPolynomial(GeneralFit):
             + "$"
         )
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._polynomial_func_template
+
+    def _calculate_parameters(self) -> None:
+        """
+        Calculates the parameters of the fit.
+        """
+        inversed_coeffs, inversed_cov_matrix = np.polyfit(
+            self._curve_to_be_fit._x_data,
+            self._curve_to_be_fit._y_data,
+            self._degree,
+            cov=True,
+        )
+        self._coeffs = inversed_coeffs[::-1]
+        self._cov_matrix = np.flip(inversed_cov_matrix)
+        self._standard_deviation = np.sqrt(np.diag(self._cov_matrix))
+
+    def _warm_start_fit(self, update: Optional[_DataUpdate]) -> None:
+        """
+        Refits the polynomial. Appended and dropped samples are added to and removed from
+        the accumulated normal equations, so the cost only depends on the number of changed
+        samples.
+        """
+        if update is None:
+            self._normal_equations = None
+            self._calculate_parameters()
+            return
+        equations = self._normal_equations
+        if (
+            equations is None
+            or equations.x_data is not update.previous_x_data
+            or equations.y_data is not update.previous_y_data
+        ):
+            equations = _PolynomialNormalEquations.from_data(
+                update.previous_x_data, update.previous_y_data, self._degree
+            )
+        equations.add(update.added_x_data, update.added_y_data)
+        equations.remove(update.dropped_x_data, update.dropped_y_data)
+        equations.x_data = self._curve_to_be_fit._x_data
+        equations.y_data = self._curve_to_be_fit._y_data
+        self._normal_equations = equations
+        self._coeffs, self._cov_matrix = equations.solve()
+        self._standard_deviation = np.sqrt(np.diag(self._cov_matrix))
+
     @staticmethod
     def _format_coeff(coeff: float) -> str:
         """
@@ -690,6 +1272,13 @@ class FitFromPolynomial(GeneralFit):
         """
         return "x^{0}".format(power) if power != 0 else ""
 
+    @staticmethod
+    def _polynomial_func_template(x: np.ndarray, *coeffs: float) -> np.ndarray:
+        """
+        Polynomial of the coefficients (lowest order first), in the form expected by ``curve_fit``.
+        """
+        return np.polynomial.polynomial.polyval(x, coeffs)
+
     def _polynomial_func_with_params(
         self,
     ) -> Callable[[float | np.ndarray], float | np.ndarray]:
@@ -857,17 +1446,7 @@ class FitFromSine(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -916,6 +1495,9 @@ class FitFromSine(GeneralFit):
         )
         return f"${part1 + part2 + part3}$"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._sine_func_template
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -1090,17 +1672,7 @@ class FitFromExponential(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -1120,6 +1692,9 @@ class FitFromExponential(GeneralFit):
         )
         return f"${part1 + part2}$"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._exp_func_template
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -1306,17 +1881,7 @@ class FitFromGaussian(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -1348,6 +1913,12 @@ class FitFromGaussian(GeneralFit):
         """
         return rf"$\mu = {self._mean:.3f}, \sigma = {self._standard_deviation:.3f}, A = {self._amplitude:.3f}$"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._gaussian_func_template
+
+    def _fit_bounds(self) -> tuple[ArrayLike, ArrayLike]:
+        return ([-np.inf, -np.inf, 1e-10], [np.inf, np.inf, np.inf])
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -1363,7 +1934,7 @@ class FitFromGaussian(GeneralFit):
             self._curve_to_be_fit._y_data,
             p0=guesses,
             maxfev=self._max_iterations,
-            bounds=([-np.inf, -np.inf, 1e-10], [np.inf, np.inf, np.inf]),
+            bounds=self._fit_bounds(),
         )
         self._amplitude = self._parameters[0]
         self._mean = self._parameters[1]
@@ -1529,17 +2100,7 @@ class FitFromSquareRoot(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -1553,6 +2114,9 @@ class FitFromSquareRoot(GeneralFit):
         """
         return rf"${self._parameters[0]:.3f} \sqrt{{x {'+' if self._parameters[1] > 0 else '-'} {abs(self._parameters[1]):.3f}}} {'+' if self._parameters[2] > 0 else '-'} {abs(self._parameters[2]):.3f}$"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._square_root_func_template
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -1732,17 +2296,7 @@ class FitFromLog(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -1756,6 +2310,9 @@ class FitFromLog(GeneralFit):
         """
         return f"${self._parameters[0]:.3f} log_{self._log_base if self._log_base != np.e else 'e'}(x {'-' if self._parameters[1] < 0 else '+'} {abs(self._parameters[1]):.3f}) {'-' if self._parameters[2] < 0 else '+'} {abs(self._parameters[2]):.3f}$"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._log_func_template()
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -1933,23 +2490,12 @@ class FitFromFunction(GeneralFit):
         self._max_iterations = max_iterations
 
         self._calculate_parameters()
-        self._function = self._get_function_with_params()
         if label:
             self._label = label + " : " + str(self)
         else:
             self._label = str(self)
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -1968,6 +2514,9 @@ class FitFromFunction(GeneralFit):
         )
         return f"Fit from function: {function_name}"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._function_template
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -1979,6 +2528,7 @@ class FitFromFunction(GeneralFit):
             p0=self._guesses,
         )
         self._standard_deviation = np.sqrt(np.diag(self._cov_matrix))
+        self._function = self._get_function_with_params()
 
     def _get_function_with_params(
         self,
@@ -2134,17 +2684,7 @@ class FitFromFOTF(GeneralFit):
         self._line_style = line_style
         self._alpha = alpha
         self._res_curves_to_be_plotted = False
-        number_of_points = (
-            len(self._curve_to_be_fit._x_data)
-            if len(self._curve_to_be_fit._x_data) > 500
-            else 500
-        )
-        self._x_data = np.linspace(
-            np.min(self._curve_to_be_fit._x_data),
-            np.max(self._curve_to_be_fit._x_data),
-            number_of_points,
-        )
-        self._y_data = self._function(self._x_data)
+        self._sample_fit_curve()
 
         self._setup_attributes()
 
@@ -2166,6 +2706,12 @@ class FitFromFOTF(GeneralFit):
         """
         return rf"$K = {self._gain:.3f}, \tau = {self._time_constant:.3f}$"
 
+    def _fit_template(self) -> Callable[..., float | np.ndarray]:
+        return self._fotf_func_template
+
+    def _fit_bounds(self) -> tuple[ArrayLike, ArrayLike]:
+        return ([-np.inf, 1e-10], [np.inf, np.inf])
+
     def _calculate_parameters(self) -> None:
         """
         Calculates the parameters of the fit.
@@ -2181,7 +2727,7 @@ class FitFromFOTF(GeneralFit):
             self._curve_to_be_fit._y_data,
             p0=guesses,
             maxfev=self._max_iterations,
-            bounds=([-np.inf, 1e-10], [np.inf, np.inf]),
+            bounds=self._fit_bounds(),
         )
         self._gain = self._parameters[0]
         self._time_constant = self._parameters[1]
@@ -2208,3 +2754,136 @@ class FitFromFOTF(GeneralFit):
             First order transfer function with the parameters of the fit.
         """
         return lambda x: self._gain * (1 - np.exp(-x / self._time_constant))
+
+
+class ConfidenceBand(Plottable):
+    """
+    This class implements a band around a fit curve, such as the confidence or prediction band
+    computed by :meth:`~graphinglib.fits.GeneralFit.compute_confidence_band`.
+
+    Parameters
+    ----------
+    x_data : ArrayLike
+        Array of x values of the band.
+    lower_data, upper_data : ArrayLike
+        Arrays of the lower and upper bounds of the band at each x value.
+    confidence_level : float, optional
+        Confidence level the band was computed with.
+    label : str, optional
+        Label to be displayed in the legend.
+    color : str
+        Color of the band.
+        Default depends on the ``figure_style`` configuration.
+    alpha : float
+        Opacity of the band.
+        Range is ``0`` (transparent) to ``1`` (opaque).
+        Default depends on the ``figure_style`` configuration.
+
+    Notes
+    -----
+    Color parameters accept Matplotlib color formats: named colors (``"blue"``), short color strings
+    (``"b"``), hex strings (``"#0000ff"``), grayscale strings (``"0.5"``), and RGB/RGBA tuples with
+    values between ``0`` and ``1`` (``(0, 0, 1)`` or ``(0, 0, 1, 0.5)``).
+    """
+
+    def __init__(
+        self,
+        x_data: ArrayLike,
+        lower_data: ArrayLike,
+        upper_data: ArrayLike,
+        confidence_level: Optional[float] = None,
+        label: Optional[str] = None,
+        color: str | Inherit = INHERIT,
+        alpha: float | Inherit = INHERIT,
+    ) -> None:
+        self.handle = None
+        self._x_data = np.asarray(x_data)
+        self._lower_data = np.asarray(lower_data)
+        self._upper_data = np.asarray(upper_data)
+        _check_same_length("x_data", self._x_data, "lower_data", self._lower_data)
+        _check_same_length("x_data", self._x_data, "upper_data", self._upper_data)
+        self._confidence_level = confidence_level
+        self._label = label
+        self._color = color
+        self._alpha = alpha
+
+    @property
+    def x_data(self) -> np.ndarray:
+        return self._x_data
+
+    @x_data.setter
+    def x_data(self, x_data: ArrayLike) -> None:
+        self._x_data = np.asarray(x_data)
+
+    @property
+    def lower_data(self) -> np.ndarray:
+        return self._lower_data
+
+    @lower_data.setter
+    def lower_data(self, lower_data: ArrayLike) -> None:
+        self._lower_data = np.asarray(lower_data)
+
+    @property
+    def upper_data(self) -> np.ndarray:
+        return self._upper_data
+
+    @upper_data.setter
+    def upper_data(self, upper_data: ArrayLike) -> None:
+        self._upper_data = np.asarray(upper_data)
+
+    @property
+    def confidence_level(self) -> Optional[float]:
+        return self._confidence_level
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._label
+
+    @label.setter
+    def label(self, label: Optional[str]) -> None:
+        self._label = label
+
+    @property
+    def color(self) -> Styled[str]:
+        return self._color
+
+    @color.setter
+    def color(self, color: str | Inherit) -> None:
+        self._color = color
+
+    @property
+    def alpha(self) -> Styled[float]:
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, alpha: float | Inherit) -> None:
+        self._alpha = alpha
+
+    def copy(self) -> Self:
+        """
+        Returns a deep copy of the :class:`~graphinglib.fits.ConfidenceBand` object.
+
+        The copy shares the NumPy arrays of the ConfidenceBand as read-only views instead of duplicating them. Its data
+        can't be modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which
+        leaves the ConfidenceBand unchanged.
+        """
+        return deepcopy(self)
+
+    def _plot_element(self, axes: plt.Axes, z_order: int, **kwargs) -> None:
+        """
+        Plots the element in the specified axes.
+        """
+        params = {
+            "color": self._color,
+            "alpha": self._alpha,
+        }
+        params = strip_inherit(params)
+        self.handle = axes.fill_between(
+            self._x_data,
+            self._lower_data,
+            self._upper_data,
+            label=self._label,
+            linewidth=0,
+            zorder=z_order - 2,
+            **params,
+        )
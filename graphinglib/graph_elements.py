@@ -18,7 +18,7 @@ from matplotlib.figure import Figure as MPLFigure
 from numpy.typing import ArrayLike
 
 from .legend_artists import VerticalLineCollection
-from .tools import _copy_with_overrides
+from .tools import _copy_with_overrides, _share_data_arrays
 
 try:
     from typing import Self
@@ -39,7 +39,8 @@ class Plottable(Protocol):
         """
         Returns a deep copy of the Plottable with specified attributes overridden. This is useful when multiple
         properties need to be changed in copies of Plottable objects, as it allows to modify the attributes in a single
-        call.
+        call. As with :func:`copy.deepcopy`, the data arrays of the Plottable are shared with the copy rather than
+        duplicated.
 
         Parameters
         ----------
@@ -64,11 +65,14 @@ class Plottable(Protocol):
     def __deepcopy__(self, memo: dict) -> Self:
         """
         Creates a deep copy of the Plottable instance, intentionally excluding the 'handle' attribute from the copy.
-        This avoids issues when copying a Plottable that has been previously drawn and stored.
+        This avoids issues when copying a Plottable that has been previously drawn and stored. The NumPy arrays of
+        the Plottable are shared with the copy as read-only views, so that copying is independent of the size of the
+        data.
         """
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
+        _share_data_arrays(self, memo)
         excluded_attrs = ["handle"]
         for property_, value in self.__dict__.items():
             if property_ not in excluded_attrs:
@@ -288,6 +292,10 @@ class Hlines(Plottable):
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.graph_elements.Hlines` object.
+
+        The copy shares the NumPy arrays of the Hlines as read-only views instead of duplicating them. Its data can't be
+        modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves the
+        Hlines unchanged.
         """
         return deepcopy(self)
 
@@ -575,6 +583,10 @@ class Vlines(Plottable):
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.graph_elements.Vlines` object.
+
+        The copy shares the NumPy arrays of the Vlines as read-only views instead of duplicating them. Its data can't be
+        modified in place, which raises a ``ValueError``, but can be replaced by assigning new arrays, which leaves the
+        Vlines unchanged.
         """
         return deepcopy(self)
 
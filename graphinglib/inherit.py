@@ -19,6 +19,10 @@ class Inherit:
     def __deepcopy__(self, memo: dict[int, object]) -> "Inherit":
         return self
 
+    def __reduce__(self) -> str:
+        # Unpickled references resolve to the module's sentinel, which keeps is_inherit working in other processes.
+        return "INHERIT"
+
     def __bool__(self) -> NoReturn:
         raise TypeError(
             "The INHERIT sentinel cannot be used in a boolean context. Use "
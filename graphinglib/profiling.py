@@ -0,0 +1,284 @@
+"""
+Profiling of the rendering of SmartFigures.
+
+The stages of the rendering are recorded while a :func:`~graphinglib.profile` context is active, and otherwise cost a
+single lookup of the active profile.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_active_profile: ContextVar[Profile | None] = ContextVar(
+    "_active_profile", default=None
+)
+
+
+@dataclass
+class Stage:
+    """
+    Stage of the rendering of a figure recorded by a :class:`~graphinglib.Profile`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage, or name of the class of the :class:`~graphinglib.Plottable` for the ``"plottable"``
+        category.
+    category : str
+        Category of the stage, either ``"figure"`` for the saving of a figure, ``"stage"`` for the stages of its
+        rendering or ``"plottable"`` for the styling and plotting of a single element.
+    start : float
+        Time at which the stage started, in seconds since the start of the profile.
+    duration : float
+        Time taken by the stage in seconds, including the stages it contains.
+    allocated_blocks : int
+        Number of memory blocks allocated by the interpreter during the stage and not freed by its end.
+    allocated_bytes : int, optional
+        Number of bytes allocated during the stage and not freed by its end, if the memory was traced by the profile.
+    args : dict
+        Details of the stage, such as the file name of a saved figure or the index of the subplot of an element.
+    children : list[Stage]
+        Stages contained in the stage, in the order in which they started.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float = 0.0
+    allocated_blocks: int = 0
+    allocated_bytes: int | None = None
+    args: dict[str, Any] = field(default_factory=dict)
+    children: list[Stage] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Gives the stage and the stages it contains as a dictionary of builtin types.
+        """
+        return {
+            "name": self.name,
+            "category": self.category,
+            "start": self.start,
+            "duration": self.duration,
+            "allocated_blocks": self.allocated_blocks,
+            "allocated_bytes": self.allocated_bytes,
+            "args": self.args,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class Profile:
+    """
+    Timings and memory allocations of the stages of the rendering of the SmartFigures shown or saved in a
+    :func:`~graphinglib.profile` context.
+
+    Parameters
+    ----------
+    trace_memory : bool, optional
+        Whether the number of bytes allocated by each stage is recorded along with the number of memory blocks.
+        Defaults to ``False``.
+
+    Attributes
+    ----------
+    stages : list[Stage]
+        Outermost stages recorded, such as each call to :meth:`~graphinglib.SmartFigure.save`, which contain the stages
+        of the rendering.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.stages: list[Stage] = []
+        self._open_stages: list[Stage] = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def _record(self, name: str, category: str, args: dict[str, Any]) -> Iterator[None]:
+        """
+        Records the time taken and the memory allocated by the code run in the context as a stage contained in the
+        stage being recorded, if any.
+        """
+        stage = Stage(name, category, time.perf_counter() - self._origin, args=args)
+        parent = self._open_stages[-1].children if self._open_stages else self.stages
+        parent.append(stage)
+        self._open_stages.append(stage)
+        traced_bytes = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            traced_bytes = tracemalloc.get_traced_memory()[0]
+        blocks = sys.getallocatedblocks()
+        try:
+            yield
+        finally:
+            stage.allocated_blocks = sys.getallocatedblocks() - blocks
+            stage.duration = time.perf_counter() - self._origin - stage.start
+            if traced_bytes is not None and tracemalloc.is_tracing():
+                stage.allocated_bytes = (
+                    tracemalloc.get_traced_memory()[0] - traced_bytes
+                )
+            self._open_stages.pop()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Gives the recorded stages as a dictionary of builtin types, with the stages contained in each stage under its
+        ``"children"`` key. Times are given in seconds.
+        """
+        return {"stages": [stage.to_dict() for stage in self.stages]}
+
+    def to_json(self, file_name: str | None = None) -> str:
+        """
+        Gives the recorded stages in JSON, as given by :meth:`~graphinglib.Profile.to_dict`.
+
+        Parameters
+        ----------
+        file_name : str, optional
+            Name of the file to write the JSON to.
+
+        Returns
+        -------
+        str
+            The recorded stages in JSON.
+        """
+        return self._dump(self.to_dict(), file_name)
+
+    def to_chrome_trace(self, file_name: str | None = None) -> str:
+        """
+        Gives the recorded stages in the Trace Event Format read by Chrome's ``about:tracing``, Perfetto and
+        Speedscope, as one complete event for each stage. Times are given in microseconds.
+
+        Parameters
+        ----------
+        file_name : str, optional
+            Name of the file to write the trace to.
+
+        Returns
+        -------
+        str
+            The recorded stages in JSON, in the Trace Event Format.
+        """
+        events = []
+        stages = list(reversed(self.stages))
+        while stages:
+            stage = stages.pop()
+            args = {"allocated_blocks": stage.allocated_blocks, **stage.args}
+            if stage.allocated_bytes is not None:
+                args["allocated_bytes"] = stage.allocated_bytes
+            events.append(
+                {
+                    "name": stage.name,
+                    "cat": stage.category,
+                    "ph": "X",
+                    "ts": stage.start * 1e6,
+                    "dur": stage.duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": 0,
+                    "args": args,
+                }
+            )
+            stages.extend(reversed(stage.children))
+        return self._dump({"traceEvents": events, "displayTimeUnit": "ms"}, file_name)
+
+    @staticmethod
+    def _dump(content: dict[str, Any], file_name: str | None) -> str:
+        dumped = json.dumps(content, default=str)
+        if file_name is not None:
+            with open(file_name, "w") as file:
+                file.write(dumped)
+        return dumped
+
+
+@contextmanager
+def profile(trace_memory: bool = False) -> Iterator[Profile]:
+    """
+    Records the time taken by each stage of the rendering of the SmartFigures shown or saved in the context, along
+    with the memory allocated by each stage. The stages include the loading and resolution of the figure style, the
+    styling and plotting of each element, the legends, the constrained layout and each drawing of the figure.
+
+    Parameters
+    ----------
+    trace_memory : bool, optional
+        Whether the number of bytes allocated by each stage is recorded with :mod:`tracemalloc`, which slows down the
+        rendering. The number of memory blocks allocated is always recorded.
+        Defaults to ``False``.
+
+    Yields
+    ------
+    Profile
+        The recorded stages, which can be exported with :meth:`~graphinglib.Profile.to_json` or
+        :meth:`~graphinglib.Profile.to_chrome_trace`.
+    """
+    recorded = Profile(trace_memory)
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    token = _active_profile.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _active_profile.reset(token)
+        if start_tracing:
+            tracemalloc.stop()
+
+
+def _stage(
+    name: str, category: str = "stage", **args: Any
+) -> AbstractContextManager[None]:
+    """
+    Records the code run in the context as a stage of the active profile, if any.
+    """
+    recorded = _active_profile.get()
+    if recorded is None:
+        return nullcontext()
+    return recorded._record(name, category, args)
+
+
+def _profiled(name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    Records each call to the decorated function as a stage of the active profile, if any.
+    """
+
+    def decorator(function: Callable[P, T]) -> Callable[P, T]:
+        @wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            recorded = _active_profile.get()
+            if recorded is None:
+                return function(*args, **kwargs)
+            with recorded._record(name, "stage", {}):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def _profiled_draws(figure: Any) -> Iterator[None]:
+    """
+    Records each drawing of a matplotlib figure in the context as a stage of the active profile, if any. Saving a
+    figure with a tight bounding box draws it once without rendering to measure it, then once more to render it.
+    """
+    if _active_profile.get() is None:
+        yield
+        return
+
+    draw = figure.draw
+
+    def profiled_draw(*args: Any, **kwargs: Any) -> Any:
+        with _stage("draw"):
+            return draw(*args, **kwargs)
+
+    figure.draw = profiled_draw
+    try:
+        yield
+    finally:
+        del figure.draw
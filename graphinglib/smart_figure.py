@@ -2,12 +2,20 @@ from __future__ import annotations as _annotations_
 
 from .inherit import INHERIT, Inherit, is_inherit, resolved, strip_inherit
 
-from collections import OrderedDict
+import os
+import pickle
+import subprocess
+import time
+from collections import ChainMap, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from copy import deepcopy
 from logging import warning
 from shutil import which
 from string import ascii_lowercase
-from collections.abc import Sequence
+from collections.abc import Mapping, MutableMapping, Sequence
+from contextlib import contextmanager, nullcontext
+from io import BytesIO
+from itertools import product
 from typing import (
     Any,
     Callable,
@@ -30,18 +38,27 @@ except ImportError:
     WCS = cast(Any, type("WCSPlaceholder", (), {}))
     Quantity = cast(Any, type("QuantityPlaceholder", (), {}))
 
+try:  # Optional dependency: pypdfium2
+    import pypdfium2 as pdfium
+except ImportError:
+    pass
+
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
+import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.collections import LineCollection
+from matplotlib.colorbar import Colorbar
 from matplotlib.figure import Figure, SubFigure
 from matplotlib.gridspec import GridSpec
 from matplotlib.layout_engine import ConstrainedLayoutEngine
 from matplotlib.legend_handler import HandlerPatch
 from matplotlib.patches import Polygon
 from matplotlib.projections import get_projection_names
-from matplotlib.transforms import ScaledTranslation
+from matplotlib.transforms import Bbox, ScaledTranslation
 from numpy.typing import ArrayLike
 
 from .file_manager import FileLoader, FileUpdater, get_default_style, get_styles
@@ -51,10 +68,13 @@ from .exceptions import (
     InvalidParameterError,
     InvalidParameterTypeError,
     LayoutError,
+    MissingOptionalDependencyError,
+    PlottingError,
     StyleFileError,
     StyleNotFoundError,
     UnsupportedFeatureError,
 )
+from .data_plotting_2d import Heatmap, _require_pypdfium2
 from .graph_elements import Plottable, Text
 from .legend_artists import (
     HandlerMultipleLines,
@@ -63,6 +83,7 @@ from .legend_artists import (
     VerticalLineCollection,
     histogram_legend_artist,
 )
+from .profiling import _profiled, _profiled_draws, _stage
 from .tools import _copy_with_overrides, _require_optional_dependency
 
 T = TypeVar("T")
@@ -76,6 +97,348 @@ def _require_astropy(feature: str = "this feature") -> None:
 
 HAS_ASTROPY = _ASTROPY_AVAILABLE
 
+# Rc parameters read by matplotlib when a figure, its SubFigures and axes are created, which are not applied again when
+# a retained figure is prepared. The other parameters of the figure style are applied to each element as it is plotted.
+_RETAINED_FIGURE_RC_PARAMS = (
+    r"^(figure|axes|axes3d|polaraxes|xaxis|yaxis|xtick|ytick|grid|font|text|mathtext)\."
+)
+
+
+def _layered_params(
+    params: MutableMapping[str, Any], rc_params: Mapping[str, Any]
+) -> ChainMap[str, Any]:
+    """
+    Gives the default parameters of a nested SmartFigure or twin axis, layered over the ones of its parent rather than
+    copied from them. The rc parameters of the nested SmartFigure or twin axis supersede the ones of its parent, and
+    parameters added to the result do not change the parent's.
+    """
+    layered_rc_params = ChainMap[str, Any](dict(rc_params), params["rc_params"])
+    return ChainMap[str, Any]({"rc_params": layered_rc_params}, params)
+
+
+@contextmanager
+def _rc_overrides(rc_params: Mapping[str, Any]) -> Iterator[None]:
+    """
+    Sets rc parameters of matplotlib for the duration of the context. Only these parameters are restored afterwards,
+    instead of all the rc parameters.
+    """
+    previous_rc_params = {key: plt.rcParams[cast(Any, key)] for key in rc_params}
+    plt.rcParams.update(cast(Any, rc_params))
+    try:
+        yield
+    finally:
+        plt.rcParams.update(cast(Any, previous_rc_params))
+
+
+class _ImageSequenceWriter:
+    """Writes each frame of an animation to its own image file, named by formatting a pattern with its index."""
+
+    def __init__(self, pattern: str) -> None:
+        self._pattern = pattern
+        self._number_of_frames = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        plt.imsave(self._pattern.format(self._number_of_frames), frame)
+        self._number_of_frames += 1
+
+    def close(self) -> None:
+        pass
+
+
+class _VideoPipeWriter:
+    """Streams the raw RGBA frames of an animation to an ffmpeg process encoding them to a video file."""
+
+    def __init__(self, file_name: str, fps: float) -> None:
+        ffmpeg_path = which(plt.rcParams["animation.ffmpeg_path"])
+        if ffmpeg_path is None:
+            raise MissingOptionalDependencyError(
+                "Saving animations as videos requires ffmpeg, which was not found. Install ffmpeg or save the "
+                "frames as images with a file name pattern such as 'frame_{:04d}.png'."
+            )
+        self._command = [ffmpeg_path, "-y", "-loglevel", "error"]
+        self._file_name = file_name
+        self._fps = fps
+        self._process: subprocess.Popen | None = None
+
+    def write(self, frame: np.ndarray) -> None:
+        # Most video encoders only accept frames with even dimensions.
+        frame = frame[: frame.shape[0] // 2 * 2, : frame.shape[1] // 2 * 2]
+        if self._process is None:
+            output_options = (
+                [] if self._file_name.endswith(".gif") else ["-pix_fmt", "yuv420p"]
+            )
+            self._process = subprocess.Popen(
+                self._command
+                + ["-f", "rawvideo", "-pix_fmt", "rgba"]
+                + ["-s", f"{frame.shape[1]}x{frame.shape[0]}"]
+                + ["-framerate", str(self._fps), "-i", "pipe:"]
+                + output_options
+                + [self._file_name],
+                stdin=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        assert self._process.stdin is not None
+        try:
+            self._process.stdin.write(np.ascontiguousarray(frame).data)
+        except BrokenPipeError:
+            self.close()
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        _, errors = process.communicate()
+        if process.returncode != 0:
+            raise PlottingError(
+                f"ffmpeg could not encode the animation ({errors.decode(errors='replace').strip()})."
+            )
+
+
+def _initialize_page_worker(rc_params: dict[str, Any]) -> None:
+    """
+    Initializes a process saving pages of a split SmartFigure, which draws them with the Agg backend and starts from
+    the rc parameters of the process that saves the SmartFigure.
+    """
+    plt.switch_backend("agg")
+    plt.rcParams.update(cast(Any, rc_params))
+
+
+def _save_page(
+    page: SmartFigure | bytes,
+    destination: str | PdfPages | None,
+    dpi: int | None,
+    transparent: bool,
+) -> tuple[bytes | None, float]:
+    """
+    Saves a page of a split SmartFigure, given as is or pickled, to a file or a PdfPages object. Without destination,
+    the page is saved as a single-page PDF document, whose content is returned. The time taken to save the page, in
+    seconds, is also returned.
+    """
+    start = time.perf_counter()
+    if isinstance(page, bytes):
+        page = pickle.loads(page)
+    content = None
+    # Every page starts from the same rc parameters, which saving a SmartFigure resets to matplotlib's defaults.
+    with plt.rc_context():
+        if destination is not None:
+            page.save(destination, dpi, transparent)
+        else:
+            buffer = BytesIO()
+            with PdfPages(buffer) as pdf:
+                page.save(pdf, dpi, transparent)
+            content = buffer.getvalue()
+    return content, time.perf_counter() - start
+
+
+class _RetainedFigure:
+    """
+    Matplotlib figure kept by a SmartFigure between saves, along with the gridspecs, SubFigures and axes created to
+    prepare it, in order of creation. As long as the layout of the SmartFigure does not change, the figure is prepared
+    again by taking back these objects in the same order, once the artists drawing the data are removed from it.
+    """
+
+    def __init__(self, figure: Figure, key: bytes) -> None:
+        self.figure = figure
+        self.key = key
+        self._objects: list[Any] = []
+        self._colorbars: list[Colorbar] = []
+        self._subfigure_positions: dict[SubFigure, Bbox] = {}
+        self._reused: Iterator[Any] | None = None
+
+    def get(self, create: Callable[[], T]) -> T:
+        """
+        Gives the next object of the figure, which is created and recorded unless the figure is being reused.
+        """
+        if self._reused is not None:
+            return next(self._reused)
+        new_object = create()
+        if isinstance(new_object, SubFigure):
+            self._subfigure_positions[new_object] = new_object.bbox_relative.frozen()
+        self._objects.append(new_object)
+        return new_object
+
+    def reuse(self) -> None:
+        """
+        Removes the artists added to the figure when it was last prepared, and gives back the recorded objects from now
+        on. The axes are reset to the state in which they were created, apart from the settings applied again when the
+        figure is prepared.
+        """
+        for colorbar in self._colorbars:
+            colorbar.remove()
+        self._colorbars.clear()
+        for ax in self.figure.axes:
+            if ax.legend_ is not None:
+                ax.legend_.set_draggable(False)
+            # The layout is computed again from the positions given by the gridspecs, and aligning shared spines takes
+            # the axes out of the layout
+            subplotspec = ax.get_subplotspec()
+            if subplotspec is not None:
+                ax.set_subplotspec(subplotspec)
+            ax.set_in_layout(True)
+            ax.set_anchor("C")
+            if ax.name != "rectilinear":
+                # Other projections set their own limits and scales, which only clearing the axes gives back
+                ax.clear()
+                continue
+            if ax.legend_ is not None:
+                ax.legend_.remove()
+            for artists in (
+                ax.artists,
+                ax.collections,
+                ax.images,
+                ax.lines,
+                ax.patches,
+                ax.tables,
+                ax.texts,
+            ):
+                for artist in list(artists):
+                    artist.remove()
+            ax.containers.clear()
+            ax.set_prop_cycle(None)
+            # Removes the scales, limits and inversions of the axes, as well as tight autoscaling set by some elements
+            ax.set_xscale("linear")
+            ax.set_yscale("linear")
+            ax.set_xlim(0, 1, auto=True)
+            ax.set_ylim(0, 1, auto=True)
+            ax.autoscale(tight=False)
+            ax.relim()
+        figures: list[Figure | SubFigure] = [self.figure]
+        for figure in figures:
+            figures.extend(figure.subfigs)
+            if isinstance(figure, SubFigure):
+                # The constrained layout moved the SubFigure from where its subplotspec placed it when it was created
+                position = self._subfigure_positions[figure]
+                figure.bbox_relative.p0 = position.p0
+                figure.bbox_relative.p1 = position.p1
+            for legend in list(figure.legends):
+                legend.set_draggable(False)
+                legend.remove()
+            for artists in (
+                figure.artists,
+                figure.lines,
+                figure.patches,
+                figure.texts,
+                figure.images,
+            ):
+                for artist in list(artists):
+                    artist.remove()
+        self._reused = iter(self._objects)
+
+    def stop(self) -> None:
+        """
+        Stops giving back or recording objects once the figure is prepared, and records the colorbars added by the
+        elements, whose axes are the ones not created in place of recorded objects. They are removed before the figure
+        is reused, which gives their space back to the axes they were taken from.
+        """
+        self._reused = None
+        recorded_objects = set(self._objects)
+        self._colorbars = [
+            colorbar
+            for ax in self.figure.axes
+            if ax not in recorded_objects
+            and isinstance(colorbar := getattr(ax, "_colorbar", None), Colorbar)
+        ]
+
+
+def _create_or_reuse(retained: _RetainedFigure | None, create: Callable[[], T]) -> T:
+    """
+    Creates a gridspec, SubFigure or axes of the figure being prepared with the given function, or gives back the one
+    created in its place the last time a retained figure was prepared.
+    """
+    return create() if retained is None else retained.get(create)
+
+
+def _collect_navigable_axes(
+    figure: Figure | SubFigure,
+    plot_axes: list[Axes],
+    axes_ranges: dict[Figure | SubFigure, slice],
+) -> None:
+    """
+    Adds the axes of a figure and of its subfigures to a list, depth-first, skipping the dummy axes which are not
+    navigable. Since the axes of each subfigure follow each other in the list, the range they cover is given for every
+    subfigure, which spares walking through the subfigures again for each nested SmartFigure.
+    """
+    start = len(plot_axes)
+    plot_axes.extend(ax for ax in figure.get_axes() if ax.get_navigate())
+    for subfig in figure.subfigs:
+        _collect_navigable_axes(subfig, plot_axes, axes_ranges)
+    axes_ranges[figure] = slice(start, len(plot_axes))
+
+
+class _ChildGrid(MutableMapping[tuple[slice, slice], "SmartFigure"]):
+    """
+    Child SmartFigures of a SmartFigure used as a layout, by the span of rows and columns they occupy. The children are
+    iterated over in grid order, from top-left to bottom-right, which is sorted again only after the children change.
+    Each occupied cell of the grid is indexed with the span covering it, such that finding the children overlapping a
+    span only looks at the cells of that span.
+    """
+
+    def __init__(self) -> None:
+        self._children: dict[tuple[slice, slice], SmartFigure] = {}
+        self._cells: dict[tuple[int, int], tuple[slice, slice]] = {}
+        self._order: dict[tuple[slice, slice], int] | None = {}
+
+    @staticmethod
+    def _get_cells(span: tuple[slice, slice]) -> Iterator[tuple[int, int]]:
+        rows, cols = span
+        return product(range(rows.start, rows.stop), range(cols.start, cols.stop))
+
+    def __getitem__(self, span: tuple[slice, slice]) -> SmartFigure:
+        return self._children[span]
+
+    def __setitem__(self, span: tuple[slice, slice], child: SmartFigure) -> None:
+        if span not in self._children:
+            cells = list(self._get_cells(span))
+            if any(cell in self._cells for cell in cells):
+                raise LayoutError(
+                    f"The span {span} overlaps with another child SmartFigure."
+                )
+            self._cells.update(dict.fromkeys(cells, span))
+            self._order = None
+        self._children[span] = child
+
+    def __delitem__(self, span: tuple[slice, slice]) -> None:
+        del self._children[span]
+        for cell in self._get_cells(span):
+            del self._cells[cell]
+        self._order = None
+
+    def __iter__(self) -> Iterator[tuple[slice, slice]]:
+        return iter(self._get_order())
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())})"
+
+    def _get_order(self) -> dict[tuple[slice, slice], int]:
+        if self._order is None:
+            spans = sorted(
+                self._children, key=lambda span: (span[0].start, span[1].start)
+            )
+            self._order = {span: index for index, span in enumerate(spans)}
+        return self._order
+
+    def index(self, span: tuple[slice, slice]) -> int:
+        """
+        Gives the position of the child at the given span in grid order.
+        """
+        return self._get_order()[span]
+
+    def overlapping(
+        self, span: tuple[slice, slice]
+    ) -> list[tuple[tuple[slice, slice], SmartFigure]]:
+        """
+        Gives the spans and children overlapping the given span, in the order in which its cells are covered.
+        """
+        spans = dict.fromkeys(
+            self._cells[cell] for cell in self._get_cells(span) if cell in self._cells
+        )
+        return [
+            (existing_span, self._children[existing_span]) for existing_span in spans
+        ]
+
 
 class SmartFigure:
     """
@@ -271,6 +634,26 @@ class SmartFigure:
         for example, to add general notes or labels on the figure.
     """
 
+    # Attributes replaced by the setters of properties, which copy_with leaves out of the copy when they are overridden.
+    _attributes_set_by_properties = {"elements": ("_children", "_leaf_elements")}
+    # Matplotlib objects of the figure being prepared or kept between saves, which copies of the SmartFigure leave out.
+    _matplotlib_attributes = (
+        "_figure",
+        "_gridspec",
+        "_retained_figure",
+        "_retained",
+    )
+    # Attributes that do not change the layout of the figure or are replaced when comparing layouts between saves.
+    _attributes_outside_layout = (
+        "_reference_label_i",
+        "_default_params",
+        "_subplot_p",
+        "_retain_figure",
+        "_leaf_elements",
+        "_children",
+        "_annotations",
+    )
+
     def __init__(
         self,
         num_rows: int = 1,
@@ -318,7 +701,7 @@ class SmartFigure:
     ) -> None:
         self._mode: Literal["leaf", "container"] = "leaf"
         self._leaf_elements: list[Plottable] = []
-        self._children: OrderedDict[tuple[slice, slice], SmartFigure] = OrderedDict()
+        self._children = _ChildGrid()
         self._is_auto_child = False
         self._flatten_in_parent = False
         self.num_rows = num_rows
@@ -366,6 +749,9 @@ class SmartFigure:
         self._figure: Figure | SubFigure | None = None
         self._gridspec: GridSpec | None = None
         self._reference_label_i: int | None = None
+        self._retained_figure: _RetainedFigure | None = None
+        self._retained: _RetainedFigure | None = None
+        self.retain_figure = False
 
         self._ticks: dict[str, Any] = {}
         self._tick_params: dict[str, dict[str, Any]] = {
@@ -390,7 +776,7 @@ class SmartFigure:
 
         self._hidden_spines = None
         self._user_rc_dict: dict[str, Any] = {}
-        self._default_params = {}
+        self._default_params: MutableMapping[str, Any] = {}
         self._subplot_p: dict[
             str, list[Any]
         ] = {}  # used to store the ListOrItem parameters that can be different for each subplot
@@ -1112,6 +1498,30 @@ class SmartFigure:
                 )
         self._hide_default_legend_elements = value
 
+    @property
+    def retain_figure(self) -> bool:
+        """
+        Whether to keep the matplotlib figure and its axes between calls to :meth:`~graphinglib.SmartFigure.save`. When
+        the SmartFigure is saved again without changes to its layout, only the artists of its elements, legends and
+        labels are removed and drawn again, instead of creating the whole figure again. This speeds up saving the same
+        figure repeatedly with new data, for example to update a file during a simulation. Any other change to the
+        SmartFigure, its nested SmartFigures or its style creates a new figure at the next save. Setting this property
+        to ``False`` releases the kept figure.
+
+        .. note::
+            SmartFigures holding objects that cannot be pickled, such as lambda functions, are created again at every
+            save, as their layout cannot be compared between saves.
+        """
+        return self._retain_figure
+
+    @retain_figure.setter
+    def retain_figure(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise InvalidParameterTypeError("retain_figure must be a bool.")
+        self._retain_figure = value
+        if not value:
+            self._retained_figure = None
+
     @property
     def is_single_subplot(self) -> bool:
         """
@@ -1261,7 +1671,6 @@ class SmartFigure:
             element._flatten_in_parent = False
             element._is_auto_child = False
             self._children[key_] = element
-            self._children = self._ordered_children()
             return
 
         normalized = self._normalize_leaf_rhs(element)
@@ -1273,7 +1682,6 @@ class SmartFigure:
             existing_key, existing_child = overlapping[0]
             existing_child._ensure_leaf_mode()
             existing_child._leaf_elements = normalized
-            self._children.move_to_end(existing_key)
             changed_span = existing_key
             changed_child = existing_child
         else:
@@ -1282,7 +1690,6 @@ class SmartFigure:
                 f"Cannot assign a new element to a position that overlaps with multiple subfigures. "
                 f"Please remove the overlapping subfigures first or use a more specific slice."
             )
-        self._children = self._ordered_children()
         self._sync_auto_child_projection(changed_span, changed_child)
 
     def __getitem__(self, key: int | slice | tuple[int | slice, ...]) -> SmartFigure:
@@ -1335,24 +1742,26 @@ class SmartFigure:
 
     def __deepcopy__(self, memo: dict) -> Self:
         """
-        Creates a deep copy of the SmartFigure instance, intentionally excluding the '_figure' and '_gridspec'
-        attributes from the copy. These attributes are matplotlib objects and are not duplicated to avoid issues with
-        copying live figure state.
+        Creates a deep copy of the SmartFigure instance, intentionally excluding the attributes listed in
+        '_matplotlib_attributes' from the copy, such as '_figure' and '_gridspec'. These attributes are matplotlib
+        objects and are not duplicated to avoid issues with copying live figure state.
         """
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        excluded_attrs = ["_figure", "_gridspec"]
         for property_, value in self.__dict__.items():
-            if property_ not in excluded_attrs:
+            if property_ not in self._matplotlib_attributes:
                 result.__dict__[property_] = deepcopy(value, memo)
-        for attr in excluded_attrs:
+        for attr in self._matplotlib_attributes:
             setattr(result, attr, None)
         return result
 
     def copy(self) -> Self:
         """
         Returns a deep copy of the :class:`~graphinglib.SmartFigure` object.
+
+        The data arrays of the figure's elements are shared with the copy rather than duplicated, and are read-only in
+        the copy. New data can still be given to the elements of the copy by assigning new arrays.
         """
         return deepcopy(self)
 
@@ -1365,7 +1774,8 @@ class SmartFigure:
         ----------
         **kwargs
             Public writable properties to override in the copied SmartFigure. The keys should be property names to
-            modify and the values are the new values for those properties.
+            modify and the values are the new values for those properties. The elements of the SmartFigure are not
+            copied when ``elements`` is overridden.
 
         Returns
         -------
@@ -1413,7 +1823,7 @@ class SmartFigure:
             return OrderedDict({(slice(0, 1), slice(0, 1)): list(self._leaf_elements)})
 
         ordered = OrderedDict()
-        for span, child in self._ordered_children().items():
+        for span, child in self._children.items():
             if child._flatten_in_parent:
                 ordered[span] = list(child._leaf_elements)
             else:
@@ -1534,26 +1944,7 @@ class SmartFigure:
         list[tuple[tuple[slice, slice], SmartFigure]]
             A list of tuples, each containing the key and child SmartFigure that overlaps with the specified range.
         """
-        overlapping = []
-        row_slice, col_slice = key
-
-        for existing_key, element in self._children.items():
-            existing_row, existing_col = existing_key
-
-            # Check if there's any overlap
-            row_overlap = not (
-                row_slice.stop <= existing_row.start
-                or row_slice.start >= existing_row.stop
-            )
-            col_overlap = not (
-                col_slice.stop <= existing_col.start
-                or col_slice.start >= existing_col.stop
-            )
-
-            if row_overlap and col_overlap:
-                overlapping.append((existing_key, element))
-
-        return overlapping
+        return self._children.overlapping(key)
 
     def add_elements(
         self,
@@ -1627,7 +2018,6 @@ class SmartFigure:
 
             if len(overlapping) == 0:
                 self._children[key] = self._make_auto_child(element)
-                self._children = self._ordered_children()
                 self._sync_auto_child_projection(key, self._children[key])
                 continue
 
@@ -1675,7 +2065,7 @@ class SmartFigure:
 
     def _ensure_leaf_mode(self) -> None:
         self._mode = "leaf"
-        self._children = OrderedDict()
+        self._children = _ChildGrid()
 
     def _ensure_container_mode(self) -> None:
         if self._mode == "container":
@@ -1696,27 +2086,19 @@ class SmartFigure:
             child._num_rows = 1
             child._num_cols = 1
             child._mode = "leaf"
-            child._children = OrderedDict()
+            child._children = _ChildGrid()
             child._is_auto_child = True
             child._flatten_in_parent = True
         self._mode = "container"
         self._leaf_elements = []
         self._twin_x_axis = None
         self._twin_y_axis = None
-        self._children = OrderedDict()
+        self._children = _ChildGrid()
         if child is not None:
             self._children[(slice(0, 1), slice(0, 1))] = child
 
-    def _ordered_children(self) -> OrderedDict[tuple[slice, slice], SmartFigure]:
-        return OrderedDict(
-            sorted(
-                self._children.items(),
-                key=lambda item: (item[0][0].start, item[0][1].start),
-            )
-        )
-
     def _iter_child_items(self) -> Iterator[tuple[tuple[slice, slice], SmartFigure]]:
-        yield from self._ordered_children().items()
+        yield from self._children.items()
 
     def _make_auto_child(
         self, value: Plottable | Iterable[Plottable | None]
@@ -1742,12 +2124,9 @@ class SmartFigure:
             return
         projection = self._projection
         if isinstance(projection, list):
-            ordered_spans = [
-                existing_span for existing_span, _ in self._iter_child_items()
-            ]
             try:
-                index = ordered_spans.index(span)
-            except ValueError:
+                index = self._children.index(span)
+            except KeyError:
                 index = 0
             if not projection:
                 return
@@ -1816,7 +2195,7 @@ class SmartFigure:
 
     def _set_container_elements(self, value_list: list[Any]) -> None:
         self._ensure_container_mode()
-        self._children = OrderedDict()
+        self._children = _ChildGrid()
         dense = value_list + [None] * (
             self._num_rows * self._num_cols - len(value_list)
         )
@@ -1857,7 +2236,6 @@ class SmartFigure:
                     occupied.add((covered_row, covered_col))
             self._children[span] = child
 
-        self._children = self._ordered_children()
         self._sync_auto_child_projections()
 
     def show(
@@ -1942,6 +2320,8 @@ class SmartFigure:
         dpi: int | None = None,
         transparent: bool = False,
         split_pdf: bool = False,
+        workers: int = 1,
+        progress: Callable[[int, int, float], None] | None = None,
     ) -> Self:
         """
         Saves the :class:`~graphinglib.SmartFigure` to a file.
@@ -1961,32 +2341,89 @@ class SmartFigure:
             .png) should be used.
             Defaults to ``False``.
         split_pdf : bool, optional
-            Whether to save each subplot of the SmartFigure as a separate page in a PDF file.
+            Whether to save each subplot of the SmartFigure as a separate page in a PDF file. If ``file_name``
+            contains a format field, such as ``"page_{:03d}.png"``, each subplot is instead saved to its own file,
+            whose name is formatted with the index of the subplot and whose extension determines the format.
             Defaults to ``False``.
+        workers : int, optional
+            Number of processes saving the pages in parallel when ``split_pdf`` is ``True``. Use ``-1`` to use as many
+            workers as there are CPUs. Saving the pages of a single PDF file in parallel requires the optional
+            ``graphinglib[pdf]`` extra (installs ``pypdfium2``), which merges them in order, and a file name rather
+            than a PdfPages object. Pages that cannot be pickled, for example because they hold lambda functions, are
+            saved in the current process.
+            Defaults to ``1``.
+        progress : Callable[[int, int, float], None], optional
+            Function called after each page is saved when ``split_pdf`` is ``True``, with the index of the page, the
+            number of pages and the time taken to save the page in seconds.
 
         Returns
         -------
         Self
             The same SmartFigure instance, allowing for method chaining.
         """
+        with _stage("save", "figure", file_name=str(file_name)):
+            if split_pdf:
+                self._save_pages(file_name, dpi, transparent, workers, progress)
+                return self
+
+            self._initialize_parent_smart_figure(retain=self._retain_figure)
+            figure = self._figure
+            assert isinstance(figure, Figure)
+            save_kwargs = {
+                "bbox_inches": "tight",
+                "dpi": dpi if dpi is not None else "figure",
+                "transparent": transparent,
+            }
+            with _stage("savefig"), _profiled_draws(figure):
+                if isinstance(file_name, PdfPages):
+                    file_name.savefig(figure, **save_kwargs)
+                else:
+                    # Figure.savefig is used rather than pyplot's, which draws the figure again after saving it.
+                    figure.savefig(file_name, **save_kwargs)
 
-        def recursive_save(pdf_file: PdfPages) -> None:
-            """Recursively saves each element of a SmartFigure to a separate page in the provided PdfPages object."""
-            for element in self._ordered_elements.values():
-                if isinstance(element, (Plottable, list)):
-                    leaf_elements = element if isinstance(element, list) else [element]
-                    subfig = self.copy_with(
-                        elements=leaf_elements,
-                        num_rows=1,
-                        num_cols=1,
-                    )
-                elif isinstance(element, SmartFigure):
-                    subfig = element
-                subfig.save(pdf_file, dpi, transparent)
+            # A retained figure is kept by the SmartFigure, but no longer by pyplot
+            plt.close(figure)
+            plt.rcParams.update(plt.rcParamsDefault)
+            self._figure = None
+            self._gridspec = None
+        return self
 
-        self._initialize_parent_smart_figure()
+    def _get_pages(self) -> list[SmartFigure]:
+        """
+        Gives the SmartFigures saved as separate pages when the SmartFigure is split, one for each of its subplots.
+        """
+        pages = []
+        for element in self._ordered_elements.values():
+            if isinstance(element, SmartFigure):
+                pages.append(element.copy())
+            else:
+                leaf_elements = element if isinstance(element, list) else [element]
+                pages.append(
+                    self.copy_with(elements=leaf_elements, num_rows=1, num_cols=1)
+                )
+        return pages
 
-        if not isinstance(file_name, PdfPages) and split_pdf:
+    def _save_pages(
+        self,
+        file_name: str | PdfPages,
+        dpi: int | None,
+        transparent: bool,
+        workers: int,
+        progress: Callable[[int, int, float], None] | None,
+    ) -> None:
+        """
+        Saves each subplot of the SmartFigure as a separate page of a PDF file, or as a separate file if the file name
+        contains a format field. With more than one worker, the pages are saved in a process pool, and the pages of a
+        PDF file are saved as single-page documents merged in order once they are all saved.
+        """
+        if workers == -1:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise InvalidParameterError(
+                f"workers must be a positive integer or -1, but got {workers}."
+            )
+        is_file_pattern = isinstance(file_name, str) and "{" in file_name
+        if isinstance(file_name, str) and not is_file_pattern:
             if not file_name.endswith(".pdf"):
                 dot_pos = file_name.rfind(".")
                 if dot_pos == -1:  # no extension
@@ -1996,39 +2433,256 @@ class SmartFigure:
                 warning(
                     "File extension was changed to '.pdf' to allow for splitting the figure into PdfPages."
                 )
+            if workers > 1:
+                _require_pypdfium2("Saving the pages of a PDF file in parallel")
+        if isinstance(file_name, PdfPages) and workers > 1:
+            raise IncompatibleArgumentsError(
+                "The pages of a PdfPages object cannot be saved in parallel. Give a file name instead."
+            )
+
+        pages = self._get_pages()
 
-        if split_pdf:
-            if isinstance(file_name, PdfPages):
-                recursive_save(file_name)
+        def report(index: int, duration: float) -> None:
+            if progress is not None:
+                progress(index, len(pages), duration)
+
+        if workers == 1:
+            if is_file_pattern:
+                for index, page in enumerate(pages):
+                    _, duration = _save_page(
+                        page, cast(str, file_name).format(index), dpi, transparent
+                    )
+                    report(index, duration)
             else:
-                pdf_file = PdfPages(file_name)
-                with pdf_file as pdf:
-                    recursive_save(pdf)
+                with (
+                    nullcontext(file_name)
+                    if isinstance(file_name, PdfPages)
+                    else PdfPages(file_name)
+                ) as pdf_file:
+                    for index, page in enumerate(pages):
+                        _, duration = _save_page(page, pdf_file, dpi, transparent)
+                        report(index, duration)
+            return
+
+        page_pdfs: list[bytes | None] = [None] * len(pages)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_page_worker,
+            initargs=(
+                {
+                    key: value
+                    for key, value in plt.rcParams.copy().items()
+                    if key != "backend"
+                },
+            ),
+        ) as executor:
+            futures: dict[Future, int] = {}
+
+            def collect(futures_done: Iterable[Future]) -> None:
+                for future in futures_done:
+                    index = futures.pop(future)
+                    page_pdfs[index], duration = future.result()
+                    report(index, duration)
+
+            for index, page in enumerate(pages):
+                destination = (
+                    cast(str, file_name).format(index) if is_file_pattern else None
+                )
+                try:
+                    pickled_page = pickle.dumps(page)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    page_pdfs[index], duration = _save_page(
+                        page, destination, dpi, transparent
+                    )
+                    report(index, duration)
+                    continue
+                # Pages are pickled as they are submitted, so only a few of them wait to be saved at once.
+                if len(futures) >= 2 * workers:
+                    collect(wait(futures, return_when=FIRST_COMPLETED).done)
+                future = executor.submit(
+                    _save_page, pickled_page, destination, dpi, transparent
+                )
+                futures[future] = index
+            collect(wait(futures).done)
+
+        if not is_file_pattern:
+            page_documents = [pdfium.PdfDocument(page_pdf) for page_pdf in page_pdfs]
+            document = pdfium.PdfDocument.new()
+            for page_document in page_documents:
+                document.import_pages(page_document)
+            document.save(file_name)
+
+    def save_animation(
+        self,
+        file_name: str,
+        frames: Iterable[ArrayLike | Sequence[ArrayLike]],
+        heatmaps: Heatmap | Sequence[Heatmap] | None = None,
+        fps: float = 10,
+        dpi: int | None = None,
+    ) -> Self:
+        """
+        Saves an animation of the :class:`~graphinglib.SmartFigure` in which the values of its
+        :class:`~graphinglib.Heatmap` elements change from frame to frame.
+
+        The figure is only created and drawn once. For each frame, the new values are given to the artists of the
+        Heatmaps, and only these artists (and the elements drawn over them in the same axes) are redrawn on top of
+        the rest of the figure. The color scale of each Heatmap is the one of its first image, unless its
+        ``color_map_range`` is set.
 
+        Parameters
+        ----------
+        file_name : str
+            The name of the file to save the animation to. If it contains a format field, such as
+            ``"frame_{:04d}.png"``, each frame is saved as a separate image whose name is formatted with the index of
+            the frame. Otherwise, the frames are streamed to ``ffmpeg`` (which must be installed, see the
+            ``animation.ffmpeg_path`` rc parameter) and encoded as a video whose format is given by the file extension
+            (e.g. .mp4, .webm, .gif).
+        frames : Iterable[ArrayLike | Sequence[ArrayLike]]
+            The values of the Heatmaps for each frame. When a single Heatmap is animated, each frame is an array of
+            the shape of its image. Otherwise, each frame is a sequence with one such array per Heatmap, in the order
+            of ``heatmaps``. Frames can be produced lazily by a generator.
+        heatmaps : Heatmap | Sequence[Heatmap], optional
+            The Heatmaps of the SmartFigure to animate. If None, all the Heatmaps of the SmartFigure and of its nested
+            SmartFigures are animated.
+        fps : float, optional
+            The number of frames per second of videos.
+            Defaults to ``10``.
+        dpi : int, optional
+            The resolution of the frames in dots per inch. If None, the figure's DPI is used.
+
+        Returns
+        -------
+        Self
+            The same SmartFigure instance, allowing for method chaining.
+        """
+        if heatmaps is None:
+            heatmaps = [
+                element
+                for element in self._iter_all_plottables_recursive()
+                if isinstance(element, Heatmap)
+            ]
+        elif isinstance(heatmaps, Heatmap):
+            heatmaps = [heatmaps]
         else:
-            save_kwargs = {
-                "bbox_inches": "tight",
-                "dpi": dpi if dpi is not None else "figure",
-                "transparent": transparent,
+            heatmaps = list(heatmaps)
+        if not heatmaps:
+            raise InvalidOperationError(
+                "The SmartFigure must contain at least one Heatmap to be animated."
+            )
+        if fps <= 0:
+            raise InvalidParameterError(f"fps must be positive, but got {fps}.")
+        if "{" in file_name:
+            writer = _ImageSequenceWriter(file_name)
+        else:
+            writer = _VideoPipeWriter(file_name, fps)
+
+        self._initialize_parent_smart_figure()
+        figure = self._figure
+        assert isinstance(figure, Figure)
+        try:
+            if dpi is not None:
+                figure.set_dpi(dpi)
+            canvas = FigureCanvasAgg(figure)
+            lowest_z_orders: dict[Axes, float] = {}
+            for heatmap in heatmaps:
+                handle = heatmap.handle
+                axes = None if handle is None else handle.axes
+                # The figure of a SubFigure is the root figure.
+                if (
+                    handle is None
+                    or not isinstance(axes, Axes)
+                    or axes.figure.figure is not figure
+                ):
+                    raise IncompatibleArgumentsError(
+                        "Every animated Heatmap must be an element of the SmartFigure."
+                    )
+                lowest_z_orders[axes] = min(
+                    lowest_z_orders.get(axes, np.inf), handle.get_zorder()
+                )
+            # Blitting draws the animated artists over a static background, so anything drawn
+            # over a Heatmap must be redrawn with it.
+            animated_artists = {
+                axes: sorted(
+                    (
+                        artist
+                        for artist in axes.get_children()
+                        if artist.get_visible() and artist.get_zorder() >= z_order
+                    ),
+                    key=lambda artist: artist.get_zorder(),
+                )
+                for axes, z_order in lowest_z_orders.items()
             }
-            if isinstance(file_name, PdfPages):
-                file_name.savefig(self._figure, **save_kwargs)
-            else:
-                plt.savefig(file_name, **save_kwargs)
+            for artists in animated_artists.values():
+                for artist in artists:
+                    artist.set_animated(True)
+            canvas.draw()
+            background = canvas.copy_from_bbox(figure.bbox)
+            # Frames are cropped to the tight bounding box of the figure, like saved figures, but
+            # within the canvas.
+            tight_bbox = (
+                figure.get_tightbbox(canvas.get_renderer())
+                .padded(plt.rcParams["savefig.pad_inches"])
+                .transformed(figure.dpi_scale_trans)
+            )
+            width, height = canvas.get_width_height()
+            columns = slice(
+                max(0, int(np.floor(tight_bbox.x0))),
+                min(width, int(np.ceil(tight_bbox.x1))),
+            )
+            rows = slice(
+                max(0, height - int(np.ceil(tight_bbox.y1))),
+                min(height, height - int(np.floor(tight_bbox.y0))),
+            )
 
-        plt.close()
-        plt.rcParams.update(plt.rcParamsDefault)
-        self._figure = None
-        self._gridspec = None
+            number_of_frames = 0
+            for frame in frames:
+                images = (
+                    [cast(ArrayLike, frame)]
+                    if len(heatmaps) == 1
+                    else list(cast(Sequence[ArrayLike], frame))
+                )
+                if len(images) != len(heatmaps):
+                    raise IncompatibleArgumentsError(
+                        f"Each frame must contain one image per animated Heatmap ({len(heatmaps)}), but got "
+                        f"{len(images)}."
+                    )
+                for heatmap, image in zip(heatmaps, images):
+                    heatmap._show_frame(image)
+                canvas.restore_region(background)
+                for axes, artists in animated_artists.items():
+                    for artist in artists:
+                        axes.draw_artist(artist)
+                writer.write(np.asarray(canvas.buffer_rgba())[rows, columns])
+                number_of_frames += 1
+            if number_of_frames == 0:
+                raise InvalidParameterError("frames must contain at least one frame.")
+        finally:
+            try:
+                writer.close()
+            finally:
+                plt.close(figure)
+                plt.rcParams.update(plt.rcParamsDefault)
+                self._figure = None
+                self._gridspec = None
         return self
 
+    @_profiled("initialize figure")
     def _initialize_parent_smart_figure(
         self,
+        retain: bool = False,
     ) -> None:
         """
         Initializes the parent :class:`~graphinglib.SmartFigure` for plotting. This method initializes the appropriate
         figure style, parameters and matplotlib figure and calls the :meth:`~graphinglib.SmartFigure._prepare_figure`
         method.
+
+        Parameters
+        ----------
+        retain : bool, optional
+            Whether to keep the matplotlib figure once it is prepared, and to prepare the figure kept by the previous
+            call again if the layout of the SmartFigure did not change. The figure is not closed by the caller in this
+            case, and is not registered in pyplot when it is reused.
+            Defaults to ``False``.
         """
         if is_inherit(self._figure_style):
             self._figure_style = get_default_style()
@@ -2058,11 +2712,42 @@ class SmartFigure:
         )  # Custom rc parameters supersede the defaults
         self._fill_in_rc_params(is_matplotlib_style)
 
+        # The retained figure is reused if the layout of the SmartFigure and the rc parameters of its axes are the same
+        layout_key = None
+        if retain:
+            try:
+                layout_key = pickle.dumps(
+                    (
+                        self._get_layout_state(),
+                        dict(plt.rcParams.find_all(_RETAINED_FIGURE_RC_PARAMS)),
+                    )
+                )
+            except (pickle.PicklingError, AttributeError, TypeError):
+                pass
+        if self._retained_figure is not None and (
+            layout_key is None or self._retained_figure.key != layout_key
+        ):
+            self._retained_figure = None
+
+        # Matplotlib requests a drawing of the canvas every time the limits of an axis shared between subfigures
+        # change, which the canvases of pyplot fulfil by drawing the whole figure. The figure is therefore prepared
+        # and laid out on a canvas which doesn't draw, and only attached to its own canvas, or to pyplot, once it is
+        # prepared. This leaves a single rasterisation of the figure, when it is shown or saved.
+        attached_canvas: FigureCanvasBase | None = None
         # The following try/except removes lingering figures when errors occur during the plotting process
         try:
-            self._figure = plt.figure(
-                constrained_layout=True, figsize=resolved(self._size)
-            )
+            if self._retained_figure is not None:
+                self._figure = self._retained_figure.figure
+                attached_canvas = self._figure.canvas
+                FigureCanvasBase(self._figure)
+                self._retained_figure.reuse()
+            else:
+                self._figure = Figure(
+                    constrained_layout=True, figsize=resolved(self._size)
+                )
+                if layout_key is not None:
+                    self._retained_figure = _RetainedFigure(self._figure, layout_key)
+            self._retained = self._retained_figure
             layout_engine = self._figure.get_layout_engine()
             assert isinstance(layout_engine, ConstrainedLayoutEngine)
             layout_engine.set(w_pad=0, h_pad=0)
@@ -2070,15 +2755,29 @@ class SmartFigure:
                 "start_index", 0
             )
             self._prepare_figure(is_matplotlib_style)
-            self._figure.canvas.draw()
-            self._align_shared_x_spines()
+            with _stage("constrained layout"):
+                layout_engine.execute(self._figure)
+            if self._has_shared_x_spines():
+                with _stage("align shared x spines"):
+                    self._align_shared_x_spines()
+            if attached_canvas is not None:
+                self._figure.set_canvas(attached_canvas)
+            else:
+                plt.figure(self._figure)
         except Exception as e:
-            plt.close()
+            if isinstance(self._figure, Figure):
+                plt.close(self._figure)
+            self._retained_figure = None
             raise e
+        finally:
+            if self._retained is not None:
+                self._retained.stop()
+                self._retained = None
 
         self._reset_params_to_default(self, parent_figure_params_to_reset)
         self._default_params = {}
 
+    @_profiled("prepare figure")
     def _prepare_figure(
         self,
         is_matplotlib_style: bool = False,
@@ -2138,13 +2837,16 @@ class SmartFigure:
 
         figure = self._figure
         assert figure is not None
-        gridspec = figure.add_gridspec(
-            self._num_rows,
-            self._num_cols,
-            wspace=self._width_padding,
-            hspace=self._height_padding,
-            width_ratios=self._width_ratios,
-            height_ratios=self._height_ratios,
+        gridspec = _create_or_reuse(
+            self._retained,
+            lambda: figure.add_gridspec(
+                self._num_rows,
+                self._num_cols,
+                wspace=self._width_padding,
+                hspace=self._height_padding,
+                width_ratios=self._width_ratios,
+                height_ratios=self._height_ratios,
+            ),
         )
         self._gridspec = gridspec
 
@@ -2161,57 +2863,60 @@ class SmartFigure:
             self._ordered_elements.items()
         ):
             if isinstance(element, SmartFigure):
-                element._default_params = deepcopy(self._default_params)
-                subfig_params_to_reset = []
-                parent_rc_params = None
-                if is_matplotlib_style:
-                    parent_rc_params = plt.rcParams.copy()
-                    plt.rcParams.update(element._user_rc_dict)
-                else:
-                    element._default_params["rc_params"].update(element._user_rc_dict)
-                    plt.rcParams.update(element._default_params["rc_params"])
-                    subfig_params_to_reset = element._fill_in_missing_params(
-                        element
-                    )  # Fill "default" parameters
-
-                # Check whether sub_x_labels/sub_y_labels/sub_titles are set and can be given as the main
-                # x_label/y_label/title of the nested SmartFigure
-                sub_params = [
-                    self._subplot_p[sub_param][subplot_i]
-                    for sub_param in ["sub_x_labels", "sub_y_labels", "subtitles"]
-                ]  # list containing the sub_x_label, sub_y_label and subtitle for the current subplot
-                # subfig_none_params contains True if the corresponding parameter is None in the nested SmartFigure
-                subfig_none_params = [
-                    getattr(element, param) is None
-                    for param in ["x_label", "y_label", "title"]
-                ]
-                for attr, param_is_none, sub_param in zip(
-                    ["x_label", "y_label", "title"], subfig_none_params, sub_params
-                ):
-                    if param_is_none and sub_param is not None:
-                        setattr(element, attr, sub_param)
-
-                subfig = figure.add_subfigure(gridspec[rows, cols])
-                element._figure = subfig  # associates the current subfigure with the nested SmartFigure
-                element._reference_label_i = self._reference_label_i
-                legend_info = element._prepare_figure(
-                    is_matplotlib_style=is_matplotlib_style,
-                    make_legend=(not self._general_legend and make_legend),
+                # The nested SmartFigure's parameters are layered over its parent's instead of being copied, and only
+                # its own rc parameters are changed while it is prepared
+                element._default_params = _layered_params(
+                    self._default_params, element._user_rc_dict
                 )
-
-                self._reference_label_i = element._reference_label_i
-                default_labels += legend_info["labels"]["default"]
-                default_handles += legend_info["handles"]["default"]
-                custom_labels += legend_info["labels"]["custom"]
-                custom_handles += legend_info["handles"]["custom"]
-
-                if is_matplotlib_style:
-                    plt.rcParams.update(cast(Any, parent_rc_params))
-                else:
-                    plt.rcParams.update(
-                        self._default_params["rc_params"]
-                    )  # Return to the parent SmartFigure's rc params
-                    element._reset_params_to_default(element, subfig_params_to_reset)
+                with _rc_overrides(element._user_rc_dict):
+                    subfig_params_to_reset = []
+                    if not is_matplotlib_style:
+                        subfig_params_to_reset = element._fill_in_missing_params(
+                            element
+                        )  # Fill "default" parameters
+
+                    # Check whether sub_x_labels/sub_y_labels/sub_titles are set and can be given as the main
+                    # x_label/y_label/title of the nested SmartFigure
+                    sub_params = [
+                        self._subplot_p[sub_param][subplot_i]
+                        for sub_param in ["sub_x_labels", "sub_y_labels", "subtitles"]
+                    ]  # list containing the sub_x_label, sub_y_label and subtitle for the current subplot
+                    # subfig_none_params contains True if the corresponding parameter is None in the nested SmartFigure
+                    subfig_none_params = [
+                        getattr(element, param) is None
+                        for param in ["x_label", "y_label", "title"]
+                    ]
+                    for attr, param_is_none, sub_param in zip(
+                        ["x_label", "y_label", "title"], subfig_none_params, sub_params
+                    ):
+                        if param_is_none and sub_param is not None:
+                            setattr(element, attr, sub_param)
+
+                    subfig = _create_or_reuse(
+                        self._retained,
+                        lambda: figure.add_subfigure(gridspec[rows, cols]),
+                    )
+                    element._figure = subfig  # associates the current subfigure with the nested SmartFigure
+                    element._reference_label_i = self._reference_label_i
+                    element._retained = self._retained
+                    try:
+                        legend_info = element._prepare_figure(
+                            is_matplotlib_style=is_matplotlib_style,
+                            make_legend=(not self._general_legend and make_legend),
+                        )
+                    finally:
+                        element._retained = None
+
+                    self._reference_label_i = element._reference_label_i
+                    default_labels += legend_info["labels"]["default"]
+                    default_handles += legend_info["handles"]["default"]
+                    custom_labels += legend_info["labels"]["custom"]
+                    custom_handles += legend_info["handles"]["custom"]
+
+                    if not is_matplotlib_style:
+                        element._reset_params_to_default(
+                            element, subfig_params_to_reset
+                        )
                 element._default_params = {}
                 for param, param_was_none in zip(
                     ["x_label", "y_label", "title"], subfig_none_params
@@ -2221,35 +2926,46 @@ class SmartFigure:
 
             elif isinstance(element, (Plottable, list)):
                 current_elements = element if isinstance(element, list) else [element]
-                subfig = figure.add_subfigure(gridspec[rows, cols])
-                ax = subfig.add_subplot(
-                    sharex=ax
-                    if self._share_x
-                    else None,  # This enables the coherent zoom and pan of the axes
-                    sharey=ax
-                    if self._share_y
-                    else None,  # but it does not remove the ticklabels
-                    projection=self._subplot_p["projection"][subplot_i],
+                subfig = _create_or_reuse(
+                    self._retained,
+                    lambda: figure.add_subfigure(gridspec[rows, cols]),
+                )
+                ax = _create_or_reuse(
+                    self._retained,
+                    lambda: subfig.add_subplot(
+                        sharex=ax
+                        if self._share_x
+                        else None,  # This enables the coherent zoom and pan of the axes
+                        sharey=ax
+                        if self._share_y
+                        else None,  # but it does not remove the ticklabels
+                        projection=self._subplot_p["projection"][subplot_i],
+                    ),
                 )
 
                 # Plotting loop
                 z_order = 2
                 for index, current_element in enumerate(current_elements):
                     if current_element is not None:
-                        params_to_reset = []
-                        if not is_matplotlib_style:
-                            params_to_reset = self._fill_in_missing_params(
-                                current_element
-                            )
-                        current_element._plot_element(
-                            ax,
-                            z_order,
-                            cycle_color=cycle_colors[index % num_cycle_colors],
-                        )
-                        if not is_matplotlib_style:
-                            self._reset_params_to_default(
-                                current_element, params_to_reset
+                        with _stage(
+                            type(current_element).__name__,
+                            "plottable",
+                            subplot=subplot_i,
+                        ):
+                            params_to_reset = []
+                            if not is_matplotlib_style:
+                                params_to_reset = self._fill_in_missing_params(
+                                    current_element
+                                )
+                            current_element._plot_element(
+                                ax,
+                                z_order,
+                                cycle_color=cycle_colors[index % num_cycle_colors],
                             )
+                            if not is_matplotlib_style:
+                                self._reset_params_to_default(
+                                    current_element, params_to_reset
+                                )
                         try:
                             if current_element.label is not None:
                                 default_handles.append(current_element.handle)
@@ -2348,45 +3064,37 @@ class SmartFigure:
                     [self._twin_x_axis, self._twin_y_axis], start=1
                 ):
                     if twin_axis is not None:
-                        twin_axis._default_params = deepcopy(self._default_params)
-                        twin_axis_params_to_reset = []
-                        parent_rc_params = None
-                        if is_matplotlib_style:
-                            parent_rc_params = plt.rcParams.copy()
-                            plt.rcParams.update(cast(Any, twin_axis._user_rc_dict))
-                        else:
-                            twin_axis._default_params["rc_params"].update(
-                                twin_axis._user_rc_dict
-                            )
-                            plt.rcParams.update(twin_axis._default_params["rc_params"])
-                            twin_axis_params_to_reset = (
-                                twin_axis._fill_in_missing_params(
-                                    twin_axis, self._figure_style
-                                )
-                            )
-
-                        twin_labels, twin_handles = twin_axis._prepare_twin_axis(
-                            fig_axes=ax,
-                            is_matplotlib_style=is_matplotlib_style,
-                            cycle_colors=cycle_colors,
-                            is_y=(i == 2),
-                            z_order=200
-                            * i,  # increment z_order to avoid overlap with the main axes
-                            figure_style=self._figure_style,
+                        twin_axis._default_params = _layered_params(
+                            self._default_params, twin_axis._user_rc_dict
                         )
-                        default_labels.extend(twin_labels)
-                        default_handles.extend(twin_handles)
+                        twin_axis._retained = self._retained
+                        with _rc_overrides(twin_axis._user_rc_dict):
+                            twin_axis_params_to_reset = []
+                            if not is_matplotlib_style:
+                                twin_axis_params_to_reset = (
+                                    twin_axis._fill_in_missing_params(
+                                        twin_axis, self._figure_style
+                                    )
+                                )
 
-                        if is_matplotlib_style:
-                            plt.rcParams.update(cast(Any, parent_rc_params))
-                        else:
-                            plt.rcParams.update(
-                                self._default_params["rc_params"]
-                            )  # Return to the original rc params
-                            twin_axis._reset_params_to_default(
-                                twin_axis, twin_axis_params_to_reset
+                            twin_labels, twin_handles = twin_axis._prepare_twin_axis(
+                                fig_axes=ax,
+                                is_matplotlib_style=is_matplotlib_style,
+                                cycle_colors=cycle_colors,
+                                is_y=(i == 2),
+                                z_order=200
+                                * i,  # increment z_order to avoid overlap with the main axes
+                                figure_style=self._figure_style,
                             )
+                            default_labels.extend(twin_labels)
+                            default_handles.extend(twin_handles)
+
+                            if not is_matplotlib_style:
+                                twin_axis._reset_params_to_default(
+                                    twin_axis, twin_axis_params_to_reset
+                                )
                         twin_axis._default_params = {}
+                        twin_axis._retained = None
 
                 # Axes legend
                 if self._subplot_p["hide_default_legend_elements"][subplot_i]:
@@ -2414,15 +3122,16 @@ class SmartFigure:
                         else:
                             legend_ax = ax
                         assert legend_ax is not None
-                        try:
-                            _legend = legend_ax.legend(
-                                draggable=True,
-                                **legend_params,
-                            )
-                        except Exception:
-                            _legend = legend_ax.legend(
-                                **legend_params,
-                            )
+                        with _stage("legend", subplot=subplot_i):
+                            try:
+                                _legend = legend_ax.legend(
+                                    draggable=True,
+                                    **legend_params,
+                                )
+                            except Exception:
+                                _legend = legend_ax.legend(
+                                    **legend_params,
+                                )
                         _legend.set_zorder(10000)
                     default_labels, default_handles = [], []
                     custom_labels, custom_handles = [], []
@@ -2433,7 +3142,10 @@ class SmartFigure:
                 )
 
         # Set a general axis for adding general labels/title and controlling padding
-        general_ax = figure.add_subplot(gridspec[:, :], frameon=False)
+        general_ax = _create_or_reuse(
+            self._retained,
+            lambda: figure.add_subplot(gridspec[:, :], frameon=False),
+        )
         general_ax.grid(False)
         general_ax.set_facecolor((0, 0, 0, 0))
         general_ax.set_zorder(-1)
@@ -2471,7 +3183,8 @@ class SmartFigure:
         if self._annotations is not None:
             z_order = 5000
             for annotation in self._annotations:
-                annotation._plot_element(cast(Any, figure), z_order)
+                with _stage(type(annotation).__name__, "plottable"):
+                    annotation._plot_element(cast(Any, figure), z_order)
                 z_order += 5
 
         # Legend parameters
@@ -2488,15 +3201,16 @@ class SmartFigure:
             handles = default_handles + custom_handles
             if labels and self._show_legend:
                 legend_params = self._get_legend_params(labels, handles, 0)
-                try:
-                    _legend = figure.legend(
-                        **legend_params,
-                        draggable=True,
-                    )
-                except Exception:
-                    _legend = figure.legend(
-                        **legend_params,
-                    )
+                with _stage("legend"):
+                    try:
+                        _legend = figure.legend(
+                            **legend_params,
+                            draggable=True,
+                        )
+                    except Exception:
+                        _legend = figure.legend(
+                            **legend_params,
+                        )
                 _legend.set_zorder(10000)
             legend_info = {
                 "labels": {"default": [], "custom": []},
@@ -2572,93 +3286,100 @@ class SmartFigure:
                 subplot_p[param] = [value] * self_length
         self._subplot_p = subplot_p
 
-    def _get_all_axes_recursive(
-        self, figure_or_subfigure: Figure | SubFigure
-    ) -> list[Axes]:
+    def _get_layout_state(self) -> dict[str, Any]:
         """
-        Recursively collect all axes from a figure and its subfigures, avoiding duplicates. This is used for aligning
-        the spines when sharing axes.
+        Gives the state of the SmartFigure that determines the gridspecs, SubFigures and axes created to prepare its
+        figure, which is compared between saves when the figure is retained. The elements are replaced by their type,
+        and the nested SmartFigures and twin axes by their own layout state.
         """
-        all_axes = []
-        previous_axes = set()
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in self._matplotlib_attributes + self._attributes_outside_layout
+        }
+        state["_leaf_elements"] = [type(element) for element in self._leaf_elements]
+        state["_children"] = [
+            (key, child._get_layout_state()) for key, child in self._children.items()
+        ]
+        for twin_axis_name in ("_twin_x_axis", "_twin_y_axis"):
+            twin_axis = state[twin_axis_name]
+            if twin_axis is not None:
+                state[twin_axis_name] = twin_axis._get_layout_state()
+        return state
 
-        # Get direct axes from this figure/subfigure
-        direct_axes = figure_or_subfigure.get_axes()
-        for ax in direct_axes:
-            ax_id = id(ax)
-            if (
-                ax_id not in previous_axes and ax.get_navigate()
-            ):  # skip dummy axes which are not navigable
-                all_axes.append(ax)
-                previous_axes.add(ax_id)
-
-        # Recursively get axes from subfigures if they exist
-        if hasattr(figure_or_subfigure, "subfigs"):
-            for subfig in figure_or_subfigure.subfigs:
-                subfig_axes = self._get_all_axes_recursive(
-                    subfig
-                )  # only axes in subfigures are extracted
-                for ax in subfig_axes:
-                    ax_id = id(ax)
-                    if ax_id not in previous_axes:
-                        all_axes.append(ax)
-                        previous_axes.add(ax_id)
-
-        return all_axes
-
-    def _align_shared_x_spines(self) -> None:
+    def _has_shared_x_spines(self) -> bool:
+        """
+        Tells whether the SmartFigure or one of its nested SmartFigures shares its x axes between rows, in which case
+        the spines need to be aligned once the layout of the figure is computed.
+        """
+        if self._share_x and self._num_rows > 1:
+            return True
+        return any(
+            not child._flatten_in_parent and child._has_shared_x_spines()
+            for child in self._children.values()
+        )
+
+    def _align_shared_x_spines(
+        self,
+        plot_axes: list[Axes] | None = None,
+        axes_ranges: dict[Figure | SubFigure, slice] | None = None,
+    ) -> None:
         """
         Aligns subplot spines when sharing x axes. This method solves the constrained_layout behavior of misaligning the
         edge of subplots to fill the entire grid space, which leads to misaligned spines even when sharing the x axes.
+
+        Parameters
+        ----------
+        plot_axes : list[Axes], optional
+            Axes of the whole figure, as given by :func:`_collect_navigable_axes`. They are collected once by the parent
+            SmartFigure and passed down to the nested SmartFigures.
+        axes_ranges : dict[Figure | SubFigure, slice], optional
+            Range of ``plot_axes`` covered by each figure and subfigure.
         """
+        figure = self._figure
+        if figure is None:
+            return
+        if plot_axes is None or axes_ranges is None:
+            plot_axes, axes_ranges = [], {}
+            _collect_navigable_axes(figure, plot_axes, axes_ranges)
+
         for child in self._children.values():
             if not child._flatten_in_parent:
-                child._align_shared_x_spines()
+                child._align_shared_x_spines(plot_axes, axes_ranges)
 
         tolerance = 0.3  # allowed difference between axes to consider them to be in the same column
         if self._share_x and self._num_rows > 1:
             try:
-                figure = self._figure
-                assert figure is not None
-                plot_axes = self._get_all_axes_recursive(figure)
-                if len(plot_axes) <= 1:
+                figure_axes = plot_axes[axes_ranges[figure]]
+                if len(figure_axes) <= 1:
                     return
 
-                # Group axes by column by looking at their center positions with get_position()
-                groups = []
-                for ax in plot_axes:
-                    pos = ax.get_position()
-                    center = pos.x0 + pos.width / 2
-
-                    ax_placed = False  # whether the axis has been found close enough to an existing group
-                    for group in groups:
-                        ref_pos = group[0].get_position()
-                        ref_center = ref_pos.x0 + ref_pos.width / 2
-
-                        if abs(center - ref_center) < tolerance:
-                            group.append(ax)
-                            ax_placed = True
-                            break
-
-                    if not ax_placed:
-                        groups.append([ax])
-
-                for group in groups:
+                # Group axes by column by sorting their center positions, a new column being started once an axis is
+                # too far from the first axis of the current column
+                bounds = np.array([ax.get_position().bounds for ax in figure_axes])
+                centers = bounds[:, 0] + bounds[:, 2] / 2
+                order = np.argsort(centers, kind="stable")
+                group_starts = []
+                group_center = -np.inf
+                for i, center in enumerate(centers[order]):
+                    if center - group_center >= tolerance:
+                        group_starts.append(i)
+                        group_center = center
+
+                for group in np.split(order, group_starts[1:]):
                     if len(group) <= 1:
                         continue
 
-                    positions = [ax.get_position() for ax in group]
-                    rightmost_left_edge = max(pos.x0 for pos in positions)
-                    leftmost_right_edge = min(pos.x0 + pos.width for pos in positions)
+                    rightmost_left_edge = bounds[group, 0].max()
+                    leftmost_right_edge = (bounds[group, 0] + bounds[group, 2]).min()
                     aligned_size = leftmost_right_edge - rightmost_left_edge
-                    for ax in group:
-                        current_pos = ax.get_position()
-                        ax.set_position(
+                    for i in group:
+                        figure_axes[i].set_position(
                             (
                                 rightmost_left_edge,
-                                current_pos.y0,
+                                bounds[i, 1],
                                 aligned_size,
-                                current_pos.height,
+                                bounds[i, 3],
                             )
                         )
 
@@ -2926,6 +3647,7 @@ class SmartFigure:
                 legend_params.update({"loc": legend_loc})
         return legend_params
 
+    @_profiled("resolve style")
     def _fill_in_missing_params(self, element: SmartFigure | Plottable) -> list[str]:
         """
         Fills in the missing parameters for a :class:`~graphinglib.SmartFigure` or a :class:`~graphinglib.Plottable`
@@ -4545,6 +5267,9 @@ class SmartTwinAxis:
         :class:`~graphinglib.SmartFigure` class for more details.
     """
 
+    # See SmartFigure._attributes_set_by_properties.
+    _attributes_set_by_properties = {"elements": ("_elements",)}
+
     def __init__(
         self,
         label: str | None = None,
@@ -4570,10 +5295,11 @@ class SmartTwinAxis:
         self._line_width = None
         self._hide_spine = None
         self._user_rc_dict: dict[str, Any] = {}
-        self._default_params = {}
+        self._default_params: MutableMapping[str, Any] = {}
         self._axes: Axes | None = (
             None  # used for keeping a reference to the Axes which enables drawing the legend on top
         )
+        self._retained: _RetainedFigure | None = None
 
     @property
     def label(self) -> str | None:
@@ -4773,7 +5499,7 @@ class SmartTwinAxis:
         """
         # Create the twin axis
         if is_y:
-            ax = fig_axes.twinx()
+            ax = _create_or_reuse(self._retained, fig_axes.twinx)
             ax_set_label, ax_set_lim, ax_set_scale, spine_str = (
                 ax.set_ylabel,
                 ax.set_ylim,
@@ -4781,7 +5507,7 @@ class SmartTwinAxis:
                 "right",
             )
         else:
-            ax = fig_axes.twiny()
+            ax = _create_or_reuse(self._retained, fig_axes.twiny)
             ax_set_label, ax_set_lim, ax_set_scale, spine_str = (
                 ax.set_xlabel,
                 ax.set_xlim,
@@ -4827,19 +5553,20 @@ class SmartTwinAxis:
         labels, handles = [], []
         for index, element in enumerate(self._elements):
             if isinstance(element, Plottable):
-                params_to_reset = []
-                if not is_matplotlib_style:
-                    params_to_reset = self._fill_in_missing_params(
-                        element, figure_style
-                    )
+                with _stage(type(element).__name__, "plottable"):
+                    params_to_reset = []
+                    if not is_matplotlib_style:
+                        params_to_reset = self._fill_in_missing_params(
+                            element, figure_style
+                        )
 
-                element._plot_element(
-                    ax,
-                    z_order,
-                    cycle_color=cycle_colors[index % num_cycle_colors],
-                )
-                if not is_matplotlib_style:
-                    self._reset_params_to_default(element, params_to_reset)
+                    element._plot_element(
+                        ax,
+                        z_order,
+                        cycle_color=cycle_colors[index % num_cycle_colors],
+                    )
+                    if not is_matplotlib_style:
+                        self._reset_params_to_default(element, params_to_reset)
                 try:
                     if element.label is not None:
                         handles.append(element.handle)
@@ -4854,6 +5581,19 @@ class SmartTwinAxis:
 
         return labels, handles
 
+    def _get_layout_state(self) -> dict[str, Any]:
+        """
+        Gives the state of the twin axis that determines how it is prepared, with its elements replaced by their type.
+        See :meth:`~graphinglib.SmartFigure._get_layout_state`.
+        """
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in ("_axes", "_retained", "_default_params", "_elements")
+        }
+        state["_elements"] = [type(element) for element in self._elements]
+        return state
+
     def _customize_ticks(
         self,
         is_y: bool,
@@ -4919,6 +5659,7 @@ class SmartTwinAxis:
                 top=False,
             )
 
+    @_profiled("resolve style")
     def _fill_in_missing_params(
         self,
         element: SmartFigure | SmartTwinAxis | Plottable,
@@ -7,6 +7,7 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+import numpy as np
 from matplotlib.colors import to_rgba_array
 
 from .exceptions import MissingOptionalDependencyError
@@ -25,9 +26,59 @@ def _require_optional_dependency(
         )
 
 
+def _is_shareable_array(value: Any) -> bool:
+    """
+    Tells whether a value is a NumPy array whose buffer can be shared between copies. Arrays of Python objects and
+    masked arrays are still deep-copied, since their elements or mask could be modified in place.
+    """
+    return (
+        isinstance(value, np.ndarray)
+        and not isinstance(value, np.ma.MaskedArray)
+        and not value.dtype.hasobject
+    )
+
+
+def _read_only_view(array: np.ndarray) -> np.ndarray:
+    """
+    Gives a read-only view of an array, or the array itself if it is already read-only.
+    """
+    if not array.flags.writeable:
+        return array
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _share_data_arrays(instance: Any, memo: dict[int, Any]) -> None:
+    """
+    Lets a deep copy of an instance share the NumPy arrays held by its attributes instead of copying their data.
+
+    The arrays held by the instance's attributes, including the ones nested in lists, tuples and dictionaries such as
+    cached results, are given to the copy through ``memo`` as read-only views of the same buffers, so that the copy
+    cannot modify the data of the instance. The instance's own arrays are left as they are. New data is given to the
+    copy by assigning new arrays, which leaves the instance unchanged.
+    """
+
+    def share(value: Any) -> None:
+        if _is_shareable_array(value):
+            memo.setdefault(id(value), _read_only_view(value))
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                share(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                share(item)
+
+    for value in instance.__dict__.values():
+        share(value)
+
+
 def _copy_with_overrides(instance: T, **kwargs: Any) -> T:
     """
     Returns a deep copy of an instance with selected public writable properties overridden.
+
+    The attributes listed for an overridden property in the ``_attributes_set_by_properties`` mapping of the
+    instance's class are replaced by its setter, so they are left out of the copy rather than copied and discarded.
     """
     class_name = instance.__class__.__name__
     properties: dict[str, property] = {}
@@ -62,7 +113,15 @@ def _copy_with_overrides(instance: T, **kwargs: Any) -> T:
             )
         raise AttributeError(f"{class_name} has no public writable property '{key}'.")
 
-    new_copy = deepcopy(instance)
+    memo: dict[int, Any] = {}
+    attributes_set_by_properties = getattr(
+        instance, "_attributes_set_by_properties", {}
+    )
+    for key in kwargs:
+        for attribute in attributes_set_by_properties.get(key, ()):
+            value = instance.__dict__[attribute]
+            memo[id(value)] = type(value)()
+    new_copy = deepcopy(instance, memo)
     for key, value in kwargs.items():
         setattr(new_copy, key, value)
     return new_copy
@@ -1,13 +1,33 @@
 import unittest
 from random import random
+from unittest.mock import patch
 
 from graphinglib import INHERIT
-from graphinglib.exceptions import IncompatibleArgumentsError
+from graphinglib.exceptions import (
+    IncompatibleArgumentsError,
+    InvalidOperationError,
+    InvalidParameterError,
+)
 from matplotlib.collections import PathCollection
 from matplotlib.colors import to_hex, to_rgba
 from matplotlib.pyplot import close, sca, subplots
-from numpy import allclose, array, linspace, ndarray, pi, sin
-
+from numpy import (
+    allclose,
+    array,
+    array_equal,
+    array_split,
+    diff,
+    histogram,
+    linspace,
+    ndarray,
+    pi,
+    shares_memory,
+    sin,
+    std,
+)
+from numpy.random import normal
+
+from graphinglib import data_plotting_1d
 from graphinglib.data_plotting_1d import Curve, Histogram, Scatter
 from graphinglib.figure import Figure
 from graphinglib.fits import FitFromPolynomial
@@ -397,6 +417,21 @@ class TestCurve(unittest.TestCase):
         self.assertListEqual(list(curve_copy._x_data), list(self.testCurve._x_data))
         self.assertListEqual(list(curve_copy._y_data), list(self.testCurve._y_data))
 
+    def test_copy_shares_data(self):
+        curve_copy = self.testCurve.copy()
+        self.assertTrue(shares_memory(curve_copy.y_data, self.testCurve.y_data))
+        with self.assertRaises(ValueError):
+            curve_copy.y_data[0] = 1
+        original_y_data = self.testCurve.y_data.copy()
+        curve_copy.y_data = curve_copy.y_data + 1
+        self.assertTrue(array_equal(self.testCurve.y_data, original_y_data))
+        self.assertTrue(array_equal(curve_copy.y_data, original_y_data + 1))
+
+    def test_copy_leaves_original_data_writable(self):
+        _ = self.testCurve.copy()
+        self.testCurve.y_data[0] = 5
+        self.assertEqual(self.testCurve.y_data[0], 5)
+
     def test_create_slice_x(self):
         curve = Curve.from_function(lambda x: x**2, -10, 10, number_of_points=100)
         curve_slice = curve.create_slice_x(-5, 5)
@@ -1086,6 +1121,90 @@ class TestHistogram(unittest.TestCase):
         self.assertEqual(len(ax2.collections), 0)
         self.assertEqual(len(ax1.collections), 2)
 
+    def test_from_chunks_matches_full_histogram(self):
+        data = normal(2, 3, 10_000)
+        full = Histogram(data, bins=linspace(-10, 14, 25), normalize=False)
+        streamed = Histogram.from_chunks(
+            array_split(data, 7), bins=24, bin_range=(-10, 14), normalize=False
+        )
+        self.assertTrue(array_equal(streamed.bin_heights, full.bin_heights))
+        self.assertTrue(allclose(streamed.bin_edges, full.bin_edges))
+        self.assertAlmostEqual(streamed.mean, full.mean)
+        self.assertAlmostEqual(streamed.standard_deviation, full.standard_deviation)
+
+    def test_from_chunks_normalized(self):
+        data = normal(0, 1, 1000)
+        full = Histogram(data, bins=linspace(-5, 5, 21), normalize=True)
+        streamed = Histogram.from_chunks(
+            [data[:300], data[300:]], bins=20, bin_range=(-5, 5), normalize=True
+        )
+        self.assertTrue(allclose(streamed.bin_heights, full.bin_heights))
+
+    def test_from_chunks_requires_range_for_integer_bins(self):
+        with self.assertRaises(InvalidParameterError):
+            Histogram.from_chunks([[1, 2, 3]], bins=10)
+
+    def test_from_chunks_does_not_keep_data(self):
+        streamed = Histogram.from_chunks([[1, 2], [3]], bins=[0, 2, 4])
+        with self.assertRaises(InvalidOperationError):
+            _ = streamed.data
+        with self.assertRaises(InvalidOperationError):
+            streamed.bins = 5
+
+    def test_update_streamed_histogram(self):
+        streamed = Histogram.from_chunks([[1, 2]], bins=[0, 2, 4], normalize=False)
+        streamed.update(array([[3, 3], [1, 5]]))
+        self.assertListEqual(list(streamed.bin_heights), [2, 3])
+        self.assertAlmostEqual(streamed.mean, 2.5)
+        self.assertAlmostEqual(streamed.standard_deviation, std([1, 2, 3, 3, 1, 5]))
+
+    def test_update_appends_data(self):
+        hist = Histogram([1, 2, 3], bins=[0, 2, 4], normalize=False)
+        hist.update([3.5])
+        self.assertListEqual(list(hist.data), [1, 2, 3, 3.5])
+        self.assertListEqual(list(hist.bin_heights), [1, 3])
+
+    def test_plot_streamed_histogram(self):
+        streamed = Histogram.from_chunks(
+            [[0.5, 1.5], [1.5, 2.5]], bins=[0, 1, 2, 3], normalize=False
+        )
+        streamed.add_pdf(show_mean=True, show_std=True)
+        _, ax = subplots()
+        streamed._plot_element(ax, 0)
+        heights = [patch.get_height() for patch in ax.patches]
+        close("all")
+        self.assertListEqual(heights, [1, 2, 1])
+
+    def test_uniform_bins_match_numpy_histogram(self):
+        for data in (normal(0, 1, 10_000), array([0.1 * i for i in range(1000)])):
+            for bins in (1, 7, 10, 33):
+                heights, edges = histogram(data, bins)
+                hist = Histogram(data, bins, normalize=False)
+                self.assertTrue(array_equal(hist.bin_heights, heights))
+                self.assertTrue(array_equal(hist.bin_edges, edges))
+
+    def test_uniform_bins_parallel_accumulation(self):
+        data = normal(0, 1, 10_000)
+        with (
+            patch.object(data_plotting_1d, "_PARALLEL_HISTOGRAM_THRESHOLD", 100),
+            patch.object(data_plotting_1d, "_HISTOGRAM_BLOCK_SIZE", 1000),
+            patch.object(data_plotting_1d.os, "cpu_count", return_value=4),
+        ):
+            counts, _ = data_plotting_1d._histogram_counts(data, 20)
+        self.assertTrue(array_equal(counts, histogram(data, 20)[0]))
+
+    def test_density_derived_from_cached_counts(self):
+        hist = Histogram(normal(0, 1, 1000), 10, normalize=False)
+        counts = hist.bin_heights
+        with patch.object(
+            data_plotting_1d, "_histogram_counts", side_effect=AssertionError
+        ):
+            hist.normalize = True
+            density = hist.bin_heights
+            hist._normalize = False
+            self.assertIs(hist.bin_heights, counts)
+        self.assertAlmostEqual(sum(density * diff(hist.bin_edges)), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
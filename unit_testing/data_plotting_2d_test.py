@@ -4,12 +4,30 @@ import unittest
 from importlib.util import find_spec
 from unittest.mock import patch
 
+import contourpy
 import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.colors import to_rgba
-
-from graphinglib.data_plotting_2d import Contour, Heatmap, Stream, VectorField
-from graphinglib.exceptions import InvalidParameterError, PlottingError
+from scipy.interpolate import griddata
+from scipy.spatial import KDTree
+
+from graphinglib.data_plotting_2d import (
+    Contour,
+    Heatmap,
+    ScatteredGridder,
+    Stream,
+    VectorField,
+    _axes_pixel_size,
+    _block_reduce,
+    _evaluate_on_grid,
+    _trace_streamlines,
+)
+from graphinglib.exceptions import (
+    IncompatibleArgumentsError,
+    InvalidOperationError,
+    InvalidParameterError,
+    PlottingError,
+)
 from graphinglib.figure import Figure
 
 HAS_PYPDFIUM2 = find_spec("pypdfium2") is not None
@@ -297,6 +315,214 @@ class TestHeatmap(unittest.TestCase):
         self.assertTrue(np.array_equal(heatmap._image, fake_image))
         self.assertFalse(heatmap._show_color_bar)
 
+    def test_from_memmap_builds_and_reuses_pyramid(self):
+        image = np.add.outer(np.arange(300), np.arange(200)).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "image.npy")
+            np.save(path, image)
+            with patch("graphinglib.data_plotting_2d._PYRAMID_MINIMUM_SIZE", 50):
+                heatmap = Heatmap.from_memmap(path)
+                levels = heatmap._pyramid.levels
+                self.assertEqual(
+                    [level.shape for level in levels],
+                    [(300, 200), (150, 100), (75, 50), (38, 25)],
+                )
+                self.assertTrue(np.allclose(levels[1][0, 0], image[:2, :2].mean()))
+                self.assertEqual(heatmap._pyramid.value_range, (0, 498))
+                self.assertTrue(os.path.isdir(path + ".pyramid"))
+                with patch(
+                    "graphinglib.data_plotting_2d._halve_image",
+                    side_effect=AssertionError,
+                ):
+                    reopened = Heatmap.from_memmap(path)
+                self.assertEqual(len(reopened._pyramid.levels), 4)
+
+    def test_from_memmap_raw_file_requires_shape(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "image.raw")
+            np.arange(12, dtype=np.int16).tofile(path)
+            with self.assertRaises(InvalidParameterError):
+                Heatmap.from_memmap(path)
+            heatmap = Heatmap.from_memmap(path, shape=(3, 4), dtype=np.int16)
+            self.assertEqual(
+                heatmap.image.tolist(), np.arange(12).reshape(3, 4).tolist()
+            )
+
+    def test_from_memmap_displays_level_and_region_of_view(self):
+        image = np.random.rand(400, 600).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "image.npy")
+            np.save(path, image)
+            with patch("graphinglib.data_plotting_2d._PYRAMID_MINIMUM_SIZE", 50):
+                heatmap = Heatmap.from_memmap(path, show_color_bar=False)
+            with plt.rc_context({"savefig.dpi": "figure"}):
+                fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+                heatmap._plot_element(ax, 0)
+                displayed = ax.images[0]
+                # The full image is shown from a level with at least one pixel per display pixel.
+                self.assertLess(displayed.get_array().shape[1], 600)
+                self.assertGreaterEqual(
+                    displayed.get_array().shape[1], ax.get_window_extent().width
+                )
+                self.assertEqual(ax.get_xlim(), (-0.5, 599.5))
+                self.assertEqual(displayed.get_clim(), heatmap._pyramid.value_range)
+
+                ax.set_xlim(10, 30)
+                ax.set_ylim(50, 20)
+                self.assertEqual(displayed.get_array().shape, (31, 21))
+                self.assertTrue(
+                    np.array_equal(displayed.get_array(), image[20:51, 10:31])
+                )
+                self.assertEqual(ax.get_xlim(), (10, 30))
+            plt.close(fig)
+
+    def test_copy_shares_memory_mapped_image(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "image.npy")
+            np.save(path, np.zeros((10, 10)))
+            heatmap = Heatmap.from_memmap(path)
+            heatmap_copy = heatmap.copy()
+            self.assertTrue(np.shares_memory(heatmap_copy.image, heatmap.image))
+            self.assertIs(heatmap_copy._pyramid, heatmap._pyramid)
+
+    def test_copy_leaves_original_image_writable(self):
+        heatmap = Heatmap(np.zeros((3, 3)))
+        heatmap_copy = heatmap.copy()
+        heatmap.image[0, 0] = 1
+        self.assertEqual(heatmap.image[0, 0], 1)
+        with self.assertRaises(ValueError):
+            heatmap_copy.image[0, 0] = 2
+
+    def test_block_reduce(self):
+        image = np.arange(35, dtype=float).reshape(5, 7)
+        for method, function in (("mean", np.mean), ("max", np.max), ("min", np.min)):
+            reduced = _block_reduce(image, (2, 3), method)
+            expected = [
+                [
+                    function(image[row : row + 2, column : column + 3])
+                    for column in (0, 3, 6)
+                ]
+                for row in (0, 2, 4)
+            ]
+            self.assertTrue(np.allclose(reduced, expected))
+
+    def test_large_image_downsampled_to_axes_resolution(self):
+        image = np.random.rand(1000, 1200)
+        heatmap = Heatmap(image, show_color_bar=False, downsampling="max")
+        with plt.rc_context({"savefig.dpi": "figure"}):
+            fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+            heatmap._plot_element(ax, 0)
+            fig.canvas.draw()
+            width, height = _axes_pixel_size(ax)
+        displayed = ax.images[0].get_array()
+        self.assertGreaterEqual(displayed.shape[0], height)
+        self.assertLess(displayed.shape[0], 2 * height)
+        self.assertGreaterEqual(displayed.shape[1], width)
+        self.assertLess(displayed.shape[1], 2 * width)
+        self.assertEqual(displayed.max(), image.max())
+        self.assertEqual(ax.images[0].get_extent(), [-0.5, 1199.5, 999.5, -0.5])
+
+        # The reduced image is reused when plotting again at the same resolution.
+        cached = heatmap._downsampling_cache[1]
+        with (
+            plt.rc_context({"savefig.dpi": "figure"}),
+            patch(
+                "graphinglib.data_plotting_2d._block_reduce",
+                side_effect=AssertionError,
+            ),
+        ):
+            heatmap._plot_element(ax, 0)
+            fig.canvas.draw()
+        self.assertIs(heatmap._downsampling_cache[1], cached)
+        plt.close(fig)
+
+    def test_downsampling_factor_computed_after_layout(self):
+        heatmap = Heatmap(
+            np.random.rand(1000, 1000), show_color_bar=False, downsampling="mean"
+        )
+        with plt.rc_context({"savefig.dpi": "figure"}):
+            fig, ax = plt.subplots(figsize=(4, 4), dpi=50, layout="constrained")
+            heatmap._plot_element(ax, 0)
+            ax.set_title("Title\n" * 10)
+            fig.canvas.draw()
+            width, height = _axes_pixel_size(ax)
+        displayed = ax.images[0].get_array()
+        self.assertEqual(displayed.shape, (-(-1000 // (1000 // height)),) * 2)
+        self.assertEqual(height, width)
+        plt.close(fig)
+
+    def test_downsampling_disabled_by_default(self):
+        self.assertIsNone(Heatmap(np.zeros((2, 2))).downsampling)
+
+    def test_downsampling_disabled(self):
+        heatmap = Heatmap(np.random.rand(1000, 1000), downsampling=None)
+        fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+        heatmap._plot_element(ax, 0)
+        self.assertEqual(ax.images[0].get_array().shape, (1000, 1000))
+        plt.close(fig)
+        with self.assertRaises(InvalidParameterError):
+            heatmap.downsampling = "median"
+
+    def test_downsampled_color_scale_uses_full_image_range(self):
+        image = np.zeros((2000, 2000))
+        image[1000, 1000] = 100
+        with plt.rc_context({"savefig.dpi": "figure"}):
+            fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+            Heatmap(image, show_color_bar=False, downsampling="mean")._plot_element(
+                ax, 0
+            )
+            Heatmap(
+                image,
+                show_color_bar=False,
+                color_map_range=(0, 10),
+                downsampling="mean",
+            )._plot_element(ax, 0)
+            fig.canvas.draw()
+        self.assertLess(ax.images[0].get_array().max(), 100)
+        self.assertEqual(ax.images[0].get_clim(), (0, 100))
+        self.assertEqual(ax.images[1].get_clim(), (0, 10))
+        plt.close(fig)
+
+    def test_downsampled_integer_rgb_keeps_data_type(self):
+        image = np.random.randint(0, 256, (600, 600, 3), dtype=np.uint8)
+        heatmap = Heatmap(image, downsampling="mean")
+        with plt.rc_context({"savefig.dpi": "figure"}):
+            fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+            heatmap._plot_element(ax, 0)
+            fig.canvas.draw()
+        self.assertEqual(ax.images[0].get_array().dtype, np.uint8)
+        self.assertLess(ax.images[0].get_array().shape[0], 600)
+        plt.close(fig)
+
+    def test_show_frame(self):
+        image = np.random.rand(600, 600)
+        heatmap = Heatmap(image, downsampling="mean")
+        with self.assertRaises(InvalidOperationError):
+            heatmap._show_frame(image)
+        with plt.rc_context({"savefig.dpi": "figure"}):
+            fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+            heatmap._plot_element(ax, 0)
+            fig.canvas.draw()
+        plotted_shape = heatmap.handle.get_array().shape
+        self.assertLess(plotted_shape[0], 600)
+        heatmap._show_frame(np.ones((600, 600)))
+        self.assertEqual(heatmap.handle.get_array().shape, plotted_shape)
+        self.assertTrue(np.allclose(heatmap.handle.get_array(), 1))
+        self.assertIs(heatmap.image, image)
+        with self.assertRaises(IncompatibleArgumentsError):
+            heatmap._show_frame(np.ones((10, 10)))
+        plt.close(fig)
+
+    def test_show_frame_pcolormesh(self):
+        x_mesh, y_mesh = np.meshgrid(np.linspace(0, 1, 6), np.linspace(0, 2, 5))
+        heatmap = Heatmap(np.zeros((5, 6)), x_mesh=x_mesh, y_mesh=y_mesh)
+        fig, ax = plt.subplots()
+        heatmap._plot_element(ax, 0)
+        frame = np.arange(30).reshape(5, 6)
+        heatmap._show_frame(frame)
+        self.assertTrue(np.array_equal(heatmap.handle.get_array(), frame))
+        plt.close(fig)
+
 
 class TestVectorField(unittest.TestCase):
     def test_init(self):
@@ -412,6 +638,52 @@ class TestVectorField(unittest.TestCase):
         self.assertEqual(vector_field_copy._make_angles_axes_independent, True)
         self.assertEqual(vector_field_copy._color, "black")
 
+    def test_decimation(self):
+        x = np.linspace(0, 1, 400)
+        x_grid, y_grid = np.meshgrid(x, x)
+        vector_field = VectorField(
+            x_grid, y_grid, np.ones_like(x_grid), x_grid, arrow_density=10
+        )
+        fig, ax = plt.subplots(figsize=(4, 2))
+        vector_field._plot_element(ax, 0)
+        quiver = ax.collections[0]
+        bbox = ax.get_window_extent()
+        width, height = bbox.width / fig.dpi, bbox.height / fig.dpi
+        self.assertLessEqual(len(quiver.U), round(10 * width) * round(10 * height))
+        self.assertGreater(len(quiver.U), 100)
+        self.assertTrue(np.allclose(quiver.U, 1))
+        plt.close(fig)
+        x_data, _, u_data, v_data = vector_field._decimated_data((1, 2))
+        self.assertEqual(u_data.shape, (20, 10))
+        # Block means of u = 1 and v = x are taken at the mean positions of the blocks
+        self.assertTrue(np.allclose(v_data, x_data))
+        self.assertIs(vector_field._decimated_data((1, 2))[0], x_data)
+        vector_field.decimation = "stride"
+        x_data, _, _, v_data = vector_field._decimated_data((1, 2))
+        self.assertTrue(np.isin(x_data, x).all())
+        self.assertTrue(np.allclose(v_data, x_data))
+        vector_field.u_data = 2 * vector_field.u_data
+        self.assertTrue(np.allclose(vector_field._decimated_data((1, 2))[2], 2))
+        with self.assertRaises(InvalidParameterError):
+            vector_field.decimation = "median"
+        with self.assertRaises(InvalidParameterError):
+            vector_field.arrow_density = 0
+
+    def test_decimation_of_other_layouts(self):
+        x = np.linspace(0, 1, 300)
+        y = np.linspace(0, 2, 200)
+        u = np.zeros((200, 300))
+        vector_field = VectorField(x, y, u, u, arrow_density=10)
+        _, y_data, u_data, _ = vector_field._decimated_data((1, 2))
+        self.assertEqual(u_data.shape, (20, 10))
+        self.assertTrue(np.allclose(y_data[:, 0], y_data[:, -1]))
+        x_grid, y_grid = np.meshgrid(x, y, indexing="ij")
+        vector_field = VectorField(x_grid, y_grid, u.T, u.T, arrow_density=10)
+        self.assertEqual(vector_field._decimated_data((1, 2))[2].shape, (10, 20))
+        scattered = VectorField(x, x, x, x, arrow_density=5)
+        self.assertEqual(len(scattered._decimated_data((1, 2))[0]), 50)
+        self.assertIs(scattered._decimated_data((10, 10))[0], scattered.x_data)
+
 
 class TestContour(unittest.TestCase):
     def test_init(self):
@@ -476,6 +748,77 @@ class TestContour(unittest.TestCase):
         fig.add_elements(contour)
         fig._prepare_figure()
 
+    def test_cached_geometry_matches_matplotlib(self):
+        x = np.linspace(0, 6, 120)
+        z = np.sin(x[None, :]) * np.cos(1.3 * x[:, None])
+        for filled in (True, False):
+            contour = Contour(z, levels=8, filled=filled, show_color_bar=False)
+            fig, (ax_1, ax_2) = plt.subplots(1, 2)
+            contour._plot_element(ax_1, 0)
+            expected = (ax_2.contourf if filled else ax_2.contour)(z, levels=8)
+            plotted = ax_1.collections[0]
+            self.assertTrue(np.array_equal(plotted.levels, expected.levels))
+            for path, expected_path in zip(plotted.get_paths(), expected.get_paths()):
+                self.assertTrue(np.array_equal(path.vertices, expected_path.vertices))
+            self.assertEqual(ax_1.get_xlim(), ax_2.get_xlim())
+            plt.close(fig)
+
+    def test_geometry_is_cached(self):
+        z = np.random.rand(30, 40)
+        contour = Contour(z, levels=[0.25, 0.5, 0.75], filled=False)
+        lines = contour.get_contour_lines()
+        self.assertEqual(list(lines), [0.25, 0.5, 0.75])
+        self.assertEqual(lines[0.5][0].shape[1], 2)
+        with patch("contourpy.contour_generator") as contour_generator:
+            self.assertIs(contour.get_contour_lines()[0.5], lines[0.5])
+            fig, ax = plt.subplots()
+            contour._plot_element(ax, 0)
+            plt.close(fig)
+        contour_generator.assert_not_called()
+        contour.z_data = 1 - z
+        self.assertIsNot(contour.get_contour_lines()[0.5], lines[0.5])
+        filled = contour.get_filled_contours()
+        self.assertEqual(list(filled), [(0.25, 0.5), (0.5, 0.75)])
+        vertices, codes = filled[(0.25, 0.5)][0]
+        self.assertEqual(len(vertices), len(codes))
+        with self.assertRaises(InvalidParameterError):
+            contour.get_contour_lines(workers=0)
+
+    def test_geometry_cache_depends_on_generator_options(self):
+        contour = Contour(np.random.rand(30, 40), levels=5, filled=False)
+        lines = contour.get_contour_lines()
+        level = next(iter(lines))
+        # The range of the data is only computed with the first geometry.
+        with patch.object(np.ma, "masked_invalid", side_effect=AssertionError):
+            self.assertIs(contour.get_contour_lines()[level], lines[level])
+        threaded_lines = contour.get_contour_lines(workers=2)
+        self.assertEqual(list(threaded_lines), list(lines))
+        self.assertIsNot(threaded_lines[level], lines[level])
+        for algorithm, corner_mask in (("mpl2014", False), ("mpl2005", True)):
+            with (
+                plt.rc_context(
+                    {"contour.algorithm": algorithm, "contour.corner_mask": corner_mask}
+                ),
+                patch(
+                    "contourpy.contour_generator", wraps=contourpy.contour_generator
+                ) as contour_generator,
+            ):
+                contour.get_contour_lines()
+            contour_generator.assert_called_once()
+            options = contour_generator.call_args.kwargs
+            self.assertEqual(options["name"], algorithm)
+            self.assertEqual(
+                options["corner_mask"], None if algorithm == "mpl2005" else corner_mask
+            )
+
+    def test_threaded_geometry(self):
+        x = np.linspace(-1, 1, 200)
+        contour = Contour(np.hypot(x[None, :], x[:, None]), levels=[0.5])
+        lines = contour.get_contour_lines(workers=3)[0.5]
+        self.assertGreater(len(lines), 1)
+        radii = np.hypot(*np.concatenate(lines).T / 199 * 2 - 1)
+        self.assertTrue(np.allclose(radii, 0.5, atol=0.01))
+
 
 class TestStream(unittest.TestCase):
     def test_init(self):
@@ -584,6 +927,423 @@ class TestStream(unittest.TestCase):
         self.assertEqual(stream_copy._color_map, "viridis")
         self.assertEqual(stream_copy._arrow_size, 2)
 
+    def test_streamlines_follow_uniform_field(self):
+        x, y = np.linspace(0, 4, 20), np.linspace(-1, 1, 15)
+        stream = Stream(x, y, np.ones((15, 20)), np.zeros((15, 20)))
+        lines = stream.get_streamlines()
+        self.assertGreater(len(lines), 0)
+        for line in lines:
+            self.assertEqual(line.shape[1], 2)
+            self.assertTrue(np.allclose(line[:, 1], line[0, 1]))
+            self.assertTrue(np.all(np.diff(line[:, 0]) > 0))
+            self.assertTrue(np.all((line[:, 0] >= 0) & (line[:, 0] <= 4)))
+
+    def test_streamlines_match_streamplot_density(self):
+        x_grid, y_grid = np.meshgrid(np.linspace(0, 11, 30), np.linspace(0, 11, 30))
+        u, v = np.cos(x_grid * 0.2), np.sin(y_grid * 0.3)
+        _, ax = plt.subplots()
+        expected = len(ax.streamplot(x_grid, y_grid, u, v).lines.get_paths())
+        number_of_lines = len(Stream(x_grid, y_grid, u, v).get_streamlines())
+        self.assertLess(abs(number_of_lines - expected), 0.25 * expected)
+        plt.close()
+
+    def test_streamlines_follow_streamplot_lines(self):
+        x = np.linspace(-1, 1, 40)
+        x_grid, y_grid = np.meshgrid(x, x)
+        for u, v in ((-y_grid, x_grid), (np.cos(3 * x_grid), np.sin(3 * y_grid))):
+            _, ax = plt.subplots()
+            paths = ax.streamplot(x_grid, y_grid, u, v).lines.get_paths()
+            plt.close()
+            expected = KDTree(np.concatenate([path.vertices for path in paths]))
+            points = np.concatenate(Stream(x_grid, y_grid, u, v).get_streamlines())
+            distances = expected.query(points)[0]
+            # Lines without error control stay within a cell of the 30x30 occupancy mask of streamplot's.
+            mask_cell = 2 / 29
+            self.assertLess(np.percentile(distances, 95), mask_cell / 2)
+            self.assertLess(distances.max(), mask_cell)
+
+    def test_default_color_is_first_of_property_cycle(self):
+        x_grid, y_grid = np.meshgrid(np.linspace(0, 11, 30), np.linspace(0, 11, 30))
+        stream = Stream(x_grid, y_grid, np.cos(x_grid * 0.2), np.sin(y_grid * 0.3))
+        with plt.rc_context({"axes.prop_cycle": plt.cycler(color=["red", "blue"])}):
+            _, ax = plt.subplots()
+            stream._plot_element(ax, 0)
+            self.assertEqual(tuple(stream.handle.get_color()[0]), to_rgba("red"))
+            plt.close()
+
+    def test_streamlines_are_cached(self):
+        x_grid, y_grid = np.meshgrid(np.linspace(0, 11, 30), np.linspace(0, 11, 30))
+        stream = Stream(x_grid, y_grid, np.cos(x_grid * 0.2), np.sin(y_grid * 0.3))
+        with patch(
+            "graphinglib.data_plotting_2d._trace_streamlines",
+            wraps=_trace_streamlines,
+        ) as trace:
+            for _ in range(2):
+                _, ax = plt.subplots()
+                stream._plot_element(ax, 0)
+                plt.close()
+            number_of_calls = trace.call_count
+            stream.get_streamlines()
+            self.assertEqual(trace.call_count, number_of_calls)
+            stream.density = 2
+            stream.get_streamlines()
+            self.assertGreater(trace.call_count, number_of_calls)
+            number_of_calls = trace.call_count
+            stream.u_data = -stream.u_data
+            stream.get_streamlines()
+            self.assertGreater(trace.call_count, number_of_calls)
+
+    def test_plot_element_draws_cached_lines(self):
+        x_grid, y_grid = np.meshgrid(np.linspace(0, 11, 30), np.linspace(0, 11, 30))
+        stream = Stream(
+            x_grid, y_grid, np.cos(x_grid * 0.2), np.sin(y_grid * 0.3), line_width=1
+        )
+        _, ax = plt.subplots()
+        stream._plot_element(ax, 3)
+        lines = stream.get_streamlines()
+        self.assertIs(ax.collections[0], stream.handle)
+        self.assertEqual(len(stream.handle.get_segments()), len(lines))
+        self.assertEqual(len(ax.patches), len(lines))
+        self.assertEqual(ax.patches[0].get_zorder(), 3)
+        self.assertTrue(np.allclose(ax.get_xlim(), (0, 11)))
+        plt.close()
+
+    def test_plot_element_with_color_array(self):
+        x_grid, y_grid = np.meshgrid(np.linspace(0, 11, 30), np.linspace(0, 11, 30))
+        u, v = np.cos(x_grid * 0.2), np.sin(y_grid * 0.3)
+        stream = Stream(x_grid, y_grid, u, v, color=np.hypot(u, v), color_map="plasma")
+        _, ax = plt.subplots()
+        stream._plot_element(ax, 0)
+        number_of_segments = sum(len(line) - 1 for line in stream.get_streamlines())
+        self.assertEqual(len(stream.handle.get_array()), number_of_segments)
+        self.assertEqual(stream.handle.get_cmap().name, "plasma")
+        with self.assertRaises(IncompatibleArgumentsError):
+            stream._color = np.ones((3, 3))
+            stream._plot_element(ax, 0)
+        plt.close()
+
+    def test_invalid_grid(self):
+        with self.assertRaises(InvalidParameterError):
+            Stream(
+                [0, 1, 3], [0, 1], np.ones((2, 3)), np.ones((2, 3))
+            ).get_streamlines()
+        with self.assertRaises(IncompatibleArgumentsError):
+            Stream(
+                [0, 1, 2], [0, 1], np.ones((3, 2)), np.ones((3, 2))
+            ).get_streamlines()
+
+
+class TestEvaluateOnGrid(unittest.TestCase):
+    def setUp(self):
+        self.x = np.linspace(0, 3, 70)
+        self.y = np.linspace(-1, 2, 45)
+        self.x_grid, self.y_grid = np.meshgrid(self.x, self.y)
+
+    def test_tiles_match_meshgrid_evaluation(self):
+        with patch("graphinglib.data_plotting_2d._FUNCTION_TILE_SIZE", 100):
+            (z,) = _evaluate_on_grid(np.hypot, self.x, self.y)
+        self.assertEqual(z.shape, (45, 70))
+        self.assertTrue(np.array_equal(z, np.hypot(self.x_grid, self.y_grid)))
+
+    def test_function_of_one_coordinate_is_broadcast(self):
+        (z,) = _evaluate_on_grid(lambda x, y: np.sin(x), self.x, self.y)
+        self.assertTrue(np.array_equal(z, np.sin(self.x_grid)))
+
+    def test_function_without_broadcasting_gets_grids(self):
+        def func(x, y):
+            return np.stack([x, y]).sum(axis=0)
+
+        with patch("graphinglib.data_plotting_2d._FUNCTION_TILE_SIZE", 100):
+            (z,) = _evaluate_on_grid(func, self.x, self.y)
+        self.assertTrue(np.allclose(z, self.x_grid + self.y_grid))
+
+    def test_function_errors_are_not_retried(self):
+        calls = []
+
+        def func(x, y):
+            calls.append((x, y))
+            raise ZeroDivisionError
+
+        with self.assertRaises(ZeroDivisionError):
+            _evaluate_on_grid(func, self.x, self.y)
+        self.assertEqual(len(calls), 1)
+
+    def test_function_returning_another_shape_gets_grids(self):
+        def func(x, y):
+            # Only handles arguments of the same shape.
+            return np.hypot(x, y) if x.shape == y.shape else np.zeros(3)
+
+        (z,) = _evaluate_on_grid(func, self.x, self.y)
+        self.assertTrue(np.array_equal(z, np.hypot(self.x_grid, self.y_grid)))
+        with self.assertRaises(IncompatibleArgumentsError):
+            _evaluate_on_grid(lambda x, y: np.zeros(3), self.x, self.y)
+
+    def test_first_error_raised_when_grids_fail(self):
+        calls = []
+
+        def func(x, y):
+            calls.append((x, y))
+            raise ValueError(f"call {len(calls)}")
+
+        with self.assertRaisesRegex(ValueError, "call 1"):
+            _evaluate_on_grid(func, self.x, self.y)
+        self.assertEqual(len(calls), 2)
+
+    def test_parallel_evaluation(self):
+        with patch("graphinglib.data_plotting_2d._FUNCTION_TILE_SIZE", 500):
+            u, v = _evaluate_on_grid(
+                lambda x, y: (x * y, x - y), self.x, self.y, 2, workers=3
+            )
+        self.assertTrue(np.array_equal(u, self.x_grid * self.y_grid))
+        self.assertTrue(np.array_equal(v, self.x_grid - self.y_grid))
+        with self.assertRaises(InvalidParameterError):
+            _evaluate_on_grid(np.hypot, self.x, self.y, workers=0)
+
+    def test_from_function_meshes_are_views(self):
+        contour = Contour.from_function(
+            lambda x, y: x + y, (0, 1), (0, 2), number_of_points=(30, 20)
+        )
+        self.assertEqual(contour.x_mesh.shape, (20, 30))
+        self.assertTrue(np.array_equal(contour.y_mesh[:, 0], np.linspace(0, 2, 20)))
+        self.assertEqual(contour.x_mesh.strides[0], 0)
+        vector_field = VectorField.from_function(
+            lambda x, y: (x, y), (0, 1), (0, 2), 5, 4
+        )
+        self.assertEqual(vector_field.x_data.shape, (4, 5))
+        self.assertTrue(np.array_equal(vector_field.u_data, vector_field.x_data))
+
+
+class TestScatteredGridder(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.random((200, 2))
+        self.values = np.sin(4 * self.points[:, 0]) * self.points[:, 1]
+        x_grid, y_grid = np.meshgrid(np.linspace(-0.1, 1, 40), np.linspace(0, 1.1, 30))
+        self.grid_points = (x_grid, y_grid)
+
+    def test_matches_griddata(self):
+        for method in ("nearest", "linear", "cubic"):
+            gridder = ScatteredGridder(
+                self.points,
+                (-0.1, 1),
+                (0, 1.1),
+                number_of_points=(40, 30),
+                grid_interpolation=method,
+                fill_value=-1.0,
+            )
+            expected = griddata(
+                self.points,
+                self.values,
+                self.grid_points,
+                method=method,
+                fill_value=-1.0,
+            )
+            self.assertTrue(np.allclose(gridder.grid(self.values), expected))
+
+    def test_reuse_with_new_values(self):
+        gridder = ScatteredGridder(
+            self.points, (0, 1), (0, 1), grid_interpolation="linear"
+        )
+        first = gridder.grid(self.values)
+        second = gridder.grid(2 * self.values)
+        self.assertTrue(np.allclose(second, 2 * first, equal_nan=True))
+        self.assertTrue(np.isnan(first).any())
+        with self.assertRaises(IncompatibleArgumentsError):
+            gridder.grid(self.values[:-1])
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(InvalidParameterError):
+            ScatteredGridder(self.points, (0, 1), (0, 1), grid_interpolation="quintic")
+        with self.assertRaises(InvalidParameterError):
+            ScatteredGridder(self.points.T, (0, 1), (0, 1))
+        with self.assertRaises(PlottingError):
+            ScatteredGridder(
+                [[0, 0], [1, 1], [2, 2]], (0, 1), (0, 1), grid_interpolation="linear"
+            )
+
+    def test_nearest_max_distance(self):
+        gridder = ScatteredGridder(
+            [[0, 0], [1, 1]],
+            (0, 1),
+            (0, 1),
+            number_of_points=(3, 3),
+            max_distance=0.6,
+            workers=-1,
+        )
+        grid = gridder.grid([1.0, 2.0])
+        self.assertEqual(grid[0, 0], 1.0)
+        self.assertEqual(grid[2, 2], 2.0)
+        self.assertEqual(grid[0, 1], 1.0)
+        self.assertTrue(np.isnan(grid[1, 1]))
+        self.assertTrue(np.isnan(grid[0, 2]))
+        with self.assertRaises(InvalidParameterError):
+            ScatteredGridder(self.points, (0, 1), (0, 1), workers=0)
+
+    def test_inverse_distance(self):
+        gridder = ScatteredGridder(
+            [[0, 0], [1, 0], [5, 5]],
+            (0, 1),
+            (0, 0),
+            number_of_points=(3, 1),
+            grid_interpolation="inverse_distance",
+            max_distance=2,
+        )
+        grid = gridder.grid([1.0, 3.0, 100.0])
+        self.assertTrue(np.allclose(grid, [[1.0, 2.0, 3.0]]))
+        constant = ScatteredGridder(
+            self.points, (0, 1), (0, 1), grid_interpolation="inverse_distance"
+        )
+        self.assertTrue(np.allclose(constant.grid(np.full(200, 4.0)), 4.0))
+
+    def test_binned_statistics(self):
+        points = [[0, 0], [0.1, 0.2], [1, 1], [0.9, 0.1], [3, 3]]
+        values = [1.0, 3.0, 5.0, -2.0, 10.0]
+        grids = {
+            statistic: ScatteredGridder(
+                points,
+                (0, 1),
+                (0, 1),
+                number_of_points=(2, 2),
+                grid_interpolation=statistic,
+            ).grid(None if statistic == "count" else values)
+            for statistic in ("mean", "count", "max")
+        }
+        self.assertTrue(np.array_equal(grids["count"], [[2, 1], [0, 1]]))
+        self.assertTrue(
+            np.allclose(grids["mean"], [[2.0, -2.0], [np.nan, 5.0]], equal_nan=True)
+        )
+        self.assertTrue(
+            np.allclose(grids["max"], [[3.0, -2.0], [np.nan, 5.0]], equal_nan=True)
+        )
+        with patch("graphinglib.data_plotting_2d._BINNING_BLOCK_SIZE", 2):
+            gridder = ScatteredGridder(
+                points,
+                (0, 1),
+                (0, 1),
+                number_of_points=(2, 2),
+                grid_interpolation="mean",
+            )
+        self.assertTrue(
+            np.allclose(gridder.grid(values), grids["mean"], equal_nan=True)
+        )
+        with self.assertRaises(InvalidParameterError):
+            gridder.grid()
+        heatmap = Heatmap.from_points(
+            points, None, (0, 1), (0, 1), "count", number_of_points=(2, 2)
+        )
+        self.assertTrue(np.array_equal(heatmap.image, grids["count"]))
+
+    def test_from_points_with_gridder(self):
+        gridder = ScatteredGridder(
+            self.points,
+            (0, 2),
+            (0, 3),
+            number_of_points=(20, 10),
+            grid_interpolation="linear",
+        )
+        heatmap = Heatmap.from_points(gridder, self.values)
+        self.assertEqual(heatmap.image.shape, (10, 20))
+        self.assertEqual(heatmap.x_axis_range, (0, 2))
+        self.assertEqual(heatmap.y_axis_range, (0, 3))
+        with self.assertRaises(InvalidParameterError):
+            Heatmap.from_points(self.points, self.values)
+
+
+class TestDataTypesAndCopies(unittest.TestCase):
+    def setUp(self):
+        self.x = np.linspace(0, 1, 40, dtype=np.float32)
+        self.data = np.outer(self.x, self.x)
+
+    def test_arrays_are_not_copied_by_default(self):
+        heatmap = Heatmap(self.data)
+        contour = Contour(self.data)
+        vector_field = VectorField(self.x, self.x, self.data, self.data)
+        stream = Stream(self.x, self.x, self.data, self.data)
+        for stored in (
+            heatmap.image,
+            contour.z_data,
+            vector_field.u_data,
+            stream.u_data,
+        ):
+            self.assertTrue(np.shares_memory(stored, self.data))
+            self.assertEqual(stored.dtype, np.float32)
+
+    def test_copy_argument(self):
+        heatmap = Heatmap(self.data, copy=True)
+        contour = Contour(self.data, copy=True)
+        vector_field = VectorField(self.x, self.x, self.data, self.data, copy=True)
+        stream = Stream(self.x, self.x, self.data, self.data, copy=True)
+        for stored in (
+            heatmap.image,
+            contour.z_data,
+            vector_field.u_data,
+            stream.u_data,
+        ):
+            self.assertFalse(np.shares_memory(stored, self.data))
+            self.assertEqual(stored.dtype, np.float32)
+            self.assertTrue(np.array_equal(stored, self.data))
+
+    def test_memmap_is_not_copied(self):
+        with tempfile.TemporaryDirectory() as directory:
+            image = np.lib.format.open_memmap(
+                os.path.join(directory, "image.npy"),
+                mode="w+",
+                dtype=np.float32,
+                shape=(30, 20),
+            )
+            heatmap = Heatmap(image)
+            self.assertTrue(np.shares_memory(heatmap.image, image))
+            del heatmap, image
+
+    def test_from_function_dtype(self):
+        def func(x, y):
+            return np.sin(x) * np.cos(y)
+
+        def vector_func(x, y):
+            return np.sin(x) + 0 * y, np.cos(y) + 0 * x
+
+        self.assertEqual(
+            Heatmap.from_function(func, (0, 1), (0, 1), dtype=np.float32).image.dtype,
+            np.float32,
+        )
+        self.assertEqual(
+            Contour.from_function(func, (0, 1), (0, 1), dtype=np.float32).z_data.dtype,
+            np.float32,
+        )
+        vector_field = VectorField.from_function(
+            vector_func, (0, 1), (0, 1), dtype=np.float32
+        )
+        self.assertEqual(vector_field.u_data.dtype, np.float32)
+        stream = Stream.from_function(vector_func, (0, 1), (0, 1), dtype=np.float32)
+        self.assertEqual(stream.v_data.dtype, np.float32)
+        self.assertGreater(len(stream.get_streamlines()), 0)
+        # Values returned in another type are stored with the requested one.
+        heatmap = Heatmap.from_function(
+            lambda x, y: np.ones(np.broadcast(x, y).shape, dtype=np.float64),
+            (0, 1),
+            (0, 1),
+            dtype=np.float32,
+        )
+        self.assertEqual(heatmap.image.dtype, np.float32)
+
+    def test_downsampling_keeps_float32(self):
+        image = np.random.default_rng(0).random((100, 90), dtype=np.float32)
+        for method in ("mean", "max", "min"):
+            self.assertEqual(_block_reduce(image, (3, 4), method).dtype, np.float32)
+
+    def test_gridder_keeps_float32(self):
+        rng = np.random.default_rng(0)
+        points = rng.random((500, 2), dtype=np.float32)
+        values = rng.random(500, dtype=np.float32)
+        for method in ("nearest", "linear", "cubic", "inverse_distance", "mean", "max"):
+            gridder = ScatteredGridder(
+                points, (0, 1), (0, 1), (20, 20), grid_interpolation=method
+            )
+            self.assertEqual(gridder.grid(values).dtype, np.float32, method)
+        self.assertTrue(
+            np.shares_memory(ScatteredGridder(points, (0, 1), (0, 1)).points, points)
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
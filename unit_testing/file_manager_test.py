@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from os import path
 from unittest.mock import MagicMock, patch
@@ -10,6 +11,7 @@ from graphinglib.file_manager import (
     FileLoader,
     FileSaver,
     FileUpdater,
+    _parse_style_file,
     get_color,
     get_colors,
     get_default_style,
@@ -26,6 +28,24 @@ class TestFileLoader(unittest.TestCase):
         expected_path = f"{loader._config_dir}/custom_styles/{filename}.yml"
         self.assertEqual(loader._file_location_customs, expected_path)
 
+    def test_load_gives_independent_copies(self):
+        style = FileLoader("plain").load()
+        style["rc_params"]["lines.linewidth"] = 100
+        self.assertNotEqual(FileLoader("plain").load()["rc_params"], style["rc_params"])
+
+    def test_parse_style_file_follows_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_location = path.join(tmp_dir, "style.yml")
+            with open(file_location, "w") as file:
+                yaml.dump({"a": 1}, file)
+            self.assertEqual(_parse_style_file(file_location), {"a": 1})
+            with patch("graphinglib.file_manager.yaml.safe_load") as mock_load:
+                self.assertEqual(_parse_style_file(file_location), {"a": 1})
+                mock_load.assert_not_called()
+            with open(file_location, "w") as file:
+                yaml.dump({"a": 1, "b": 2}, file)
+            self.assertEqual(_parse_style_file(file_location), {"a": 1, "b": 2})
+
 
 class TestFileSaver(unittest.TestCase):
     def test_path(self):
@@ -1,9 +1,15 @@
 import unittest
 
+import matplotlib.pyplot as plt
 import numpy as np
+from scipy.stats import t as student_t
 
 from graphinglib.data_plotting_1d import Curve, Scatter
-from graphinglib.exceptions import PlottingError
+from graphinglib.exceptions import (
+    IncompatibleArgumentsError,
+    InvalidParameterError,
+    PlottingError,
+)
 from graphinglib.fits import (
     FitFromExponential,
     FitFromFOTF,
@@ -745,5 +751,204 @@ class TestFitFromFOTF(unittest.TestCase):
         self.assertEqual(copy._label, self.fit._label)
 
 
+class TestGeneralFitStatistics(unittest.TestCase):
+    def setUp(self):
+        x = np.linspace(0, 10, 200)
+        noise = np.random.default_rng(0).normal(0, 0.5, x.size)
+        self.data = Scatter(x, 3 * x + 2 + noise, "Data")
+        self.fit = FitFromPolynomial(self.data, 1)
+        self.residuals = self.fit._function(x) - self.data.y_data
+
+    def test_statistics_values(self):
+        rss = np.sum(self.residuals**2)
+        self.assertAlmostEqual(self.fit.get_residual_sum_of_squares(), rss)
+        self.assertAlmostEqual(
+            self.fit.get_residual_standard_deviation(), np.std(self.residuals)
+        )
+        self.assertAlmostEqual(self.fit.get_reduced_chi_squared(), rss / (200 - 2))
+        total_variance = np.sum((self.data.y_data - np.mean(self.data.y_data)) ** 2)
+        self.assertAlmostEqual(self.fit.get_Rsquared(), 1 - rss / total_variance)
+
+    def test_reduced_chi_squared_uses_y_error(self):
+        self.data.add_errorbars(y_error=np.full(200, 0.5))
+        expected = np.sum((self.residuals / 0.5) ** 2) / (200 - 2)
+        self.assertAlmostEqual(self.fit.get_reduced_chi_squared(), expected)
+
+    def test_function_evaluated_once(self):
+        calls = []
+        function = self.fit._function
+
+        def counting_function(x):
+            calls.append(x)
+            return function(x)
+
+        self.fit._function = counting_function
+        self.fit.get_residuals()
+        self.fit.get_Rsquared()
+        self.fit.get_reduced_chi_squared()
+        self.fit.get_residual_standard_deviation()
+        self.assertEqual(len(calls), 1)
+
+    def test_cache_invalidated_when_data_changes(self):
+        self.fit.get_residuals()
+        self.data.y_data = self.data.y_data + 1
+        np.testing.assert_allclose(self.fit.get_residuals(), self.residuals - 1)
+
+    def test_cache_invalidated_when_function_changes(self):
+        self.fit.get_residuals()
+        function = self.fit._function
+        self.fit._function = lambda x: function(x) + 1
+        np.testing.assert_allclose(self.fit.get_residuals(), self.residuals + 1)
+
+    def test_get_residuals_returns_independent_copy(self):
+        residuals = self.fit.get_residuals()
+        residuals += 1
+        np.testing.assert_allclose(self.fit.get_residuals(), self.residuals)
+
+
+class TestGeneralFitRefit(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.x = np.linspace(0, 20, 2000)
+        self.y = 0.5 * self.x**2 - 3 * self.x + 5 + rng.normal(0, 0.1, self.x.size)
+
+    def test_polynomial_refit_with_appended_samples(self):
+        data = Scatter(self.x[:1000], self.y[:1000])
+        fit = FitFromPolynomial(data, 2)
+        for start in range(1000, 2000, 250):
+            fit.refit((self.x[start : start + 250], self.y[start : start + 250]))
+        expected_coeffs, expected_cov = np.polyfit(self.x, self.y, 2, cov=True)
+        np.testing.assert_allclose(fit.coeffs, expected_coeffs[::-1])
+        np.testing.assert_allclose(fit.cov_matrix, np.flip(expected_cov), rtol=1e-5)
+        self.assertEqual(len(data.x_data), 2000)
+        self.assertAlmostEqual(fit.x_data[-1], 20)
+
+    def test_polynomial_refit_with_max_samples(self):
+        data = Scatter(self.x[:1000], self.y[:1000])
+        fit = FitFromPolynomial(data, 2)
+        for start in range(1000, 2000, 250):
+            fit.refit(
+                (self.x[start : start + 250], self.y[start : start + 250]),
+                max_samples=1000,
+            )
+        expected_coeffs = np.polyfit(self.x[1000:], self.y[1000:], 2)
+        np.testing.assert_allclose(fit.coeffs, expected_coeffs[::-1])
+        np.testing.assert_array_equal(data.x_data, self.x[1000:])
+
+    def test_refit_with_new_curve(self):
+        fit = FitFromPolynomial(Scatter(self.x, self.y), 2)
+        fit.refit(Scatter(self.x, 3 * self.x + 2))
+        np.testing.assert_allclose(fit.coeffs, [2, 3, 0], atol=1e-8)
+        self.assertEqual(fit.label, "$f(x) = $$3.0x^1 + 2.0$")
+
+    def test_nonlinear_refit_warm_starts_from_parameters(self):
+        x = np.linspace(0, 10, 500)
+        fit = FitFromSine(
+            Scatter(x, 2 * np.sin(3 * x + 1) + 5), guesses=[2.1, 3.05, 1, 5]
+        )
+        # Starting from the original guesses would not converge in so few iterations.
+        fit._max_iterations = 20
+        x_new = np.linspace(10, 12, 100)
+        fit.refit((x_new, 2 * np.sin(3.001 * x_new + 1) + 5))
+        self.assertAlmostEqual(fit.frequency_rad, 3, places=2)
+        self.assertListEqual(fit._guesses, [2.1, 3.05, 1, 5])
+
+    def test_function_fit_refit_updates_function(self):
+        fit = FitFromFunction(lambda x, a, b: a * x + b, Scatter(self.x, 3 * self.x))
+        fit.refit(Scatter(self.x, 5 * self.x + 2))
+        self.assertAlmostEqual(fit.function(1.0), 7)
+
+    def test_refit_rejects_appending_to_curve_with_errors(self):
+        data = Scatter(self.x, self.y)
+        data.add_errorbars(y_error=np.full(self.x.size, 0.1))
+        fit = FitFromPolynomial(data, 2)
+        with self.assertRaises(IncompatibleArgumentsError):
+            fit.refit(([21.0], [200.0]))
+
+    def test_refit_keeps_all_samples_by_default(self):
+        x = np.linspace(0, 1, 10000)
+        data = Scatter(x, 3 * x + 2)
+        fit = FitFromPolynomial(data, 1)
+        fit.refit((np.linspace(1, 2, 500), 3 * np.linspace(1, 2, 500) + 2))
+        self.assertEqual(len(data.x_data), 10500)
+        self.assertEqual(fit.x_data[0], 0)
+        np.testing.assert_allclose(fit.coeffs, [2, 3], atol=1e-8)
+
+    def test_refit_without_label(self):
+        fit = FitFromPolynomial(Scatter(self.x, self.y), 2)
+        fit.label = None
+        fit.refit(([21.0], [200.0]))
+        self.assertIsNone(fit.label)
+
+    def test_refit_invalid_max_samples(self):
+        fit = FitFromPolynomial(Scatter(self.x, self.y), 2)
+        with self.assertRaises(InvalidParameterError):
+            fit.refit(([21.0], [200.0]), max_samples=0)
+
+
+class TestConfidenceBand(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.x = np.linspace(0, 10, 100)
+        self.data = Scatter(self.x, 3 * self.x + 2 + rng.normal(0, 1, self.x.size))
+        self.fit = FitFromPolynomial(self.data, 1, color="red")
+
+    def test_delta_band_matches_linear_regression(self):
+        band = self.fit.compute_confidence_band(confidence_level=0.9)
+        design = np.vander(self.fit.x_data, 2, increasing=True)
+        standard_error = np.sqrt(
+            np.einsum("ni,ij,nj->n", design, self.fit.cov_matrix, design)
+        )
+        np.testing.assert_allclose(
+            band.upper_data - self.fit.y_data,
+            student_t.ppf(0.95, 98) * standard_error,
+            rtol=1e-5,
+        )
+        np.testing.assert_allclose(
+            band.upper_data - self.fit.y_data, self.fit.y_data - band.lower_data
+        )
+        self.assertEqual(band.confidence_level, 0.9)
+        self.assertEqual(band.color, "red")
+
+    def test_prediction_band_is_wider(self):
+        confidence = self.fit.compute_confidence_band()
+        prediction = self.fit.compute_confidence_band(prediction=True)
+        self.assertTrue(np.all(prediction.upper_data > confidence.upper_data))
+        self.assertTrue(np.all(prediction.lower_data < confidence.lower_data))
+
+    def test_bootstrap_band_is_reproducible(self):
+        band = self.fit.compute_confidence_band(
+            "bootstrap", number_of_resamples=200, seed=3
+        )
+        same_band = self.fit.compute_confidence_band(
+            "bootstrap", number_of_resamples=200, seed=3, workers=2
+        )
+        np.testing.assert_array_equal(band.lower_data, same_band.lower_data)
+        np.testing.assert_array_equal(band.upper_data, same_band.upper_data)
+        delta_band = self.fit.compute_confidence_band()
+        np.testing.assert_allclose(band.upper_data, delta_band.upper_data, rtol=0.05)
+
+    def test_bootstrap_band_with_unpicklable_function(self):
+        fit = FitFromFunction(lambda x, a, b: a * x + b, self.data)
+        band = fit.compute_confidence_band(
+            "bootstrap", number_of_resamples=50, seed=3, workers=2
+        )
+        self.assertTrue(np.all(band.lower_data <= band.upper_data))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(InvalidParameterError):
+            self.fit.compute_confidence_band("jackknife")
+        with self.assertRaises(InvalidParameterError):
+            self.fit.compute_confidence_band(confidence_level=1.5)
+
+    def test_plot_element(self):
+        band = self.fit.compute_confidence_band(label="Band", alpha=0.3)
+        fig, ax = plt.subplots()
+        band._plot_element(ax, 2)
+        self.assertEqual(band.handle.get_label(), "Band")
+        self.assertAlmostEqual(band.handle.get_alpha(), 0.3)
+        plt.close(fig)
+
+
 if __name__ == "__main__":
     unittest.main()
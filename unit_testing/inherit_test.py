@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from copy import copy, deepcopy
 
@@ -24,6 +25,9 @@ class TestInheritSentinel(unittest.TestCase):
         self.assertIs(copy(INHERIT), INHERIT)
         self.assertIs(deepcopy(INHERIT), INHERIT)
 
+    def test_pickle_preserves_identity(self):
+        self.assertIs(pickle.loads(pickle.dumps(INHERIT)), INHERIT)
+
     def test_bool_raises(self):
         # Regression test: INHERIT used to be silently truthy, which made
         # `if self._some_flag:` behave as True for unresolved style parameters
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from matplotlib import use as matplotlib_use
+
+matplotlib_use("Agg")  # Use non-GUI backend for tests
+
+from graphinglib.data_plotting_1d import Curve, Scatter
+from graphinglib.profiling import Profile, _profiled, _stage, profile
+from graphinglib.smart_figure import SmartFigure
+
+
+class TestProfile(unittest.TestCase):
+    def test_stages_are_nested(self):
+        @_profiled("inner")
+        def inner():
+            return "result"
+
+        with profile() as recorded:
+            with _stage("outer", "figure", size=2):
+                self.assertEqual(inner(), "result")
+            with _stage("other"):
+                pass
+        self.assertIsInstance(recorded, Profile)
+        self.assertEqual([stage.name for stage in recorded.stages], ["outer", "other"])
+        outer = recorded.stages[0]
+        self.assertEqual(outer.category, "figure")
+        self.assertEqual(outer.args, {"size": 2})
+        self.assertEqual([stage.name for stage in outer.children], ["inner"])
+        self.assertGreaterEqual(outer.duration, outer.children[0].duration)
+        self.assertIsNone(outer.allocated_bytes)
+
+    def test_stages_are_not_recorded_outside_profile(self):
+        with profile() as recorded:
+            pass
+        with _stage("outside"):
+            pass
+        self.assertListEqual(recorded.stages, [])
+
+    def test_trace_memory(self):
+        was_tracing = tracemalloc.is_tracing()
+        with profile(trace_memory=True) as recorded, _stage("allocation"):
+            data = [object() for _ in range(1000)]
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+        stage = recorded.stages[0]
+        self.assertGreater(stage.allocated_bytes, 0)
+        self.assertGreater(stage.allocated_blocks, 0)
+        del data
+
+    def test_export(self):
+        with (
+            profile() as recorded,
+            _stage("outer", file_name="figure.png"),
+            _stage("Curve", "plottable"),
+        ):
+            pass
+        exported = json.loads(recorded.to_json())
+        outer = exported["stages"][0]
+        self.assertEqual(outer["name"], "outer")
+        self.assertEqual(outer["args"], {"file_name": "figure.png"})
+        self.assertEqual(outer["children"][0]["category"], "plottable")
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "trace.json")
+            recorded.to_chrome_trace(file_name)
+            with open(file_name) as file:
+                events = json.load(file)["traceEvents"]
+        self.assertEqual([event["name"] for event in events], ["outer", "Curve"])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        self.assertEqual(events[0]["args"]["file_name"], "figure.png")
+        self.assertIn("allocated_blocks", events[1]["args"])
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+
+
+class TestProfileSmartFigure(unittest.TestCase):
+    def test_save_stages(self):
+        figure = SmartFigure(
+            1,
+            2,
+            elements=[Curve([0, 1], [0, 1], label="A"), Scatter([0, 1], [1, 0])],
+        )
+        with tempfile.TemporaryDirectory() as directory, profile() as recorded:
+            figure.save(os.path.join(directory, "figure.png"))
+
+        save = recorded.stages[0]
+        self.assertEqual((save.name, save.category), ("save", "figure"))
+        self.assertEqual(
+            [stage.name for stage in save.children], ["initialize figure", "savefig"]
+        )
+        initialize, savefig = save.children
+        names = [stage.name for stage in initialize.children]
+        for name in ("load style", "prepare figure", "constrained layout"):
+            self.assertIn(name, names)
+        prepare = initialize.children[names.index("prepare figure")]
+        plottables = [
+            stage for stage in prepare.children if stage.category == "plottable"
+        ]
+        self.assertEqual(
+            [(stage.name, stage.args) for stage in plottables],
+            [("Curve", {"subplot": 0}), ("Scatter", {"subplot": 1})],
+        )
+        self.assertEqual(plottables[0].children[0].name, "resolve style")
+        self.assertIn("legend", [stage.name for stage in prepare.children])
+        # The figure is drawn once to measure its tight bounding box, then once to be rendered
+        self.assertEqual([stage.name for stage in savefig.children], ["draw", "draw"])
+
+
+if __name__ == "__main__":
+    unittest.main()
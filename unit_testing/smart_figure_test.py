@@ -1,6 +1,9 @@
 import os
+import shutil
+import tempfile
 import unittest
 import warnings
+from unittest.mock import patch
 
 from graphinglib import INHERIT
 
@@ -10,6 +13,8 @@ matplotlib_use("Agg")  # Use non-GUI backend for tests
 
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from matplotlib.image import imread
 from numpy import linspace, pi, sin
 
 try:
@@ -22,14 +27,35 @@ except ImportError:
     WCS = None
     u = None
 
+try:
+    import pypdfium2 as pdfium
+
+    HAS_PYPDFIUM2 = True
+except ImportError:
+    HAS_PYPDFIUM2 = False
+
 from graphinglib.data_plotting_1d import Curve
+from graphinglib.data_plotting_2d import Heatmap
 from graphinglib.file_manager import FileLoader
-from graphinglib.exceptions import GraphingException
+from graphinglib.exceptions import (
+    GraphingException,
+    IncompatibleArgumentsError,
+    InvalidOperationError,
+    InvalidParameterError,
+    MissingOptionalDependencyError,
+)
 from graphinglib.graph_elements import (
     Plottable,
     Text,
 )
-from graphinglib.smart_figure import SmartFigure, SmartFigureWCS, SmartTwinAxis
+from graphinglib.smart_figure import (
+    SmartFigure,
+    SmartFigureWCS,
+    SmartTwinAxis,
+    _ChildGrid,
+    _layered_params,
+    _rc_overrides,
+)
 
 
 class DummyPlottable(Plottable):
@@ -644,6 +670,34 @@ class TestSmartFigureContainer(SmartFigurePropertyMixin):
         self.assertEqual(fig3.title, "Container")
         self.assertEqual(len(fig3), 2)
 
+    def test_copy_with_elements_does_not_copy_replaced_elements(self):
+        class UncopyablePlottable(DummyPlottable):
+            def __deepcopy__(self, memo):
+                raise AssertionError("replaced elements should not be copied")
+
+        self.fig[0, 0] = UncopyablePlottable("a")
+        self.fig[1, 1:] = UncopyablePlottable("span")
+        replacement = DummyPlottable("b")
+        fig2 = self.fig.copy_with(elements=replacement)
+        self.assertIs(fig2.elements[0], replacement)
+        self.assertEqual(len(self.fig), 2)
+
+    def test_children_follow_grid_order_after_changes(self):
+        self.fig[1, 2] = DummyPlottable("c")
+        self.fig[0, 1:] = DummyPlottable("b")
+        self.fig[1, 0] = DummyPlottable("d")
+        self.fig[0, 0] = DummyPlottable("a")
+        self.assertListEqual(
+            [child.elements[0].label for _, child in self.fig._iter_child_items()],
+            ["a", "b", "d", "c"],
+        )
+        self.fig[0, 1] = None
+        self.fig[1, 1] = DummyPlottable("e")
+        self.assertListEqual(
+            [child.elements[0].label for _, child in self.fig._iter_child_items()],
+            ["a", "d", "e", "c"],
+        )
+
 
 class TestSmartFigureContainerRendering(unittest.TestCase):
     def setUp(self):
@@ -812,6 +866,285 @@ class TestSmartFigureContainerRendering(unittest.TestCase):
         )
         plt.close(parent._figure)
 
+    def test_save_draws_the_figure_once(self):
+        for share_x in (False, True):
+            fig = SmartFigure(
+                3,
+                2,
+                elements=[self.curve_a, self.curve_b, self.curve_c] * 2,
+                share_x=share_x,
+            )
+            with (
+                tempfile.TemporaryDirectory() as directory,
+                patch.object(
+                    Figure, "draw", autospec=True, side_effect=Figure.draw
+                ) as draw,
+            ):
+                fig.save(os.path.join(directory, "figure.png"))
+            # The tight bounding box is measured with a drawing-disabled renderer, followed by the actual drawing
+            self.assertEqual(draw.call_count, 2)
+
+    def test_shared_x_spines_are_aligned(self):
+        wide_labels = Curve([0, 1], [0, 100000])
+        nested = SmartFigure(2, 1, elements=[self.curve_a, wide_labels], share_x=True)
+        fig = SmartFigure(2, 2, share_x=True, reference_labels=False)
+        fig[0, 0] = self.curve_b
+        fig[1, 0] = wide_labels
+        fig[:, 1] = nested
+        fig._initialize_parent_smart_figure()
+        try:
+            # The children are in grid order, which puts the nested figure between the two subplots of the first column
+            subfigs = fig._figure.subfigs
+            for column in ((subfigs[0], subfigs[2]), subfigs[1].subfigs):
+                positions = [
+                    ax.get_position().bounds
+                    for subfig in column
+                    for ax in subfig.get_axes()
+                    if ax.get_navigate()
+                ]
+                self.assertEqual(len(positions), 2)
+                self.assertAlmostEqual(positions[0][0], positions[1][0])
+                self.assertAlmostEqual(positions[0][2], positions[1][2])
+        finally:
+            plt.close(fig._figure)
+
+    def test_split_save_to_separate_files(self):
+        fig = SmartFigure(1, 3, elements=[self.curve_a, self.curve_b, self.curve_c])
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fig.save(
+                os.path.join(tmp_dir, "page_{}.png"),
+                split_pdf=True,
+                progress=lambda *args: progress.append(args),
+            )
+            self.assertEqual(
+                sorted(os.listdir(tmp_dir)), ["page_0.png", "page_1.png", "page_2.png"]
+            )
+        self.assertEqual([args[:2] for args in progress], [(0, 3), (1, 3), (2, 3)])
+
+    @unittest.skipUnless(HAS_PYPDFIUM2, "pypdfium2 is required to merge the pages")
+    def test_split_save_in_parallel(self):
+        nested = SmartFigure(1, 2, elements=[self.curve_a, self.curve_b])
+        fig = SmartFigure(1, 3, elements=[self.curve_a, nested, self.curve_c])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            serial_path = os.path.join(tmp_dir, "serial.pdf")
+            parallel_path = os.path.join(tmp_dir, "parallel.pdf")
+            fig.save(serial_path, split_pdf=True)
+            fig.save(parallel_path, split_pdf=True, workers=2)
+            serial = pdfium.PdfDocument(serial_path)
+            parallel = pdfium.PdfDocument(parallel_path)
+            self.assertEqual(len(parallel), 3)
+            for serial_page, parallel_page in zip(serial, parallel):
+                self.assertTrue(
+                    (
+                        serial_page.render().to_numpy()
+                        == parallel_page.render().to_numpy()
+                    ).all()
+                )
+            serial.close()
+            parallel.close()
+
+    def test_split_save_workers_validation(self):
+        fig = SmartFigure(1, 2, elements=[self.curve_a, self.curve_b])
+        with self.assertRaises(InvalidParameterError):
+            fig.save("unused.pdf", split_pdf=True, workers=0)
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            PdfPages(os.path.join(tmp_dir, "figure.pdf")) as pdf,
+            self.assertRaises(IncompatibleArgumentsError),
+        ):
+            fig.save(pdf, split_pdf=True, workers=2)
+
+    def test_retained_figure_is_reused_with_new_data(self):
+        fig = SmartFigure(1, 2, elements=[self.curve_a, self.curve_b])
+        fig.retain_figure = True
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fig.save(os.path.join(tmp_dir, "first.png"))
+            retained = fig._retained_figure.figure
+            axes = retained.get_axes()
+            fig.elements = [self.curve_c, self.curve_a]
+            fig.save(os.path.join(tmp_dir, "second.png"))
+        self.assertIs(fig._retained_figure.figure, retained)
+        self.assertEqual(retained.get_axes(), axes)
+        lines = [ax.get_lines() for ax in axes if ax.get_navigate()]
+        self.assertEqual([len(ax_lines) for ax_lines in lines], [1, 1])
+        self.assertEqual(list(lines[0][0].get_ydata()), [0.5, 0.5])
+        # The figure is kept by the SmartFigure only
+        self.assertNotIn(retained.number, plt.get_fignums())
+        self.assertIsNone(fig.copy()._retained_figure)
+        fig.retain_figure = False
+        self.assertIsNone(fig._retained_figure)
+
+    def test_retained_figure_matches_new_figure(self):
+        x = linspace(1, 10, 50)
+        twin_axis = SmartTwinAxis(label="Twin", invert_axis=True)
+
+        def make_elements(frequency):
+            twin_axis.elements = [Curve(x, sin(frequency * x) + 2, label="Twin")]
+            nested = SmartFigure(
+                2,
+                1,
+                share_x=True,
+                log_scale_y=True,
+                elements=[Curve(x, frequency * x), Curve(x, x**frequency)],
+            )
+            return [
+                Curve(x, sin(frequency * x), label="Main"),
+                nested,
+                Heatmap([[frequency, 2], [3, 4]]),
+            ]
+
+        fig = SmartFigure(1, 3, twin_y_axis=twin_axis, elements=make_elements(1))
+        fig.retain_figure = True
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fig.save(os.path.join(tmp_dir, "first.png"))
+            retained = fig._retained_figure
+            retained_path = os.path.join(tmp_dir, "retained.png")
+            new_path = os.path.join(tmp_dir, "new.png")
+            for _ in range(2):
+                fig.elements = make_elements(3)
+                fig.save(retained_path)
+            SmartFigure(1, 3, twin_y_axis=twin_axis, elements=make_elements(3)).save(
+                new_path
+            )
+            self.assertIs(fig._retained_figure, retained)
+            self.assertTrue((imread(retained_path) == imread(new_path)).all())
+
+    def test_retained_figure_follows_layout_changes(self):
+        fig = SmartFigure(elements=[self.curve_a])
+        fig.retain_figure = True
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fig.save(os.path.join(tmp_dir, "first.png"))
+            retained = fig._retained_figure
+            fig.log_scale_x = True
+            fig.save(os.path.join(tmp_dir, "second.png"))
+            self.assertIsNot(fig._retained_figure, retained)
+            self.assertEqual(fig._retained_figure.figure.axes[0].get_xscale(), "log")
+            # Figures holding lambda functions cannot be compared between saves
+            fig.set_ticks(x_tick_labels=lambda tick: f"{tick:.1f}", x_tick_spacing=0.5)
+            fig.save(os.path.join(tmp_dir, "third.png"))
+            self.assertIsNone(fig._retained_figure)
+        with self.assertRaises(GraphingException):
+            fig.retain_figure = 1
+
+    def test_retained_figure_follows_style_changes(self):
+        fig = SmartFigure(1, 2, elements=[self.curve_a, Heatmap([[1, 2], [3, 4]])])
+        fig.figure_style = "plain"
+        fig.retain_figure = True
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fig.save(os.path.join(tmp_dir, "first.png"))
+            retained = fig._retained_figure
+            positions = sorted(ax.get_position().bounds for ax in retained.figure.axes)
+            fig.save(os.path.join(tmp_dir, "second.png"))
+            self.assertIs(fig._retained_figure, retained)
+            # The colorbar of the heatmap is replaced rather than added next to the previous one
+            self.assertEqual(
+                sorted(ax.get_position().bounds for ax in retained.figure.axes),
+                positions,
+            )
+            fig.figure_style = "dark"
+            fig.save(os.path.join(tmp_dir, "third.png"))
+            self.assertIsNot(fig._retained_figure, retained)
+
+    def test_nested_rc_params_are_scoped(self):
+        class RcRecorder(DummyPlottable):
+            def _plot_element(self, ax, z_order, cycle_color=None):
+                super()._plot_element(ax, z_order, cycle_color)
+                self.line_width = plt.rcParams["lines.linewidth"]
+                self.line_style = plt.rcParams["lines.linestyle"]
+
+        inner_element, outer_element = RcRecorder(), RcRecorder()
+        inner = SmartFigure(elements=[inner_element])
+        inner.set_rc_params({"lines.linewidth": 7})
+        middle = SmartFigure(1, 2, elements=[inner, outer_element])
+        middle.set_rc_params({"lines.linestyle": "--"})
+        fig = SmartFigure(elements=[middle], figure_style="plain")
+        fig.set_rc_params({"lines.linewidth": 3})
+        fig._initialize_parent_smart_figure()
+        self.assertEqual(
+            (inner_element.line_width, inner_element.line_style), (7, "--")
+        )
+        self.assertEqual(
+            (outer_element.line_width, outer_element.line_style), (3, "--")
+        )
+        self.assertEqual(plt.rcParams["lines.linewidth"], 3)
+        self.assertEqual(plt.rcParams["lines.linestyle"], "-")
+        # The nested SmartFigures' parameters were reset after being layered over their parent's
+        self.assertEqual(middle._default_params, {})
+        self.assertEqual(inner._default_params, {})
+        plt.close(fig._figure)
+        plt.rcParams.update(plt.rcParamsDefault)
+
+
+class TestLayeredParams(unittest.TestCase):
+    def test_layered_params(self):
+        parent = {"rc_params": {"lines.linewidth": 1, "font.size": 10}, "Curve": {}}
+        child = _layered_params(parent, {"lines.linewidth": 2})
+        self.assertEqual(child["rc_params"]["lines.linewidth"], 2)
+        self.assertEqual(child["rc_params"]["font.size"], 10)
+        self.assertIs(child["Curve"], parent["Curve"])
+        child["Scatter"] = {}
+        child["rc_params"]["font.size"] = 12
+        self.assertEqual(
+            parent, {"rc_params": {"lines.linewidth": 1, "font.size": 10}, "Curve": {}}
+        )
+
+    def test_rc_overrides(self):
+        with plt.rc_context({"lines.linewidth": 1, "font.size": 10}):
+            with (
+                self.assertRaises(RuntimeError),
+                _rc_overrides({"lines.linewidth": 5}),
+            ):
+                self.assertEqual(plt.rcParams["lines.linewidth"], 5)
+                plt.rcParams["font.size"] = 20
+                raise RuntimeError
+            self.assertEqual(plt.rcParams["lines.linewidth"], 1)
+            # Parameters which were not overridden are left as they are
+            self.assertEqual(plt.rcParams["font.size"], 20)
+
+
+class TestChildGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = _ChildGrid()
+        self.top = SmartFigure()
+        self.bottom = SmartFigure()
+        self.grid[slice(0, 1), slice(0, 3)] = self.top
+        self.grid[slice(1, 2), slice(1, 2)] = self.bottom
+
+    def test_iterates_in_grid_order(self):
+        left = SmartFigure()
+        self.grid[slice(1, 2), slice(0, 1)] = left
+        self.assertListEqual(list(self.grid.values()), [self.top, left, self.bottom])
+        self.assertEqual(self.grid.index((slice(1, 2), slice(1, 2))), 2)
+        del self.grid[slice(1, 2), slice(0, 1)]
+        self.assertEqual(self.grid.index((slice(1, 2), slice(1, 2))), 1)
+
+    def test_overlapping(self):
+        overlapping = self.grid.overlapping((slice(0, 2), slice(1, 3)))
+        self.assertListEqual(
+            overlapping,
+            [
+                ((slice(0, 1), slice(0, 3)), self.top),
+                ((slice(1, 2), slice(1, 2)), self.bottom),
+            ],
+        )
+        self.assertListEqual(self.grid.overlapping((slice(1, 2), slice(2, 3))), [])
+
+    def test_overlapping_span_raises(self):
+        with self.assertRaises(GraphingException):
+            self.grid[slice(0, 2), slice(2, 3)] = SmartFigure()
+        self.assertEqual(len(self.grid), 2)
+        self.assertListEqual(self.grid.overlapping((slice(1, 2), slice(2, 3))), [])
+
+    def test_replacing_child_keeps_span(self):
+        replacement = SmartFigure()
+        self.grid[slice(0, 1), slice(0, 3)] = replacement
+        self.assertIs(self.grid[slice(0, 1), slice(0, 3)], replacement)
+        self.assertListEqual(
+            self.grid.overlapping((slice(0, 1), slice(2, 3))),
+            [((slice(0, 1), slice(0, 3)), replacement)],
+        )
+
 
 @unittest.skipUnless(
     HAS_ASTROPY,
@@ -1257,5 +1590,89 @@ class TestSmartTwinAxis(unittest.TestCase):
         self.assertFalse(self.twin_axis._hide_spine)
 
 
+class TestSmartFigureAnimation(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        x = linspace(0, 6, 40)
+        self.frames = [sin(x[None, :] + phase) * sin(x[:, None]) for phase in (0, 1, 2)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _heatmap(self, image):
+        return Heatmap(image, color_map_range=(-1, 1))
+
+    def test_save_image_sequence(self):
+        fig = SmartFigure(elements=[self._heatmap(self.frames[0])])
+        pattern = os.path.join(self.directory, "frame_{:02d}.png")
+        self.assertIs(fig.save_animation(pattern, iter(self.frames)), fig)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            ["frame_00.png", "frame_01.png", "frame_02.png"],
+        )
+        self.assertIsNone(fig._figure)
+        # Blitted frames are identical to a figure drawn from scratch with the same image
+        single_pattern = os.path.join(self.directory, "single_{:d}.png")
+        SmartFigure(elements=[self._heatmap(self.frames[2])]).save_animation(
+            single_pattern, [self.frames[2]]
+        )
+        self.assertTrue(
+            (
+                plt.imread(pattern.format(2)) == plt.imread(single_pattern.format(0))
+            ).all()
+        )
+        self.assertFalse(
+            (plt.imread(pattern.format(0)) == plt.imread(pattern.format(2))).all()
+        )
+
+    def test_save_multiple_heatmaps(self):
+        heatmap_a = self._heatmap(self.frames[0])
+        heatmap_b = self._heatmap(self.frames[0])
+        fig = SmartFigure(1, 2, elements=[heatmap_a, heatmap_b])
+        pattern = os.path.join(self.directory, "{}.png")
+        fig.save_animation(pattern, zip(self.frames, reversed(self.frames)))
+        self.assertEqual(len(os.listdir(self.directory)), 3)
+        self.assertTrue((heatmap_b.handle.get_array() == self.frames[0]).all())
+        with self.assertRaises(IncompatibleArgumentsError):
+            fig.save_animation(pattern, [self.frames[0]], heatmaps=heatmap_a.copy())
+        with self.assertRaises(IncompatibleArgumentsError):
+            fig.save_animation(pattern, [[self.frames[0]]])
+
+    def test_save_animation_errors(self):
+        pattern = os.path.join(self.directory, "{}.png")
+        with self.assertRaises(InvalidOperationError):
+            SmartFigure(elements=[Curve([0, 1], [0, 1])]).save_animation(
+                pattern, self.frames
+            )
+        fig = SmartFigure(elements=[self._heatmap(self.frames[0])])
+        with self.assertRaises(InvalidParameterError):
+            fig.save_animation(pattern, self.frames, fps=0)
+        with self.assertRaises(InvalidParameterError):
+            fig.save_animation(pattern, [])
+        with (
+            plt.rc_context({"animation.ffmpeg_path": "not-an-ffmpeg-executable"}),
+            self.assertRaises(MissingOptionalDependencyError),
+        ):
+            fig.save_animation(os.path.join(self.directory, "a.mp4"), self.frames)
+
+    @unittest.skipIf(os.name == "nt", "The fake encoder is a shell script")
+    def test_save_video_through_pipe(self):
+        # A fake encoder which copies the raw frames it receives to the output file
+        encoder = os.path.join(self.directory, "fake_ffmpeg")
+        with open(encoder, "w") as file:
+            file.write('#!/bin/sh\nfor last; do :; done\ncat > "$last"\n')
+        os.chmod(encoder, 0o755)
+        video = os.path.join(self.directory, "animation.mp4")
+        fig = SmartFigure(elements=[self._heatmap(self.frames[0])])
+        with plt.rc_context({"animation.ffmpeg_path": encoder}):
+            fig.save_animation(video, self.frames, fps=24, dpi=50)
+        pattern = os.path.join(self.directory, "{}.png")
+        fig.save_animation(pattern, self.frames[:1], dpi=50)
+        height, width = plt.imread(pattern.format(0)).shape[:2]
+        self.assertEqual(
+            os.path.getsize(video), 3 * (height // 2 * 2) * (width // 2 * 2) * 4
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+from copy import deepcopy
+
+import numpy as np
 
 try:
     from typing import Self
@@ -8,6 +11,7 @@ except ImportError:
 from graphinglib.tools import (
     MathematicalObject,
     _copy_with_overrides,
+    _share_data_arrays,
     get_contrasting_shade,
 )
 
@@ -156,6 +160,60 @@ class TestCopyWithOverrides(unittest.TestCase):
         ):
             _copy_with_overrides(obj, copy="not allowed")
 
+    def test_copy_with_leaves_out_attributes_set_by_properties(self):
+        class Dummy:
+            _attributes_set_by_properties = {"items": ("_items",)}
+
+            def __init__(self):
+                self._items = [object()]
+
+            @property
+            def items(self):
+                return self._items
+
+            @items.setter
+            def items(self, items):
+                self._items = list(items)
+
+        obj = Dummy()
+        copied = _copy_with_overrides(obj, items=[1])
+        self.assertEqual(copied.items, [1])
+        self.assertEqual(len(obj.items), 1)
+
+
+class TestShareDataArrays(unittest.TestCase):
+    def test_share_data_arrays(self):
+        class Dummy:
+            def __init__(self):
+                self.data = np.arange(5.0)
+                self.cache = (1, [np.arange(3)])
+                self.objects = np.array([[1]], dtype=object)
+
+            def __deepcopy__(self, memo):
+                result = Dummy.__new__(Dummy)
+                memo[id(self)] = result
+                _share_data_arrays(self, memo)
+                result.__dict__ = deepcopy(self.__dict__, memo)
+                return result
+
+        source = np.arange(5.0)
+        obj = Dummy()
+        obj.data = source
+        copied = deepcopy(obj)
+
+        self.assertIs(obj.data, source)
+        self.assertTrue(np.shares_memory(copied.data, source))
+        self.assertFalse(copied.data.flags.writeable)
+        self.assertTrue(source.flags.writeable)
+        with self.assertRaises(ValueError):
+            copied.data[0] = 1
+
+        self.assertTrue(np.shares_memory(copied.cache[1][0], obj.cache[1][0]))
+        self.assertFalse(copied.cache[1][0].flags.writeable)
+        self.assertTrue(obj.cache[1][0].flags.writeable)
+
+        self.assertIsNot(copied.objects, obj.objects)
+
 
 if __name__ == "__main__":
     unittest.main()